@@ -23,13 +23,17 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import atexit
 import difflib
+import errno
+import functools
 import getpass
-import gzip
 import html
+import itertools
 import json
 import os
 import re
+import select
 import shlex
 import shutil
 import signal
@@ -37,15 +41,15 @@ import subprocess
 import sys
 import tempfile
 import time
-import urllib.error
-import urllib.parse
-import urllib.request
+import uuid
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
-from threading import Lock
-from typing import IO, Callable, Iterable, Optional
+from threading import Lock, Thread, local
+from typing import IO, Callable, Iterable, Iterator, Optional
 
 from archive_helper_core.schedule_csv import (
+    ScheduleRow,
     ScheduleV2Row,
     csv_disc_prompt_for_row,
     csv_next_up_note,
@@ -53,7 +57,81 @@ from archive_helper_core.schedule_csv import (
 )
 
 
-def tmdb_search(*, api_key: str, query: str, year: str = "", media_type: str = "movie", limit: int = 8) -> list[dict[str, str]]:
+_TMDB_HOST = "api.themoviedb.org"
+_TMDB_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+    "User-Agent": "ArchiveHelper/1.0",
+}
+_tmdb_conn_local = local()
+
+
+def _tmdb_get(path: str, params: dict[str, str]) -> tuple[int, bytes]:
+    """GET a TMDB API path and return `(status, body)`.
+
+    Each thread keeps one HTTPS connection open, so repeated lookups skip the
+    TCP/TLS handshake. Bodies are requested gzip-compressed. When an HTTPS
+    proxy is configured, this goes through urllib so the proxy is honoured.
+    Network failures raise `OSError` or `http.client.HTTPException`.
+    """
+
+    # Imported here: the HTTP stack is slow to import and only TMDB needs it.
+    import gzip
+    import http.client
+    import urllib.error
+    import urllib.parse
+    import urllib.request
+
+    target = f"{path}?{urllib.parse.urlencode(params)}"
+
+    if urllib.request.getproxies().get("https"):
+        req = urllib.request.Request(f"https://{_TMDB_HOST}{target}", headers=_TMDB_HEADERS, method="GET")
+        try:
+            with urllib.request.urlopen(req, timeout=15) as resp:
+                status, encoding, body = resp.status, resp.headers.get("Content-Encoding", ""), resp.read()
+        except urllib.error.HTTPError as e:
+            status, encoding, body = e.code, e.headers.get("Content-Encoding", ""), (e.read() or b"")
+    else:
+        while True:
+            conn = getattr(_tmdb_conn_local, "conn", None)
+            reused = conn is not None
+            if conn is None:
+                conn = http.client.HTTPSConnection(_TMDB_HOST, timeout=15)
+                _tmdb_conn_local.conn = conn
+            try:
+                conn.request("GET", target, headers=_TMDB_HEADERS)
+                resp = conn.getresponse()
+                status, encoding, body = resp.status, resp.getheader("Content-Encoding", ""), resp.read()
+                break
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                _tmdb_conn_local.conn = None
+                # The server may have closed an idle keep-alive connection;
+                # retry once on a fresh one. A fresh one failing (a timeout,
+                # say) is a real error, so do not wait for it twice.
+                if not reused:
+                    raise
+
+    if (encoding or "").strip().lower() == "gzip":
+        body = gzip.decompress(body)
+    return status, body
+
+
+def tmdb_search(
+    *,
+    api_key: str,
+    query: str,
+    year: str = "",
+    media_type: str = "movie",
+    limit: int = 8,
+    refresh: bool = False,
+) -> list[dict[str, str]]:
+    """Search TMDB and return simplified matches.
+
+    Answers are cached on disk (see `_tmdb_search_store`); `refresh=True`
+    skips the cached answer and stores a fresh one.
+    """
+
     api_key_s = (api_key or "").strip()
     query_s = (query or "").strip()
     if not api_key_s:
@@ -77,33 +155,31 @@ def tmdb_search(*, api_key: str, query: str, year: str = "", media_type: str = "
         "page": "1",
     }
     year_s = (year or "").strip()
-    if year_s and re.fullmatch(r"\d{4}", year_s) and mt != "multi":
+    if year_s and _YEAR4_RE.fullmatch(year_s) and mt != "multi":
         if mt == "movie":
             params["year"] = year_s
         else:
             params["first_air_date_year"] = year_s
 
-    url = f"https://api.themoviedb.org/3/search/{mt}?" + urllib.parse.urlencode(params)
+    # The API key is left out of the cache key so it never lands on disk.
+    cache_key = "|".join((mt, query_s.lower(), params.get("year") or params.get("first_air_date_year") or "", str(lim)))
+    store = _tmdb_search_store()
+    if not refresh:
+        hit, cached = store.get(cache_key, ttl_s=TMDB_SEARCH_CACHE_TTL_S.get(mt))
+        if hit and isinstance(cached, list):
+            return cached
 
-    req = urllib.request.Request(
-        url,
-        headers={
-            "Accept": "application/json",
-            "User-Agent": "ArchiveHelper/1.0",
-        },
-        method="GET",
-    )
+    import http.client
 
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            payload = resp.read().decode("utf-8", errors="replace")
-    except urllib.error.HTTPError as e:
-        body = (e.read() or b"").decode("utf-8", errors="replace").strip()
-        if e.code == 401:
-            raise RuntimeError("TMDB rejected the API key (HTTP 401).")
-        raise RuntimeError(f"TMDB search failed (HTTP {e.code}). {body}")
-    except urllib.error.URLError as e:
+        status, raw = _tmdb_get(f"/3/search/{mt}", params)
+    except (OSError, http.client.HTTPException) as e:
         raise RuntimeError(f"TMDB network error: {e}")
+    payload = raw.decode("utf-8", errors="replace")
+    if status == 401:
+        raise RuntimeError("TMDB rejected the API key (HTTP 401).")
+    if status != 200:
+        raise RuntimeError(f"TMDB search failed (HTTP {status}). {payload.strip()}")
 
     try:
         data = json.loads(payload)
@@ -141,6 +217,10 @@ def tmdb_search(*, api_key: str, query: str, year: str = "", media_type: str = "
             }
         )
 
+    # Only real hits are stored; a title TMDB has not indexed yet is asked
+    # again next time, like the runtime cache.
+    if results:
+        store.put(cache_key, results)
     return results
 
 
@@ -164,7 +244,7 @@ def tmdb_movie_runtime_minutes(*, api_key: str, title: str, year: str = "") -> O
 
     def _add_year(y: str) -> None:
         yy = (y or "").strip()
-        if not re.fullmatch(r"\d{4}", yy):
+        if not _YEAR4_RE.fullmatch(yy):
             return
         if yy in seen_years:
             return
@@ -197,19 +277,11 @@ def tmdb_movie_runtime_minutes(*, api_key: str, title: str, year: str = "") -> O
     ranked_ids = [tmdb_id for tmdb_id, _ in sorted(ranked_candidates.items(), key=lambda item: item[1][0], reverse=True)]
 
     for tmdb_id in ranked_ids[:10]:
-        url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?" + urllib.parse.urlencode({"api_key": api_key_s})
-        req = urllib.request.Request(
-            url,
-            headers={
-                "Accept": "application/json",
-                "User-Agent": "ArchiveHelper/1.0",
-            },
-            method="GET",
-        )
         try:
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                payload = resp.read().decode("utf-8", errors="replace")
-            data = json.loads(payload)
+            status, raw = _tmdb_get(f"/3/movie/{tmdb_id}", {"api_key": api_key_s})
+            if status != 200:
+                continue
+            data = json.loads(raw.decode("utf-8", errors="replace"))
         except Exception:
             continue
 
@@ -224,6 +296,98 @@ def tmdb_movie_runtime_minutes(*, api_key: str, title: str, year: str = "") -> O
     return None
 
 
+# ----------------------------
+# Persistent caches
+# ----------------------------
+
+
+TMDB_RUNTIME_CACHE_TTL_S = 7 * 24 * 60 * 60  # 7 days
+# Movie matches rarely change; TV listings pick up new seasons more often.
+TMDB_SEARCH_CACHE_TTL_S = {"movie": 7 * 24 * 60 * 60, "tv": 24 * 60 * 60, "multi": 24 * 60 * 60}
+
+
+def _app_cache_dir(home: Path) -> Path:
+    return home / ".archive_helper_for_jellyfin" / "cache"
+
+
+class JsonFileCache:
+    """Small key/value cache stored as one JSON file, with a time-to-live.
+
+    Why it exists: some lookups (like TMDB runtimes) are slow network calls
+    whose answers rarely change. Keeping them on disk means a restarted run
+    does not pay for the same lookups again.
+
+    Example: the first run looks up "Alien (1979)" and stores 117 minutes.
+    A rerun the next day reads 117 from the file instead of calling TMDB.
+
+    Entries older than `ttl_s` seconds count as missing. Every failure here
+    (unreadable file, bad JSON, read-only disk) just behaves like a cache miss.
+    """
+
+    def __init__(self, path: Path, *, ttl_s: int) -> None:
+        self._path = path
+        self._ttl_s = int(ttl_s)
+        self._lock = Lock()
+        self._entries: Optional[dict[str, dict]] = None
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            try:
+                data = json.loads(self._path.read_text(encoding="utf-8"))
+            except Exception:
+                data = {}
+            self._entries = data if isinstance(data, dict) else {}
+        return self._entries
+
+    def _is_fresh(self, entry: object, ttl_s: int) -> bool:
+        if not isinstance(entry, dict):
+            return False
+        try:
+            return (time.time() - float(entry.get("at", 0))) < ttl_s
+        except Exception:
+            return False
+
+    def get(self, key: str, *, ttl_s: Optional[int] = None) -> tuple[bool, object]:
+        """Return `(hit, value)`; `ttl_s` can shorten the TTL for this lookup."""
+
+        with self._lock:
+            entry = self._load().get(key)
+        if not self._is_fresh(entry, self._ttl_s if ttl_s is None else min(int(ttl_s), self._ttl_s)):
+            return False, None
+        return True, entry.get("value")  # type: ignore[union-attr]
+
+    def put(self, key: str, value: object) -> None:
+        with self._lock:
+            # Drop expired entries so the file does not grow without bound.
+            entries = {k: v for k, v in self._load().items() if self._is_fresh(v, self._ttl_s)}
+            entries[key] = {"at": int(time.time()), "value": value}
+            self._entries = entries
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+                tmp.write_text(json.dumps(entries) + "\n", encoding="utf-8")
+                tmp.replace(self._path)
+            except Exception:
+                pass
+
+
+_tmdb_search_cache: Optional[JsonFileCache] = None
+_tmdb_search_cache_lock = Lock()
+
+
+def _tmdb_search_store() -> JsonFileCache:
+    """Shared on-disk cache for `tmdb_search` answers."""
+
+    global _tmdb_search_cache
+    with _tmdb_search_cache_lock:
+        if _tmdb_search_cache is None:
+            _tmdb_search_cache = JsonFileCache(
+                _app_cache_dir(Path.home()) / "tmdb_search.json",
+                ttl_s=max(TMDB_SEARCH_CACHE_TTL_S.values()),
+            )
+        return _tmdb_search_cache
+
+
 def _is_benign_handbrake_scan_line(line: str) -> bool:
     """Return True for HandBrake scan/probe lines that are expected for MKV input."""
 
@@ -255,20 +419,65 @@ def _is_benign_handbrake_scan_line(line: str) -> bool:
 
 
 def _cmd_stdout(argv: list[str], *, timeout_s: int = 8) -> str:
+    """Return a probe command's stripped stdout, or "" on any failure or timeout.
+
+    Probes like `makemkvcon info` can print megabytes, so the pipe is read
+    through a large buffer in a few big reads instead of many small ones.
+    """
+
+    try:
+        proc = subprocess.Popen(
+            argv,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 17,
+        )
+    except Exception:
+        return ""
     try:
-        cp = run_cmd(argv, check=False, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=timeout_s)
-        return (cp.stdout or "").strip()
+        out, _err = proc.communicate(timeout=timeout_s)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        return ""
     except Exception:
+        proc.kill()
         return ""
+    return (out or b"").decode("utf-8", errors="replace").strip()
+
+
+# Title/hint cleanup patterns. These run over every disc label and CINFO line.
+_YEAR_RE = re.compile(r"\b(19\d{2}|20\d{2})\b")
+_YEAR4_RE = re.compile(r"\d{4}")
+_DIGITS_RE = re.compile(r"\d+")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_NON_ALNUM_LOWER_RUN_RE = re.compile(r"[^a-z0-9]+")
+_BRACKETED_RE = re.compile(r"[\[\(\{].*?[\]\)\}]")
+_TMDB_QUERY_NOISE_RE = re.compile(
+    r"\b(?:1080p|2160p|720p|480p|x264|x265|h264|h265|hevc|hdr10?\+?|uhd|web[- ]?dl|webrip|blu[- ]?ray|brrip|dvdrip|remux|proper|repack)\b",
+    re.I,
+)
+_TMDB_QUERY_DISC_WORDS_RE = re.compile(r"\b(?:disc|disk|dvd|bd|cd|title|copy|backup|retail|ntsc|pal|r1|r2|r3)\b", re.I)
+_SEPARATOR_RUN_RE = re.compile(r"[_\.\-]+")
+_DISC_HINT_SEP_RE = re.compile(r"[_\.]+")
+_DISC_HINT_QUALITY_RE = re.compile(
+    r"\b(?:1080p|2160p|720p|480p|x264|x265|h264|h265|hevc|hdr|uhd|web[- ]?dl|blu[- ]?ray|brrip|dvdrip)\b", re.I
+)
+_DISC_HINT_WORDS_RE = re.compile(r"\b(disc|disk|dvd|video_ts|vol|volume|title|copy)\b", re.I)
+# Stay on one line: an empty "Disc Title:" must not capture the next line.
+_LSDVD_TITLE_RE = re.compile(r"Disc Title:[ \t]*([^\r\n]+)", re.I)
+_CINFO_LINE_RE = re.compile(r"^CINFO:[^\n]*", re.M)
+_CINFO_QUOTED_RE = re.compile(r'"([^\"]+)"')
 
 
 def _extract_year_hint(text: str) -> str:
-    m = re.search(r"\b(19\d{2}|20\d{2})\b", text or "")
+    m = _YEAR_RE.search(text or "")
     return m.group(1) if m else ""
 
 
 def _title_tokens(text: str) -> set[str]:
-    cleaned = re.sub(r"[^a-z0-9]+", " ", (text or "").lower())
+    cleaned = _NON_ALNUM_LOWER_RUN_RE.sub(" ", (text or "").lower())
     stop = {"the", "a", "an", "and", "of", "edition", "extended", "unrated", "remastered", "cut"}
     return {t for t in cleaned.split() if len(t) >= 2 and t not in stop}
 
@@ -277,11 +486,11 @@ def _clean_query_for_tmdb(text: str) -> str:
     s = (text or "").strip()
     if not s:
         return ""
-    s = re.sub(r"[\[\(\{].*?[\]\)\}]", " ", s)
-    s = re.sub(r"\b(?:1080p|2160p|720p|480p|x264|x265|h264|h265|hevc|hdr10?\+?|uhd|web[- ]?dl|webrip|blu[- ]?ray|brrip|dvdrip|remux|proper|repack)\b", " ", s, flags=re.I)
-    s = re.sub(r"\b(?:disc|disk|dvd|bd|cd|title|copy|backup|retail|ntsc|pal|r1|r2|r3)\b", " ", s, flags=re.I)
-    s = re.sub(r"[_\.\-]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip(" -_")
+    s = _BRACKETED_RE.sub(" ", s)
+    s = _TMDB_QUERY_NOISE_RE.sub(" ", s)
+    s = _TMDB_QUERY_DISC_WORDS_RE.sub(" ", s)
+    s = _SEPARATOR_RUN_RE.sub(" ", s)
+    s = _WHITESPACE_RUN_RE.sub(" ", s).strip(" -_")
     return s
 
 
@@ -289,10 +498,10 @@ def _normalize_disc_hint(text: str) -> str:
     s = (text or "").strip()
     if not s:
         return ""
-    s = re.sub(r"[_\.]+", " ", s)
-    s = re.sub(r"\b(?:1080p|2160p|720p|480p|x264|x265|h264|h265|hevc|hdr|uhd|web[- ]?dl|blu[- ]?ray|brrip|dvdrip)\b", " ", s, flags=re.I)
-    s = re.sub(r"\b(disc|disk|dvd|video_ts|vol|volume|title|copy)\b", " ", s, flags=re.I)
-    s = re.sub(r"\s+", " ", s).strip(" -_")
+    s = _DISC_HINT_SEP_RE.sub(" ", s)
+    s = _DISC_HINT_QUALITY_RE.sub(" ", s)
+    s = _DISC_HINT_WORDS_RE.sub(" ", s)
+    s = _WHITESPACE_RUN_RE.sub(" ", s).strip(" -_")
     return s
 
 
@@ -321,7 +530,7 @@ def _query_variants_from_hint(text: str) -> list[str]:
     seen: set[str] = set()
 
     def _add(candidate: str) -> None:
-        c = re.sub(r"\s+", " ", (candidate or "").strip(" -_\"'"))
+        c = _WHITESPACE_RUN_RE.sub(" ", (candidate or "").strip(" -_\"'"))
         if len(c) < 2:
             return
         key = c.lower()
@@ -354,8 +563,8 @@ def _query_variants_from_hint(text: str) -> list[str]:
 
 
 def _title_similarity(a: str, b: str) -> float:
-    aa = re.sub(r"[^a-z0-9]+", " ", (a or "").lower()).strip()
-    bb = re.sub(r"[^a-z0-9]+", " ", (b or "").lower()).strip()
+    aa = _NON_ALNUM_LOWER_RUN_RE.sub(" ", (a or "").lower()).strip()
+    bb = _NON_ALNUM_LOWER_RUN_RE.sub(" ", (b or "").lower()).strip()
     if not aa or not bb:
         return 0.0
     if aa == bb:
@@ -399,57 +608,63 @@ def _row_quality_score(*, query: str, row: dict[str, str], year_hint: str = "")
     return score
 
 
+def _iter_disc_hints(*, blkid: str, iso: str, lsdvd: str, mkv_info: str) -> Iterator[str]:
+    """Yield probable title hints from disc tool output, in tool order."""
+
+    for ln in blkid.splitlines():
+        if ln.startswith("LABEL="):
+            yield ln[len("LABEL="):].strip()
+    for ln in iso.splitlines():
+        _, found, vol = ln.partition("Volume id:")
+        if found:
+            yield vol.strip()
+    for m in _LSDVD_TITLE_RE.finditer(lsdvd):
+        yield m.group(1).strip()
+    for m in _CINFO_LINE_RE.finditer(mkv_info):
+        for v in _CINFO_QUOTED_RE.findall(m.group()):
+            v = v.strip()
+            if len(v) >= 3:
+                yield v
+
+
 def probe_disc_metadata(*, disc_device: str = "/dev/sr0") -> dict[str, object]:
-    raw_hints: list[str] = []
-
-    blkid = _cmd_stdout(["blkid", "-o", "export", disc_device])
-    if blkid:
-        for ln in blkid.splitlines():
-            if ln.startswith("LABEL="):
-                raw_hints.append(ln.split("=", 1)[1].strip())
-
-    if shutil.which("isoinfo"):
-        iso = _cmd_stdout(["isoinfo", "-d", "-i", disc_device])
-        for ln in iso.splitlines():
-            if "Volume id:" in ln:
-                raw_hints.append(ln.split("Volume id:", 1)[1].strip())
-
-    if shutil.which("lsdvd"):
-        lsdvd_out = _cmd_stdout(["lsdvd", disc_device])
-        for ln in lsdvd_out.splitlines():
-            m = re.search(r"Disc Title:\s*(.+)", ln, flags=re.I)
-            if m:
-                raw_hints.append(m.group(1).strip())
-
-    if shutil.which("makemkvcon"):
-        mkv_info = _cmd_stdout(["makemkvcon", "-r", "--noscan", "info", "disc:0"], timeout_s=12)
-        for ln in mkv_info.splitlines():
-            if not ln.startswith("CINFO:"):
-                continue
-            vals = re.findall(r'"([^\"]+)"', ln)
-            for v in vals:
-                if len(v.strip()) >= 3:
-                    raw_hints.append(v.strip())
+    probes: dict[str, tuple[list[str], int]] = {
+        "blkid": (["blkid", "-o", "export", disc_device], 8),
+        "isoinfo": (["isoinfo", "-d", "-i", disc_device], 8),
+        "lsdvd": (["lsdvd", disc_device], 8),
+        "makemkvcon": (["makemkvcon", "-r", "--noscan", "info", "disc:0"], 12),
+    }
+    # The probes only read the disc, so run them side by side; makemkvcon
+    # dominates and the others finish while it is still scanning.
+    from concurrent.futures import ThreadPoolExecutor
+
+    outputs = dict.fromkeys(probes, "")
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = {
+            name: pool.submit(_cmd_stdout, argv, timeout_s=timeout_s)
+            for name, (argv, timeout_s) in probes.items()
+            if name == "blkid" or _which(name)
+        }
+        for name, fut in futures.items():
+            outputs[name] = fut.result()
+    blkid, iso, lsdvd_out, mkv_info = (outputs[name] for name in probes)
+
+    raw_hints = [
+        h
+        for h in _iter_disc_hints(blkid=blkid, iso=iso, lsdvd=lsdvd_out, mkv_info=mkv_info)
+        if _is_probable_disc_hint(h)
+    ]
 
-    hints: list[str] = []
-    seen_hints: set[str] = set()
-    for raw in raw_hints:
-        if not _is_probable_disc_hint(raw):
-            continue
-        n = _normalize_disc_hint(raw)
-        if len(n) < 2:
-            continue
-        k = n.lower()
-        if k in seen_hints:
-            continue
-        seen_hints.add(k)
-        hints.append(n)
+    # One pass: first spelling of each hint wins, dedup ignores case.
+    by_key: dict[str, str] = {}
+    for n in map(_normalize_disc_hint, raw_hints):
+        if len(n) >= 2:
+            by_key.setdefault(n.lower(), n)
+    hints = list(by_key.values())
 
     queries: list[str] = []
     seen_queries: set[str] = set()
     for raw in raw_hints:
-        if not _is_probable_disc_hint(raw):
-            continue
         for q in _query_variants_from_hint(raw):
             key = q.lower()
             if key in seen_queries:
@@ -473,7 +688,14 @@ def probe_disc_metadata(*, disc_device: str = "/dev/sr0") -> dict[str, object]:
     return {"device": disc_device, "hints": hints, "queries": queries, "year_hint": year_hint}
 
 
-def tmdb_suggest_from_disc(*, api_key: str, disc_device: str = "/dev/sr0", media_type: str = "auto", limit: int = 8) -> dict[str, object]:
+def tmdb_suggest_from_disc(
+    *,
+    api_key: str,
+    disc_device: str = "/dev/sr0",
+    media_type: str = "auto",
+    limit: int = 8,
+    refresh: bool = False,
+) -> dict[str, object]:
     mt = (media_type or "auto").strip().lower()
     if mt not in {"auto", "movie", "tv"}:
         raise RuntimeError("TMDB disc media type must be 'auto', 'movie', or 'tv'.")
@@ -492,7 +714,7 @@ def tmdb_suggest_from_disc(*, api_key: str, disc_device: str = "/dev/sr0", media
     expanded_queries: list[str] = []
     seen_queries: set[str] = set()
     for q in queries:
-        for variant in (q, re.sub(r"\b(19\d{2}|20\d{2})\b", "", q).strip()):
+        for variant in (q, _YEAR_RE.sub("", q).strip()):
             key = variant.lower()
             if len(variant) < 2 or key in seen_queries:
                 continue
@@ -501,32 +723,50 @@ def tmdb_suggest_from_disc(*, api_key: str, disc_device: str = "/dev/sr0", media
         if len(expanded_queries) >= 10:
             break
 
+    attempts: list[tuple[str, str, str]] = []
     for q in expanded_queries:
         for search_mt in search_types:
             year_attempts = [year_hint] if year_hint else [""]
             if year_hint:
                 year_attempts.append("")
             for y in year_attempts:
-                try:
-                    rows = tmdb_search(api_key=api_key, query=q, year=y, media_type=search_mt, limit=max(5, min(16, limit)))
-                except Exception:
-                    continue
-                for row in rows:
-                    key = f"{row.get('media_type','')}:{row.get('id','')}"
-                    if not row.get("id"):
-                        key = f"{row.get('media_type','')}:{(row.get('title') or '').lower()}:{row.get('year') or ''}"
-                    score = _row_quality_score(query=q, row=row, year_hint=year_hint)
-                    existing = dedup.get(key)
-                    if existing is None or score > existing[0]:
-                        dedup[key] = (score, row)
-                    if len(dedup) >= 40:
-                        break
+                attempts.append((q, search_mt, y))
+
+    def _search(attempt: tuple[str, str, str]) -> list[dict[str, str]]:
+        q, search_mt, y = attempt
+        return tmdb_search(
+            api_key=api_key,
+            query=q,
+            year=y,
+            media_type=search_mt,
+            limit=max(5, min(16, limit)),
+            refresh=refresh,
+        )
+
+    # The searches are independent network calls, so run them side by side.
+    # Results are still merged in attempt order, so the ranking is stable.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pending = [(attempt, pool.submit(_search, attempt)) for attempt in attempts]
+        for (q, _mt, _y), fut in pending:
+            if len(dedup) >= 40:
+                fut.cancel()
+                continue
+            try:
+                rows = fut.result()
+            except Exception:
+                continue
+            for row in rows:
+                key = f"{row.get('media_type','')}:{row.get('id','')}"
+                if not row.get("id"):
+                    key = f"{row.get('media_type','')}:{(row.get('title') or '').lower()}:{row.get('year') or ''}"
+                score = _row_quality_score(query=q, row=row, year_hint=year_hint)
+                existing = dedup.get(key)
+                if existing is None or score > existing[0]:
+                    dedup[key] = (score, row)
                 if len(dedup) >= 40:
                     break
-            if len(dedup) >= 40:
-                break
-        if len(dedup) >= 40:
-            break
 
     ranked = [pair for pair in dedup.values()]
     ranked.sort(key=lambda x: x[0], reverse=True)
@@ -539,23 +779,40 @@ def tmdb_suggest_from_disc(*, api_key: str, disc_device: str = "/dev/sr0", media
 # ----------------------------
 
 
+_OS_RELEASE: Optional[dict[str, str]] = None
+
+
 def _read_os_release() -> dict[str, str]:
-    try:
-        txt = Path("/etc/os-release").read_text(encoding="utf-8", errors="ignore")
-    except OSError:
-        return {}
+    """Return /etc/os-release as a dict; the file is parsed once per process."""
 
-    out: dict[str, str] = {}
-    for raw in txt.splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        k, v = line.split("=", 1)
-        v = v.strip().strip('"')
-        out[k.strip()] = v
-    return out
+    global _OS_RELEASE
+    if _OS_RELEASE is None:
+        out: dict[str, str] = {}
+        try:
+            with open("/etc/os-release", encoding="utf-8", errors="ignore") as fp:
+                for raw in fp:
+                    line = raw.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    k, eq, v = line.partition("=")
+                    if not eq:
+                        continue
+                    out[k.strip()] = v.strip().strip('"')
+        except OSError:
+            pass
+        _OS_RELEASE = out
+    return dict(_OS_RELEASE)
+
+
+def _invalidate_os_release() -> None:
+    """Forget the cached /etc/os-release (used by tests)."""
 
+    global _OS_RELEASE
+    _OS_RELEASE = None
+    _is_debian_like.cache_clear()
 
+
+@functools.lru_cache(maxsize=None)
 def _is_debian_like() -> bool:
     osr = _read_os_release()
     ident = (osr.get("ID") or "").lower()
@@ -563,34 +820,46 @@ def _is_debian_like() -> bool:
     return ident in {"debian", "ubuntu"} or any(x in like for x in ("debian", "ubuntu"))
 
 
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str) -> Optional[str]:
+    """Cached `shutil.which`; installs through `_run_root_cmd` reset the cache."""
+
+    return shutil.which(cmd)
+
+
 def _sudo_prefix() -> list[str]:
     # Non-interactive sudo; if a password is needed, we fail with a clear message.
     return ["sudo", "-n"]
 
 
 def _run_root_cmd(argv: list[str], *, check: bool = True) -> subprocess.CompletedProcess[str]:
-    if os.geteuid() == 0:
-        return run_cmd(argv, check=check, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    if shutil.which("sudo"):
-        return run_cmd(_sudo_prefix() + argv, check=check, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    raise RuntimeError("This step requires root privileges. Re-run as root or install/configure sudo.")
+    if os.geteuid() != 0 and not _which("sudo"):
+        raise RuntimeError("This step requires root privileges. Re-run as root or install/configure sudo.")
+    prefix = [] if os.geteuid() == 0 else _sudo_prefix()
+    try:
+        return run_cmd(prefix + argv, check=check, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    finally:
+        # Root commands may install or remove programs.
+        _which.cache_clear()
 
 
+@functools.lru_cache(maxsize=None)
 def _has_passwordless_sudo() -> bool:
     if os.geteuid() == 0:
         return True
-    if not shutil.which("sudo"):
+    if not _which("sudo"):
         return False
     cp = run_cmd(["sudo", "-n", "true"], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     return cp.returncode == 0
 
 
+@functools.lru_cache(maxsize=None)
 def _makemkvcon_is_snap() -> bool:
-    path = shutil.which("makemkvcon") or ""
+    path = _which("makemkvcon") or ""
     if "/snap/" in path:
         return True
     # Some installs may expose makemkvcon via PATH symlinks; check snap presence too.
-    if shutil.which("snap"):
+    if _which("snap"):
         cp = run_cmd(["snap", "list", "makemkv"], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return cp.returncode == 0
     return False
@@ -632,7 +901,7 @@ def maybe_ensure_makemkv_snap_interfaces() -> None:
 
     if not _makemkvcon_is_snap():
         return
-    if not shutil.which("snap"):
+    if not _which("snap"):
         print(
             "(Info) MakeMKV appears to be installed via Snap, but the `snap` command was not found. "
             "Skipping Snap interface checks.",
@@ -702,10 +971,10 @@ def maybe_ensure_makemkv_snap_interfaces() -> None:
 
 
 def jellyfin_is_installed() -> bool:
-    if shutil.which("jellyfin"):
+    if _which("jellyfin"):
         return True
     # Debian/Ubuntu: jellyfin is a package. dpkg is reliable when present.
-    if shutil.which("dpkg"):
+    if _which("dpkg"):
         cp = run_cmd(["dpkg", "-s", "jellyfin"], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return cp.returncode == 0
     return False
@@ -728,7 +997,7 @@ def ensure_jellyfin_installed() -> None:
             "Install Jellyfin manually for your distro, then re-run."
         )
 
-    if not shutil.which("apt-get"):
+    if not _which("apt-get"):
         raise RuntimeError("apt-get not found; cannot auto-install Jellyfin on this system.")
 
     print("--------------------------------------------")
@@ -750,7 +1019,7 @@ def ensure_jellyfin_installed() -> None:
         raise
 
     # Enable + start service if systemd is present.
-    if shutil.which("systemctl"):
+    if _which("systemctl"):
         try:
             _run_root_cmd(["systemctl", "enable", "--now", "jellyfin"], check=False)
         except Exception:
@@ -787,12 +1056,24 @@ def debian_install_hint(cmd: str) -> str:
 
 
 def which_required(cmd: str) -> str:
-    path = shutil.which(cmd)
+    path = _which(cmd)
     if not path:
         raise RuntimeError(f"Missing required command: {cmd}\nDebian hint: {debian_install_hint(cmd)}")
     return path
 
 
+def which_required_all(cmds: list[str]) -> list[str]:
+    """`which_required` for several commands; the first missing one (in order) raises."""
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Warm the `_which` cache in parallel; the ordered pass below then only
+    # reads cached results.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_which, cmds))
+    return [which_required(cmd) for cmd in cmds]
+
+
 
 
 def log_fallback_dependency_status() -> None:
@@ -802,7 +1083,7 @@ def log_fallback_dependency_status() -> None:
 
     print("Fallback dependency check:")
     for cmd in fallback_tools:
-        path = shutil.which(cmd)
+        path = _which(cmd)
         if path:
             print(f"  - {cmd}: available ({path})")
         else:
@@ -842,12 +1123,16 @@ def check_deps(movies_dir: str, series_dir: str) -> int:
     if is_remote_dest(movies_dir) or is_remote_dest(series_dir):
         deps.extend(["ssh", "scp"])
 
-    missing = False
-    for cmd in deps:
-        if not shutil.which(cmd):
-            missing = True
-            print(f"Missing: {cmd}", file=sys.stderr)
-            print(f"  Debian hint: {debian_install_hint(cmd)}", file=sys.stderr)
+    from concurrent.futures import ThreadPoolExecutor
+
+    # PATH lookups are independent; results are reported in list order.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        found = dict(zip(deps, pool.map(_which, deps)))
+
+    missing = [cmd for cmd, path in found.items() if not path]
+    for cmd in missing:
+        print(f"Missing: {cmd}", file=sys.stderr)
+        print(f"  Debian hint: {debian_install_hint(cmd)}", file=sys.stderr)
 
     if missing:
         return 2
@@ -863,6 +1148,13 @@ def check_deps(movies_dir: str, series_dir: str) -> int:
 
 
 class Tee:
+    """Write to two text streams at once.
+
+    Writes do not flush; both streams are expected to be line buffered, so
+    each completed line still reaches the terminal and the log right away.
+    Call flush() after partial lines (progress bars) and before exiting.
+    """
+
     def __init__(self, a: IO[str], b: IO[str]) -> None:
         self._a = a
         self._b = b
@@ -871,15 +1163,75 @@ class Tee:
     def write(self, s: str) -> int:
         with self._lock:
             self._a.write(s)
-            self._a.flush()
-            self._b.write(s)
-            self._b.flush()
+            if not self._b.closed:
+                self._b.write(s)
         return len(s)
 
     def flush(self) -> None:
         with self._lock:
             self._a.flush()
-            self._b.flush()
+            if not self._b.closed:
+                self._b.flush()
+
+    def close(self) -> None:
+        """Flush both streams and close the second one (the log file).
+
+        The first stream is the real terminal and stays open, so late
+        writes from background threads still show up there.
+        """
+
+        with self._lock:
+            self._a.flush()
+            if not self._b.closed:
+                self._b.close()
+
+
+def _start_log_tee(log_file: Path) -> Optional[subprocess.Popen]:
+    """Send fds 1 and 2 through a `tee -a log_file` child process.
+
+    Python prints then go straight to the pipe, and child processes that
+    inherit stdout/stderr (ssh, scp, abcde, ...) land in the log too.
+    Returns None if tee cannot be started; callers then fall back to `Tee`.
+    """
+
+    tee_cmd = _which("tee")
+    if os.name == "nt" or not tee_cmd:
+        return None
+    try:
+        sys.__stdout__.flush()  # type: ignore[union-attr]
+        sys.__stderr__.flush()  # type: ignore[union-attr]
+        saved = (os.dup(1), os.dup(2))
+        # Own session, so Ctrl-C/SIGTERM to the run does not kill the logger
+        # before the final messages are written.
+        proc = subprocess.Popen([tee_cmd, "-a", str(log_file)], stdin=subprocess.PIPE, stdout=saved[0], start_new_session=True)
+    except (OSError, ValueError, AttributeError):
+        return None
+    assert proc.stdin is not None
+    os.dup2(proc.stdin.fileno(), 1)
+    os.dup2(proc.stdin.fileno(), 2)
+    proc.stdin.close()
+    atexit.register(_stop_log_tee, proc, saved)
+    return proc
+
+
+def _stop_log_tee(proc: subprocess.Popen, saved: tuple[int, int]) -> None:
+    """Restore fds 1 and 2 and let tee drain; safe to call more than once."""
+
+    if proc.returncode is not None:
+        return
+    for stream in (sys.__stdout__, sys.__stderr__):
+        try:
+            stream.flush()  # type: ignore[union-attr]
+        except (OSError, ValueError, AttributeError):
+            pass
+    # Pointing 1 and 2 back at the terminal drops our last write end of the
+    # pipe, so tee sees EOF once any children holding it have exited.
+    os.dup2(saved[0], 1)
+    os.dup2(saved[1], 2)
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        pass
 
 
 # ----------------------------
@@ -914,12 +1266,33 @@ def run_cmd(
     stdout: Optional[IO[str]] = None,
     stderr: Optional[IO[str]] = None,
     text: bool = True,
+    timeout: Optional[float] = None,
 ) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(argv, check=check, stdout=stdout, stderr=stderr, text=text)
+    return subprocess.run(argv, check=check, stdout=stdout, stderr=stderr, text=text, timeout=timeout)
+
+
+def _ssh_mux_opts() -> list[str]:
+    """OpenSSH options that share one connection across ssh/scp calls.
+
+    The first call opens a master connection that stays up for 60 s, so the
+    mkdir/test/copy steps of a finalize pay for one handshake instead of
+    one each. Skipped when ~/.ssh is missing, since the socket lives there.
+    """
+
+    if not (Path.home() / ".ssh").is_dir():
+        return []
+    return [
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        "ControlPath=~/.ssh/archive-helper-%C",
+        "-o",
+        "ControlPersist=60s",
+    ]
 
 
 def remote_exec(dest: str, cmd: str) -> None:
-    run_cmd(["ssh", "-o", "BatchMode=yes", remote_host_part(dest), cmd])
+    run_cmd(["ssh", "-o", "BatchMode=yes", *_ssh_mux_opts(), remote_host_part(dest), cmd])
 
 
 def remote_preflight_dir(dest: str) -> None:
@@ -948,9 +1321,68 @@ def remote_exists(dest: str, subpath: str) -> bool:
         return False
 
 
-def remote_copy_dir_into(local_dir: Path, remote_dest: str) -> None:
+def remote_exists_many(dest: str, subpaths: Iterable[str]) -> set[str]:
+    """Return which of `subpaths` exist under `dest`, using one ssh run.
+
+    Checking a batch this way costs one round trip instead of one per path.
+    An ssh failure is treated like remote_exists does: nothing is reported.
+    """
+
+    names = [p for p in dict.fromkeys(subpaths) if p]
+    if not names:
+        return set()
+    base = remote_path_part(dest)
+    script = (
+        f"cd -- {shlex.quote(base)} 2>/dev/null || exit 0; "
+        f"for f in {' '.join(shlex.quote(n) for n in names)}; do "
+        '[ -e "$f" ] && printf \'%s\\n\' "$f"; done; true'
+    )
+    try:
+        cp = run_cmd(
+            ["ssh", "-o", "BatchMode=yes", *_ssh_mux_opts(), remote_host_part(dest), script],
+            stdout=subprocess.PIPE,
+        )
+    except subprocess.CalledProcessError:
+        return set()
+    wanted = set(names)
+    return {ln for ln in (cp.stdout or "").splitlines() if ln in wanted}
+
+
+def remote_copy_dir_into(local_dir: Path, remote_dest: str, *, compress: bool = False) -> None:
+    remote_copy_dirs_into([local_dir], remote_dest, compress=compress)
+
+
+# Keep each scp/rsync command line well under typical argv limits.
+SCP_MAX_SOURCES = 70
+
+
+def remote_copy_dirs_into(local_dirs: list[Path], remote_dest: str, *, compress: bool = False) -> None:
+    """Copy several local directories into `remote_dest` with as few runs as possible.
+
+    rsync is used when it is installed: a retry then resumes partial files
+    and skips the ones already copied. If rsync fails (for example, it is
+    missing on the remote side), the batch is copied again with scp.
+
+    `compress=True` adds `-z` (rsync) or `-C` (scp). It helps on slow links;
+    on a LAN the CPU cost usually outweighs it, since encoded video barely
+    compresses.
+    """
+
     rpath = remote_path_part(remote_dest)
-    run_cmd(["scp", "-r", str(local_dir), f"{remote_host_part(remote_dest)}:{rpath}/"])
+    target = f"{remote_host_part(remote_dest)}:{rpath}/"
+    rsync = _which("rsync")
+    rsync_flags = ["-a", "--partial", "--inplace", *(["-z"] if compress else [])]
+    rsync_shell = shlex.join(["ssh", *_ssh_mux_opts()])
+    scp_flags = ["-r", "-C"] if compress else ["-r"]
+    for i in range(0, len(local_dirs), SCP_MAX_SOURCES):
+        sources = [str(d) for d in local_dirs[i : i + SCP_MAX_SOURCES]]
+        if rsync:
+            try:
+                run_cmd([rsync, *rsync_flags, "-e", rsync_shell, *sources, target])
+                continue
+            except subprocess.CalledProcessError as e:
+                print(f"Warning: rsync to {remote_dest} failed ({e.returncode}); retrying with scp.", file=sys.stderr)
+        run_cmd(["scp", *_ssh_mux_opts(), *scp_flags, *sources, target])
 
 
 # ----------------------------
@@ -970,20 +1402,31 @@ def ensure_ssh_dir(home: Path) -> None:
         pass
 
 
+_ssh_config_hosts_cache: dict[Path, tuple[tuple[int, int], frozenset[str]]] = {}
+
+
 def ssh_config_has_host(cfg: Path, host: str) -> bool:
-    if not cfg.exists():
+    try:
+        st = cfg.stat()
+    except OSError:
         return False
 
-    # Minimal parser: look for `Host <name>` lines and match tokens.
+    # Re-parse only when the file changed since the last look.
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _ssh_config_hosts_cache.get(cfg)
+    if cached is not None and cached[0] == stamp:
+        return host in cached[1]
+
+    # Minimal parser: look for `Host <name>` lines and collect their tokens.
+    hosts: set[str] = set()
     for line in cfg.read_text(errors="ignore").splitlines():
         line = line.strip()
         if not line or line.startswith("#"):
             continue
         if line.lower().startswith("host "):
-            tokens = line.split()[1:]
-            if host in tokens:
-                return True
-    return False
+            hosts.update(line.split()[1:])
+    _ssh_config_hosts_cache[cfg] = (stamp, frozenset(hosts))
+    return host in hosts
 
 
 def prompt_default(prompt: str, default: str) -> str:
@@ -1064,7 +1507,7 @@ def prompt_nonempty(prompt: str) -> str:
 def prompt_year(prompt: str) -> str:
     while True:
         v = input(prompt).strip()
-        if re.fullmatch(r"\d{4}", v):
+        if _YEAR4_RE.fullmatch(v):
             return v
         print("Year must be a 4-digit number. Try again.", file=sys.stderr)
 
@@ -1080,7 +1523,7 @@ def prompt_yes_no(prompt: str) -> str:
 def prompt_int(prompt: str) -> int:
     while True:
         v = input(prompt).strip()
-        if re.fullmatch(r"\d+", v):
+        if _DIGITS_RE.fullmatch(v):
             return int(v)
         print("Please enter a number.", file=sys.stderr)
 
@@ -1090,8 +1533,13 @@ def prompt_int(prompt: str) -> int:
 # ----------------------------
 
 
+_CLEAN_TITLE_DROP_RE = re.compile(r"[^a-zA-Z0-9 ]")
+_DIR_NAME_UNSAFE_RE = re.compile(r"[^A-Za-z0-9._\- ]+")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+
 def clean_title(s: str) -> str:
-    return re.sub(r"[^a-zA-Z0-9 ]", "", s).replace(" ", "_")
+    return _CLEAN_TITLE_DROP_RE.sub("", s).replace(" ", "_")
 
 
 def sanitize_title_for_dir(title_raw: str) -> str:
@@ -1106,35 +1554,30 @@ def sanitize_title_for_dir(title_raw: str) -> str:
 
     # Replace anything outside a conservative allowlist.
     # Allowed: letters, digits, dot, underscore, dash, space (space -> underscore below).
-    s = re.sub(r"[^A-Za-z0-9._\- ]+", "_", s)
+    s = _DIR_NAME_UNSAFE_RE.sub("_", s)
 
     # Spaces -> underscores (consistent with the existing behavior).
     s = s.replace(" ", "_")
 
     # Collapse repeated separators and trim edges.
-    s = re.sub(r"_+", "_", s)
+    s = _UNDERSCORE_RUN_RE.sub("_", s)
     s = s.strip("._-_")
     return s or "Untitled"
 
 
+@functools.lru_cache(maxsize=8)
+def _resolved_home(home: Path) -> Path:
+    return home.resolve()
+
+
 def is_safe_work_dir(home: Path, work_dir: Path) -> bool:
-    try:
-        work_dir = work_dir.resolve()
-        home = home.resolve()
-    except OSError:
-        return False
+    """True only for a directory exactly one level below home."""
 
-    if not str(work_dir).startswith(str(home) + os.sep):
-        return False
-    rel = str(work_dir)[len(str(home) + os.sep) :]
-    if not rel:
-        return False
-    if "/" in rel or os.sep in rel:
-        # must be exactly one segment under home
-        return False
-    if work_dir == home:
+    try:
+        rel = work_dir.resolve().relative_to(_resolved_home(home))
+    except (OSError, ValueError):
         return False
-    return True
+    return len(rel.parts) == 1
 
 
 # ----------------------------
@@ -1142,31 +1585,72 @@ def is_safe_work_dir(home: Path, work_dir: Path) -> bool:
 # ----------------------------
 
 
-def init_extras_nfo(nfo: Path) -> None:
+_EXTRAS_NFO_FILENAME_RE = re.compile(r"<filename>(.*?)</filename>")
+_extras_nfo_filenames: dict[Path, set[str]] = {}
+_extras_nfo_lock = Lock()
+
+
+def _extras_nfo_known(nfo: Path) -> set[str]:
+    """Filenames already listed in `nfo`; the file is read once per path.
+
+    Caller holds `_extras_nfo_lock`. A missing file resets the entry, so a
+    deleted and recreated NFO is not mistaken for the old one.
+    """
+
     if not nfo.exists():
-        nfo.write_text("<extras>\n", encoding="utf-8")
+        _extras_nfo_filenames.pop(nfo, None)
+        return set()
+    known = _extras_nfo_filenames.get(nfo)
+    if known is None:
+        txt = nfo.read_text(errors="ignore")
+        known = set(_EXTRAS_NFO_FILENAME_RE.findall(txt))
+        _extras_nfo_filenames[nfo] = known
+    return known
+
+
+def _append_to_file(path: Path, text: str) -> None:
+    # O_APPEND keeps each write whole at the end of the file.
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, text.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def init_extras_nfo(nfo: Path) -> None:
+    with _extras_nfo_lock:
+        if not nfo.exists():
+            nfo.write_text("<extras>\n", encoding="utf-8")
+            _extras_nfo_filenames[nfo] = set()
 
 
 def close_extras_nfo(nfo: Path) -> None:
-    if not nfo.exists():
-        return
-    txt = nfo.read_text(errors="ignore")
-    if "</extras>" not in txt:
-        with nfo.open("a", encoding="utf-8") as f:
-            f.write("</extras>\n")
+    with _extras_nfo_lock:
+        try:
+            with nfo.open("rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 64))
+                tail = f.read()
+        except OSError:
+            return
+        if b"</extras>" not in tail:
+            _append_to_file(nfo, "</extras>\n")
 
 
 def append_extra_nfo_if_missing(nfo: Path, title: str, filename: str) -> None:
-    if nfo.exists() and f"<filename>{filename}</filename>" in nfo.read_text(errors="ignore"):
-        return
-
-    with nfo.open("a", encoding="utf-8") as f:
-        f.write(
+    with _extras_nfo_lock:
+        known = _extras_nfo_known(nfo)
+        if filename in known:
+            return
+        _append_to_file(
+            nfo,
             "  <video>\n"
             f"    <title>{title}</title>\n"
             f"    <filename>{filename}</filename>\n"
-            "  </video>\n"
+            "  </video>\n",
         )
+        known.add(filename)
+        _extras_nfo_filenames[nfo] = known
 
 
 # ----------------------------
@@ -1174,34 +1658,29 @@ def append_extra_nfo_if_missing(nfo: Path, title: str, filename: str) -> None:
 # ----------------------------
 
 
-def ffprobe_meta_title(f: Path) -> str:
-    def _probe(tag: str) -> str:
-        try:
-            cp = run_cmd(
-                [
-                    "ffprobe",
-                    "-v",
-                    "error",
-                    "-show_entries",
-                    f"format_tags={tag}",
-                    "-of",
-                    "default=noprint_wrappers=1:nokey=1",
-                    str(f),
-                ],
-                check=False,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-            )
-            return (cp.stdout or "").strip()
-        except Exception:
-            return ""
+_FFPROBE_INFO_CACHE_MAX = 512
+_ffprobe_info_cache: dict[tuple[str, int, int], dict] = {}
+_ffprobe_info_cache_lock = Lock()
 
-    title_tag = _probe("title")
-    desc_tag = _probe("description")
-    return desc_tag or title_tag
 
+def _ffprobe_format_info(f: Path) -> dict:
+    """Return ffprobe's duration, title/description tags and chapters for `f`.
+
+    One ffprobe run answers all three `ffprobe_*` helpers below. Results are
+    cached per (path, mtime, size), so a file that changes is probed again.
+    """
+
+    try:
+        st = f.stat()
+        key = (str(f), st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    if key is not None:
+        with _ffprobe_info_cache_lock:
+            cached = _ffprobe_info_cache.get(key)
+        if cached is not None:
+            return cached
 
-def ffprobe_duration_seconds(f: Path) -> int:
     try:
         cp = run_cmd(
             [
@@ -1209,43 +1688,151 @@ def ffprobe_duration_seconds(f: Path) -> int:
                 "-v",
                 "error",
                 "-show_entries",
-                "format=duration",
+                "format=duration:format_tags=title,description:chapter=id",
                 "-of",
-                "default=noprint_wrappers=1:nokey=1",
+                "json",
                 str(f),
             ],
             check=False,
             stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
         )
-        raw = (cp.stdout or "0").splitlines()[0].strip()
-        if re.fullmatch(r"\d+(\.\d+)?", raw):
-            return int(raw.split(".")[0])
+        data = json.loads((cp.stdout or "").strip() or "{}")
     except Exception:
-        pass
-    return 0
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    if key is not None:
+        with _ffprobe_info_cache_lock:
+            if len(_ffprobe_info_cache) >= _FFPROBE_INFO_CACHE_MAX:
+                _ffprobe_info_cache.clear()
+            _ffprobe_info_cache[key] = data
+    return data
+
+
+def _info_meta_title(info: dict) -> str:
+    fmt = info.get("format")
+    tags = fmt.get("tags") if isinstance(fmt, dict) else None
+    if not isinstance(tags, dict):
+        return ""
+    lowered = {str(k).lower(): str(v).strip() for k, v in tags.items()}
+    return lowered.get("description") or lowered.get("title") or ""
+
+
+def _info_duration_seconds(info: dict) -> int:
+    fmt = info.get("format")
+    try:
+        return max(0, int(float(fmt["duration"])))  # type: ignore[index]
+    except (KeyError, TypeError, ValueError, OverflowError):
+        return 0
+
+
+def _info_chapter_count(info: dict) -> int:
+    chapters = info.get("chapters")
+    return len(chapters) if isinstance(chapters, list) else 0
+
+
+def ffprobe_meta_title(f: Path) -> str:
+    return _info_meta_title(_ffprobe_format_info(f))
+
+
+def ffprobe_duration_seconds(f: Path) -> int:
+    return _info_duration_seconds(_ffprobe_format_info(f))
 
 
 def ffprobe_chapter_count(f: Path) -> int:
+    return _info_chapter_count(_ffprobe_format_info(f))
+
+
+def ffprobe_meta_bundle(f: Path) -> tuple[str, int, int]:
+    """Return `(meta_title, duration_seconds, chapter_count)` from one probe."""
+
+    info = _ffprobe_format_info(f)
+    return _info_meta_title(info), _info_duration_seconds(info), _info_chapter_count(info)
+
+
+def _probe_worker_count(n: int) -> int:
     try:
-        cp = run_cmd(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "chapters=chapter",
-                "-of",
-                "csv=p=0",
-                str(f),
-            ],
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-        )
-        return len([ln for ln in (cp.stdout or "").splitlines() if ln.strip()])
+        workers = int((os.environ.get("RIP_AND_ENCODE_PROBE_WORKERS") or "8").strip())
+    except ValueError:
+        workers = 8
+    return max(1, min(workers, n))
+
+
+FFPROBE_CACHE_NAME = ".rip_and_encode_ffprobe_cache.json"
+
+
+def _ffprobe_cache_load(disc_dir: Path) -> dict[str, list]:
+    try:
+        data = json.loads((disc_dir / FFPROBE_CACHE_NAME).read_text(encoding="utf-8"))
     except Exception:
-        return 0
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _ffprobe_cache_save(disc_dir: Path, cache: dict[str, list]) -> None:
+    path = disc_dir / FFPROBE_CACHE_NAME
+    try:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(cache, sort_keys=True) + "\n", encoding="utf-8")
+        tmp.replace(path)
+    except Exception:
+        pass
+
+
+def _ffprobe_cache_key(f: Path, cache_dir: Path) -> str:
+    try:
+        return str(f.relative_to(cache_dir))
+    except ValueError:
+        return str(f)
+
+
+def ffprobe_meta_bundles(files: list[Path], *, cache_dir: Optional[Path] = None) -> list[tuple[str, int, int]]:
+    """ffprobe_meta_bundle for each file, probed in parallel, in input order.
+
+    RIP_AND_ENCODE_PROBE_WORKERS caps the number of concurrent ffprobe runs
+    (default 8; 1 probes one file at a time).
+
+    With `cache_dir`, results are also kept in a JSON file in that folder,
+    keyed by file size and mtime. A resumed run then only stats the MKVs
+    instead of running ffprobe on each one again.
+    """
+
+    results: list[Optional[tuple[str, int, int]]] = [None] * len(files)
+    stamps: list[Optional[tuple[int, int]]] = [None] * len(files)
+    cache: dict[str, list] = _ffprobe_cache_load(cache_dir) if cache_dir is not None else {}
+    if cache_dir is not None:
+        for i, f in enumerate(files):
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            stamps[i] = (st.st_size, st.st_mtime_ns)
+            entry = cache.get(_ffprobe_cache_key(f, cache_dir))
+            if isinstance(entry, list) and len(entry) == 5 and tuple(entry[:2]) == stamps[i]:
+                results[i] = (str(entry[2]), int(entry[3]), int(entry[4]))
+
+    misses = [i for i, r in enumerate(results) if r is None]
+    workers = _probe_worker_count(len(misses))
+    if workers <= 1:
+        probed = [ffprobe_meta_bundle(files[i]) for i in misses]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            probed = list(pool.map(ffprobe_meta_bundle, [files[i] for i in misses]))
+
+    dirty = False
+    for i, bundle in zip(misses, probed):
+        results[i] = bundle
+        # A failed probe looks like ("", 0, 0); leave it out so it is retried.
+        if cache_dir is not None and stamps[i] is not None and any(bundle):
+            cache[_ffprobe_cache_key(files[i], cache_dir)] = [*stamps[i], *bundle]
+            dirty = True
+    if dirty:
+        _ffprobe_cache_save(cache_dir, cache)  # type: ignore[arg-type]
+    return results  # type: ignore[return-value]
 
 
 def file_size_mb(f: Path) -> int:
@@ -1276,9 +1863,6 @@ def run_makemkv_with_progress_to_dir(out_dir: Path, *, cache_mb: int = 128, sour
     cache_mb = max(16, min(8192, cache_mb))
 
     argv = [
-        "stdbuf",
-        "-oL",
-        "-eL",
         "makemkvcon",
         "mkv",
         "--progress=-stdout",
@@ -1289,22 +1873,29 @@ def run_makemkv_with_progress_to_dir(out_dir: Path, *, cache_mb: int = 128, sour
         "all",
         str(out_dir),
     ]
+    # makemkvcon flushes its progress lines itself. RIP_AND_ENCODE_USE_STDBUF=1
+    # restores the old stdbuf wrapper for builds that buffer their output.
+    if (os.environ.get("RIP_AND_ENCODE_USE_STDBUF") or "").strip() == "1":
+        argv = ["stdbuf", "-oL", "-eL", *argv]
 
-    proc = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    proc = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
     assert proc.stdout is not None
 
-    prgv_re = re.compile(r"^PRGV:(.*)$")
     for line in proc.stdout:
-        m = prgv_re.match(line.strip())
-        if m:
-            # PRGV:current,total,...
-            parts = re.split(r"[, ]+", m.group(1).strip())
-            if len(parts) >= 2 and parts[0].isdigit() and parts[1].isdigit() and int(parts[1]) > 0:
-                pct = (int(parts[0]) / int(parts[1])) * 100
+        s = line.strip()
+        if s.startswith("PRGV:"):
+            # PRGV:current,total,max
+            parts = s[5:].split(",", 2)
+            try:
+                cur, total = int(parts[0]), int(parts[1])
+            except (IndexError, ValueError):
+                continue
+            if cur >= 0 and total > 0:
+                pct = (cur / total) * 100
                 sys.stdout.write(f"\rMakeMKV progress: {pct:5.1f}%")
                 sys.stdout.flush()
             continue
-        if line.startswith("PRGC:") or line.startswith("PRGT:"):
+        if line.startswith(("PRGC:", "PRGT:")):
             continue
         print(line.rstrip())
 
@@ -1315,7 +1906,7 @@ def run_makemkv_with_progress_to_dir(out_dir: Path, *, cache_mb: int = 128, sour
 
 
 def _run_ddrescue_iso_recovery(*, disc_dir: Path, disc_device: str = "/dev/sr0") -> Optional[Path]:
-    if not shutil.which("ddrescue"):
+    if not _which("ddrescue"):
         print("Fallback: ddrescue not available; skipping ddrescue stage.")
         return None
 
@@ -1379,7 +1970,7 @@ def _run_ddrescue_iso_recovery(*, disc_dir: Path, disc_device: str = "/dev/sr0")
 
 
 def _run_dvdbackup_recovery(*, disc_dir: Path, disc_device: str = "/dev/sr0") -> Optional[Path]:
-    if not shutil.which("dvdbackup"):
+    if not _which("dvdbackup"):
         print("Fallback: dvdbackup not available; skipping dvdbackup stage.")
         return None
 
@@ -1406,7 +1997,7 @@ def _run_dvdbackup_recovery(*, disc_dir: Path, disc_device: str = "/dev/sr0") ->
 
 
 def _run_vobcopy_recovery(*, disc_dir: Path, disc_device: str = "/dev/sr0") -> Optional[Path]:
-    if not shutil.which("vobcopy"):
+    if not _which("vobcopy"):
         print("Fallback: vobcopy not available; skipping vobcopy stage.")
         return None
 
@@ -1436,15 +2027,39 @@ def _run_vobcopy_recovery(*, disc_dir: Path, disc_device: str = "/dev/sr0") -> O
     return None
 
 
+def _iter_mkv_paths(dir_path: str) -> Iterator[str]:
+    # scandir entries carry their file type, so most checks need no stat.
+    # Like rglob, symlinked directories are not descended into.
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.name.endswith(".mkv") and entry.is_file():
+                yield entry.path
+            elif entry.is_dir(follow_symlinks=False):
+                yield from _iter_mkv_paths(entry.path)
+        except OSError:
+            continue
+
+
 def find_mkvs_in_dir(dir_: Path) -> list[Path]:
-    return sorted([p for p in dir_.rglob("*.mkv") if p.is_file()])
+    return sorted(Path(p) for p in _iter_mkv_paths(str(dir_)))
+
+
+_NAME_TITLE_NUM_RE = re.compile(r"(?:^|[^a-z0-9])title[_\- ]*t?(\d{1,4})(?:[^a-z0-9]|$)")
+_NAME_T_NUM_RE = re.compile(r"(?:^|[^a-z0-9])t(\d{1,4})(?:[^a-z0-9]|$)")
+_META_TITLE_NUM_RE = re.compile(r"\btitle\s*(\d{1,4})\b", re.I)
+_META_T_NUM_RE = re.compile(r"\bt(\d{1,4})\b", re.I)
 
 
 def _source_title_order_hint_from_name(path: Path) -> Optional[int]:
     name = (path.name or "").lower()
-    m = re.search(r"(?:^|[^a-z0-9])title[_\- ]*t?(\d{1,4})(?:[^a-z0-9]|$)", name)
+    m = _NAME_TITLE_NUM_RE.search(name)
     if not m:
-        m = re.search(r"(?:^|[^a-z0-9])t(\d{1,4})(?:[^a-z0-9]|$)", name)
+        m = _NAME_T_NUM_RE.search(name)
     if not m:
         return None
     try:
@@ -1455,9 +2070,9 @@ def _source_title_order_hint_from_name(path: Path) -> Optional[int]:
 
 def _source_title_order_hint_from_meta(path: Path) -> Optional[int]:
     meta = ffprobe_meta_title(path)
-    m = re.search(r"\btitle\s*(\d{1,4})\b", meta or "", flags=re.I)
+    m = _META_TITLE_NUM_RE.search(meta or "")
     if not m:
-        m = re.search(r"\bt(\d{1,4})\b", meta or "", flags=re.I)
+        m = _META_T_NUM_RE.search(meta or "")
     if not m:
         return None
     try:
@@ -1510,18 +2125,14 @@ class MovieAnalysis:
     is_extra: dict[Path, bool]
 
 
-def analyze_mkvs_for_movie_disc(mkvs: list[Path]) -> MovieAnalysis:
+def analyze_mkvs_for_movie_disc(mkvs: list[Path], *, cache_dir: Optional[Path] = None) -> MovieAnalysis:
     titlemap: dict[Path, str] = {}
     duration: dict[Path, int] = {}
     is_extra: dict[Path, bool] = {}
 
-    for f in mkvs:
-        meta_title = ffprobe_meta_title(f)
+    for f, (meta_title, dur_s, chapters) in zip(mkvs, ffprobe_meta_bundles(mkvs, cache_dir=cache_dir)):
         titlemap[f] = meta_title
 
-        dur_s = ffprobe_duration_seconds(f)
-        chapters = ffprobe_chapter_count(f)
-
         if dur_s <= 0:
             # Fallback: pick main by size; do not classify as extra.
             duration[f] = file_size_mb(f)
@@ -1576,23 +2187,30 @@ def lock_is_stale_or_clear(lock: Path) -> bool:
     return True
 
 
-def create_lock_or_fail(lock: Path) -> None:
+def create_lock_or_fail(lock: Path, content: bytes = b"") -> None:
+    """Create `lock` exclusively, writing `content` through the same descriptor."""
+
     lock_is_stale_or_clear(lock)
     try:
-        fd = os.open(str(lock), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-        os.close(fd)
+        fd = os.open(str(lock), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
     except FileExistsError as e:
         raise RuntimeError(f"Output is locked (encode in progress?): {lock}\nIf this is stale, remove: {lock}") from e
+    try:
+        if content:
+            os.write(fd, content)
+    finally:
+        os.close(fd)
 
 
-def handbrake_subtitle_args(mode: str) -> list[str]:
+@functools.lru_cache(maxsize=8)
+def handbrake_subtitle_args(mode: str) -> tuple[str, ...]:
     mode_s = (mode or "preset").strip().lower()
     if mode_s == "soft":
         # Keep subtitle tracks selectable (best compatibility with MKV outputs).
-        return ["--all-subtitles", "--subtitle-default=none"]
+        return ("--all-subtitles", "--subtitle-default=none")
     if mode_s in {"none", "external"}:
-        return ["--subtitle=none"]
-    return []
+        return ("--subtitle=none",)
+    return ()
 
 
 def ffprobe_subtitle_streams(path: Path) -> list[dict]:
@@ -1604,7 +2222,9 @@ def ffprobe_subtitle_streams(path: Path) -> list[dict]:
                 "error",
                 "-select_streams",
                 "s",
-                "-show_streams",
+                # Only the fields extract_external_subtitles reads.
+                "-show_entries",
+                "stream=index,codec_name:stream_tags=language",
                 "-print_format",
                 "json",
                 str(path),
@@ -1621,23 +2241,38 @@ def ffprobe_subtitle_streams(path: Path) -> list[dict]:
     return [st for st in (streams or []) if isinstance(st, dict)]
 
 
+_NON_LOWER_ALPHA_RE = re.compile(r"[^a-z]")
+
+
 def _normalize_subtitle_language(raw: str) -> str:
     code = (raw or "").strip().lower()
     # Jellyfin-friendly, short language tags: use two-letter ISO-ish prefix.
     # Examples: eng -> en, en_us -> en, fra -> fr.
-    letters = re.sub(r"[^a-z]", "", code)
+    letters = _NON_LOWER_ALPHA_RE.sub("", code)
     if len(letters) >= 2:
         return letters[:2]
     return "und"
 
 
-def _subtitle_output_path(base: Path, ext: str) -> Path:
+def _dir_names(dir_path: Path) -> set[str]:
+    try:
+        with os.scandir(dir_path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def _subtitle_output_path(base: Path, ext: str, reserved: Iterable[str] = ()) -> Path:
+    """First free subtitle path for `base`; `reserved` names count as taken."""
+
     out = Path(str(base) + ext)
-    if not out.exists():
+    taken = _dir_names(out.parent)
+    taken.update(reserved)
+    if out.name not in taken:
         return out
     for i in range(2, 100):
         cand = Path(str(base) + f".{i:02d}" + ext)
-        if not cand.exists():
+        if cand.name not in taken:
             return cand
     return out
 
@@ -1656,7 +2291,11 @@ def extract_external_subtitles(input_: Path, video_output: Path) -> None:
 
     print(f"Subtitle extraction start: {input_.name} ({total_streams} streams)")
 
-    for idx, st in enumerate(streams, start=1):
+    # Plan every stream first (reserving output names, since nothing is
+    # written yet), then run the ffmpeg extractions side by side.
+    jobs: list[tuple[int, str, Path, list[str]]] = []
+    reserved: set[str] = set()
+    for st in streams:
         stream_index = st.get("index")
         if not isinstance(stream_index, int):
             continue
@@ -1668,7 +2307,7 @@ def extract_external_subtitles(input_: Path, video_output: Path) -> None:
         base = out_dir / f"{stem}.{lang}"
 
         if codec in {"subrip", "srt", "ass", "ssa", "webvtt", "mov_text"}:
-            out = _subtitle_output_path(base, ".srt")
+            out = _subtitle_output_path(base, ".srt", reserved)
             cmd = [
                 "ffmpeg",
                 "-y",
@@ -1682,7 +2321,7 @@ def extract_external_subtitles(input_: Path, video_output: Path) -> None:
                 str(out),
             ]
         elif codec == "dvd_subtitle":
-            out = _subtitle_output_path(base, ".idx")
+            out = _subtitle_output_path(base, ".idx", reserved)
             cmd = [
                 "ffmpeg",
                 "-y",
@@ -1698,7 +2337,7 @@ def extract_external_subtitles(input_: Path, video_output: Path) -> None:
                 str(out),
             ]
         else:
-            out = _subtitle_output_path(base, ".mks")
+            out = _subtitle_output_path(base, ".mks", reserved)
             cmd = [
                 "ffmpeg",
                 "-y",
@@ -1714,9 +2353,31 @@ def extract_external_subtitles(input_: Path, video_output: Path) -> None:
                 str(out),
             ]
 
-        print(f"Subtitle extraction progress: {idx}/{total_streams}: {input_.name} stream {stream_index} -> {out.name}")
-        cp = run_cmd(cmd, check=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-        if cp.returncode != 0:
+        reserved.add(out.name)
+        jobs.append((stream_index, codec, out, cmd))
+
+    # Report each stream as its extraction starts, so the GUI's progress
+    # follows the real work rather than the planning pass.
+    started = itertools.count(1)
+
+    def _extract(job: tuple[int, str, Path, list[str]]) -> int:
+        stream_index, _codec, out, cmd = job
+        print(
+            f"Subtitle extraction progress: {next(started)}/{total_streams}: {input_.name} stream {stream_index} -> {out.name}"
+        )
+        return run_cmd(cmd, check=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT).returncode
+
+    if len(jobs) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Capped at 4: text and vobsub extractions all read the same input.
+        with ThreadPoolExecutor(max_workers=min(4, len(jobs))) as pool:
+            codes = list(pool.map(_extract, jobs))
+    else:
+        codes = [_extract(job) for job in jobs]
+
+    for (stream_index, codec, out, _cmd), returncode in zip(jobs, codes):
+        if returncode != 0:
             try:
                 out.unlink(missing_ok=True)
             except Exception:
@@ -1730,8 +2391,11 @@ def extract_external_subtitles(input_: Path, video_output: Path) -> None:
     print(f"Subtitle extraction done: {input_.name} ({extracted_ok} succeeded, {extracted_failed} failed)")
 
 
+_PRESET_HEIGHT_RE = re.compile(r"(?<!\d)(\d{3,4})p(?:\d{1,3})?(?!\d)", re.I)
+
+
 def _preset_target_height(preset: str) -> Optional[int]:
-    m = re.search(r"(?<!\d)(\d{3,4})p(?:\d{1,3})?(?!\d)", preset or "", flags=re.I)
+    m = _PRESET_HEIGHT_RE.search(preset or "")
     if not m:
         return None
     try:
@@ -1849,7 +2513,10 @@ def _refresh_mp4_quality_metadata(output: Path, preset: str) -> None:
 
 
 def hb_encode(input_: Path, output: Path, preset: str, *, subtitle_mode: str = "preset") -> None:
-    hb_encode_with_progress(input_, output, preset, subtitle_mode=subtitle_mode)
+    try:
+        hb_encode_with_progress(input_, output, preset, subtitle_mode=subtitle_mode)
+    finally:
+        _drop_pagecache(input_)
     _refresh_mp4_quality_metadata(output, preset)
 
 
@@ -1872,42 +2539,87 @@ def _ensure_log_dir(home: Path) -> Path:
 
 
 def _gzip_compress(src: Path, dst: Path) -> None:
-    with src.open("rb") as f_in, gzip.open(dst, "wb") as f_out:
-        shutil.copyfileobj(f_in, f_out)
+    import gzip
+
+    # Level 1 is several times faster than the default 6 on text logs and
+    # only slightly larger; rotation runs at startup, so speed matters more.
+    # Write under a temporary name so an interrupted run never leaves a
+    # truncated .gz that a later rotation would trust.
+    tmp = dst.with_name(dst.name + ".tmp")
+    with src.open("rb") as f_in, gzip.open(tmp, "wb", compresslevel=1) as f_out:
+        shutil.copyfileobj(f_in, f_out, length=1 << 20)
+    tmp.replace(dst)
+
+
+_rotate_logs_lock = Lock()
+
+
+def rotate_logs_in_background(
+    log_dir: Path, *, keep: int = 30, compress: bool = True, exclude: Optional[Path] = None
+) -> Thread:
+    """Run `rotate_logs` on a daemon thread so startup does not wait for gzip."""
+
+    t = Thread(
+        target=rotate_logs,
+        args=(log_dir,),
+        kwargs={"keep": keep, "compress": compress, "exclude": exclude},
+        name="rotate-logs",
+        daemon=True,
+    )
+    t.start()
+    return t
 
 
 def rotate_logs(log_dir: Path, *, keep: int = 30, compress: bool = True, exclude: Optional[Path] = None) -> None:
+    # One rotation at a time per process; a second caller just waits.
+    with _rotate_logs_lock:
+        _rotate_logs(log_dir, keep=keep, compress=compress, exclude=exclude)
+
+
+def _rotate_logs(log_dir: Path, *, keep: int, compress: bool, exclude: Optional[Path]) -> None:
+    # One listing, one stat per log: the mtime serves both the sort and the
+    # age check below. "rip_and_encode_*.log" also covers legacy v2 logs.
     try:
-        candidates: list[Path] = []
-        for pat in ("rip_and_encode_*.log", "rip_and_encode_v2_*.log"):
-            try:
-                candidates.extend(list(log_dir.glob(pat)))
-            except Exception:
-                pass
-        logs = sorted(set(candidates), key=lambda p: p.stat().st_mtime, reverse=True)
+        stamped: list[tuple[float, tuple[int, int], Path]] = []
+        with os.scandir(log_dir) as it:
+            for entry in it:
+                if not (entry.name.startswith("rip_and_encode_") and entry.name.endswith(".log")):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                stamped.append((st.st_mtime, (st.st_dev, st.st_ino), Path(entry.path)))
+        stamped.sort(key=lambda item: item[0], reverse=True)
     except Exception:
         return
 
-    excl = exclude.resolve() if exclude else None
+    # Identify the excluded log by device/inode from the stats above, so no
+    # per-log realpath is needed. If it cannot be stat'ed, compare paths.
+    excl_id: Optional[tuple[int, int]] = None
+    excl_path = os.path.abspath(exclude) if exclude else None
+    if exclude:
+        try:
+            st = exclude.stat()
+            excl_id = (st.st_dev, st.st_ino)
+        except OSError:
+            pass
     kept = 0
     now = time.time()
     min_age_s = 24 * 60 * 60  # only rotate logs older than 24 hours
 
-    for p in logs:
-        try:
-            if excl and p.resolve() == excl:
+    for mtime, file_id, p in stamped:
+        if excl_id is not None:
+            if file_id == excl_id:
                 continue
-        except Exception:
-            pass
+        elif excl_path and os.path.abspath(p) == excl_path:
+            continue
 
         kept += 1
         if kept <= keep:
             continue
 
-        try:
-            if (now - p.stat().st_mtime) < min_age_s:
-                continue
-        except Exception:
+        if (now - mtime) < min_age_s:
             continue
 
         try:
@@ -1922,6 +2634,80 @@ def rotate_logs(log_dir: Path, *, keep: int = 30, compress: bool = True, exclude
             pass
 
 
+_HB_PROGRESS_RE_B = re.compile(rb"Encoding:.*?\s*([0-9]{1,3}(?:\.[0-9]+)?)\s*%")
+# Repeat an unchanged progress percentage at most this often.
+_HB_EMIT_GAP_NS = 2_000_000_000
+
+
+def _iter_output_byte_lines(stream: IO[bytes], *, chunk_size: int = 65536) -> Iterator[bytes]:
+    """Yield stripped, non-empty raw lines from a binary child-process pipe.
+
+    HandBrake redraws its progress with carriage returns, so both "\r" and "\n"
+    end a line. Reading whatever the pipe has ready (up to `chunk_size`) costs
+    one syscall per burst of output instead of one per byte.
+    """
+
+    buf = bytearray()
+    while True:
+        chunk = stream.read1(chunk_size)  # type: ignore[attr-defined]
+        if not chunk:
+            break
+        buf.extend(chunk)
+        cut = max(buf.rfind(b"\n"), buf.rfind(b"\r"))
+        if cut < 0:
+            continue
+        # bytes.splitlines() only breaks on "\r", "\n" and "\r\n", in C.
+        complete = bytes(buf[: cut + 1])
+        del buf[: cut + 1]
+        for raw in complete.splitlines():
+            line = raw.strip()
+            if line:
+                yield line
+
+    tail = bytes(buf).strip()
+    if tail:
+        yield tail
+
+
+def _iter_output_lines(stream: IO[bytes], *, chunk_size: int = 65536) -> Iterator[str]:
+    """Like `_iter_output_byte_lines`, but decoded as UTF-8."""
+
+    for line in _iter_output_byte_lines(stream, chunk_size=chunk_size):
+        yield line.decode("utf-8", errors="replace")
+
+
+def _hb_progress_throttle() -> Callable[[bytes], bool]:
+    """Return a filter that drops repeated HandBrake progress lines.
+
+    A progress line passes when its whole percent changes or at least
+    `_HB_EMIT_GAP_NS` has gone by since the last one; other lines always
+    pass. Lines stay as bytes, so dropped ones are never decoded.
+    """
+
+    last_pct_int: Optional[int] = None
+    last_emit_ns = 0
+
+    def should_emit(line: bytes) -> bool:
+        nonlocal last_pct_int, last_emit_ns
+        # Non-progress lines (scan, open/close, errors) always pass; the
+        # substring tests keep them away from the regex.
+        if b"Encoding:" not in line or b"%" not in line:
+            return True
+        m = _HB_PROGRESS_RE_B.search(line)
+        if not m:
+            return True
+        # The regex only captures digits, so the whole-percent part is an int.
+        pct_i = int(m.group(1).split(b".", 1)[0])
+        now_ns = time.monotonic_ns()
+        if last_pct_int is None or pct_i != last_pct_int or (now_ns - last_emit_ns) >= _HB_EMIT_GAP_NS:
+            last_pct_int = pct_i
+            last_emit_ns = now_ns
+            return True
+        return False
+
+    return should_emit
+
+
 def hb_encode_with_progress(input_: Path, output: Path, preset: str, *, subtitle_mode: str = "preset") -> None:
     """Run HandBrakeCLI while emitting progress as newline-delimited log lines."""
 
@@ -1932,52 +2718,147 @@ def hb_encode_with_progress(input_: Path, output: Path, preset: str, *, subtitle
         stdin=subprocess.DEVNULL,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=0,
     )
 
+    # The pipe hits EOF once HandBrake exits, so read until then and reap
+    # the child once afterwards instead of polling it on every read.
     assert proc.stdout is not None
-    buf = ""
-    last_pct_int: Optional[int] = None
-    last_emit = 0.0
+    should_emit = _hb_progress_throttle()
+    try:
+        for raw in _iter_output_byte_lines(proc.stdout):
+            if should_emit(raw):
+                print(raw.decode("utf-8", errors="replace"))
+    except BaseException:
+        # A signal interrupts the blocking pipe read right away; stop the
+        # encode too, so SIGTERM does not leave HandBrake running.
+        _stop_process(proc)
+        raise
 
-    def should_emit(line: str) -> bool:
-        nonlocal last_pct_int, last_emit
-        m = re.search(r"Encoding:.*?\s*([0-9]{1,3}(?:\.[0-9]+)?)\s*%", line)
-        if not m:
-            return True
+    code = proc.wait()
+    if code != 0:
+        raise RuntimeError(f"HandBrakeCLI failed (exit {code}) for output: {output}")
+
+
+def _stop_process(proc: subprocess.Popen, *, timeout_s: float = 10.0) -> None:
+    if proc.poll() is not None:
+        return
+    try:
+        proc.terminate()
+        proc.wait(timeout=timeout_s)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    except OSError:
+        pass
+
+
+def _drop_pagecache(path: Path) -> None:
+    """Ask the kernel to evict `path` from the page cache (best-effort).
+
+    A ripped MKV is read once by HandBrake and never again, so keeping
+    gigabytes of it cached only pushes out data that is still useful.
+    """
+
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _drop_pagecache_tree(root: Path) -> None:
+    for dirpath, _dirs, files in os.walk(root):
+        for name in files:
+            _drop_pagecache(Path(dirpath) / name)
+
+
+# Background HandBrake processes, so a failed run can stop them on exit.
+_running_encodes: set[subprocess.Popen] = set()
+_running_encodes_lock = Lock()
+
+
+def terminate_running_encodes() -> int:
+    """Send SIGTERM to background HandBrake encodes that are still running.
+
+    Returns the number of processes signalled.
+    """
+
+    with _running_encodes_lock:
+        procs = list(_running_encodes)
+    count = 0
+    for proc in procs:
+        if proc.poll() is not None:
+            continue
         try:
-            pct = float(m.group(1))
-        except Exception:
-            return True
-        pct_i = int(pct)
-        now = time.time()
-        if last_pct_int is None or pct_i != last_pct_int or (now - last_emit) >= 2.0:
-            last_pct_int = pct_i
-            last_emit = now
-            return True
-        return False
+            proc.terminate()
+            count += 1
+        except OSError:
+            pass
+    return count
 
-    while True:
-        ch = proc.stdout.read(1)
-        if ch == "" and proc.poll() is not None:
-            break
-        if ch in ("\r", "\n"):
-            line = buf.strip()
-            buf = ""
-            if line and should_emit(line):
+
+def _run_handbrake_job(input_: Path, output: Path, preset: str, subtitle_mode: str, lock: Path) -> None:
+    """Run one background HandBrake encode from start to finish.
+
+    This is the body of an `--overlap` encode job. It takes only plain values
+    (paths and strings), so it does not depend on any state inside `main()`.
+
+    Steps:
+    - start HandBrakeCLI and record its PID in the encode lock file
+    - stream its output, throttling progress lines and hiding probe noise
+    - remove the lock, then refresh MP4 quality metadata on success
+    """
+
+    proc = subprocess.Popen(
+        ["HandBrakeCLI", "-i", str(input_), "-o", str(output), "--preset", preset, *handbrake_subtitle_args(subtitle_mode)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    with _running_encodes_lock:
+        _running_encodes.add(proc)
+    try:
+        lock.write_text(str(proc.pid) + "\n", encoding="utf-8")
+    except Exception:
+        pass
+
+    # Convert HandBrake carriage-return progress into newline-friendly lines.
+    # Lines stay as bytes until we print them; most progress lines are dropped.
+    assert proc.stdout is not None
+    should_emit = _hb_progress_throttle()
+    suppressed_probe_noise = False
+
+    for raw in _iter_output_byte_lines(proc.stdout):
+        if should_emit(raw):
+            line = raw.decode("utf-8", errors="replace")
+            if _is_benign_handbrake_scan_line(line):
+                suppressed_probe_noise = True
+            else:
                 print(line)
-            continue
-        buf += ch
 
-    tail = buf.strip()
-    if tail and should_emit(tail):
-        print(tail)
+    if suppressed_probe_noise:
+        print("HandBrake note: suppressed known probe noise for non-disc input.")
 
     code = proc.wait()
+    with _running_encodes_lock:
+        _running_encodes.discard(proc)
+    try:
+        lock.unlink(missing_ok=True)
+    except Exception:
+        pass
+    _drop_pagecache(input_)
     if code != 0:
         raise RuntimeError(f"HandBrakeCLI failed (exit {code}) for output: {output}")
 
+    _refresh_mp4_quality_metadata(output, preset)
+
 
 WORKDIR_MARKER_NAME = ".rip_and_encode_workdir"
 WORKDIR_MARKER_NAMES = (WORKDIR_MARKER_NAME, ".rip_and_encode_v2_workdir")
@@ -2017,6 +2898,9 @@ class TitleContext:
     output_extras_dir: Path
     output_extras_nfo: Path
 
+    # Identity used to finalize each title once per run.
+    batch_key: str
+
 
 def setup_title_context(
     *,
@@ -2094,6 +2978,7 @@ def setup_title_context(
         output_season_dir=output_season_dir,
         output_extras_dir=output_extras_dir,
         output_extras_nfo=output_extras_nfo,
+        batch_key=sys.intern(f"S|{title}|{year}|{season_pad}" if is_series else f"M|{title}|{year}"),
     )
 
 
@@ -2109,6 +2994,7 @@ def rip_disc_if_needed(
     wait_for_enter: bool = True,
     makemkv_cache_mb: int = 128,
     validate_rip: Optional[Callable[[list[Path]], tuple[bool, str]]] = None,
+    disc_device: str = "",
 ) -> list[Path]:
     def _has_acceptable_rip() -> tuple[bool, str]:
         mkvs_now = find_mkvs_in_dir(disc_dir)
@@ -2136,7 +3022,7 @@ def rip_disc_if_needed(
     else:
         print(prompt_msg)
         if wait_for_enter:
-            input()
+            wait_for_next_disc(disc_device)
 
         auto_retry_used = False
         while True:
@@ -2341,25 +3227,61 @@ def _normalize_manifest_item(item: object) -> Optional[dict]:
 
 
 def _write_disc_manifest(disc_dir: Path, manifest: dict) -> None:
+    """Atomically replace the disc manifest.
+
+    Compact JSON by default; RIP_AND_ENCODE_MANIFEST_PRETTY=1 writes the
+    indented, key-sorted form for debugging. The temp file is synced
+    before the rename, so a crash leaves either the old or the new file.
+    """
+
     p = _disc_manifest_path(disc_dir)
     tmp = p.with_suffix(p.suffix + ".tmp")
-    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
-    tmp.replace(p)
+    if (os.environ.get("RIP_AND_ENCODE_MANIFEST_PRETTY") or "").strip() == "1":
+        data = json.dumps(manifest, indent=2, sort_keys=True)
+    else:
+        data = json.dumps(manifest, separators=(",", ":"))
+    with open(tmp, "wb") as f:
+        f.write((data + "\n").encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, p)
+
+
+def _batched_exists(paths: list[Path]) -> list[bool]:
+    """`[p.exists() for p in paths]`, with one directory listing per parent.
+
+    Plan outputs mostly share one or two folders, so this replaces a stat
+    per output with a scandir per folder. Symlinks are still resolved, so
+    a dangling link counts as missing, like Path.exists().
+    """
+
+    present: dict[Path, set[str]] = {}
+    for parent in dict.fromkeys(p.parent for p in paths):
+        names: set[str] = set()
+        try:
+            with os.scandir(parent) as it:
+                for entry in it:
+                    if not entry.is_symlink() or os.path.exists(entry.path):
+                        names.add(entry.name)
+        except OSError:
+            pass
+        present[parent] = names
+    return [p.name in present[p.parent] for p in paths]
 
 
 def _manifest_outputs_complete(manifest: dict) -> bool:
     items = manifest.get("items")
     if not isinstance(items, list) or not items:
         return False
+    outputs: list[Path] = []
     for it in items:
         if not isinstance(it, dict):
             return False
         out_s = it.get("output")
         if not isinstance(out_s, str) or not out_s:
             return False
-        if not Path(out_s).exists():
-            return False
-    return True
+        outputs.append(Path(out_s))
+    return all(_batched_exists(outputs))
 
 
 def _find_existing_series_episode_output(
@@ -2374,11 +3296,22 @@ def _find_existing_series_episode_output(
         return None
     if not season_dir.exists():
         return None
-    try:
-        pat = re.compile(
-            r"^" + re.escape(series_title) + r" - S" + re.escape(season_pad) + r"E\d{2} - " + re.escape(clean_episode_title) + r"\." + re.escape(output_ext) + r"$"
+    # Names look like "<title> - S<season>E<nn> - <episode>.<ext>"; compare
+    # the fixed prefix/suffix and check the two episode digits in between.
+    prefix = f"{series_title} - S{season_pad}E"
+    suffix = f" - {clean_episode_title}.{output_ext}"
+    size = len(prefix) + 2 + len(suffix)
+
+    def _matches(name: str) -> bool:
+        return (
+            len(name) == size
+            and name.startswith(prefix)
+            and name.endswith(suffix)
+            and name[len(prefix) : len(prefix) + 2].isdecimal()
         )
-        matches = sorted([p for p in season_dir.iterdir() if p.is_file() and pat.match(p.name)])
+
+    try:
+        matches = sorted([p for p in season_dir.iterdir() if _matches(p.name) and p.is_file()])
         return matches[0] if matches else None
     except Exception:
         return None
@@ -2412,19 +3345,15 @@ def _encode_extra_to_output_and_register(
 
 def unique_out_path(extras_dir: Path, stem: str, ext: str) -> Path:
     extras_dir.mkdir(parents=True, exist_ok=True)
-    out = extras_dir / f"{stem}.{ext}"
-    lock = encode_lock_path(out)
-    lock_is_stale_or_clear(lock)
-
-    if not out.exists() and not lock.exists():
-        return out
+    # List the folder once and probe candidate names against that set.
+    taken = _dir_names(extras_dir)
 
-    for i in range(2, 100):
-        candidate = f"{stem}-{i:02d}"
-        out = extras_dir / f"{candidate}.{ext}"
+    for i in range(1, 100):
+        name = f"{stem}.{ext}" if i == 1 else f"{stem}-{i:02d}.{ext}"
+        out = extras_dir / name
         lock = encode_lock_path(out)
-        lock_is_stale_or_clear(lock)
-        if not out.exists() and not lock.exists():
+        lock_taken = lock.name in taken and not lock_is_stale_or_clear(lock)
+        if name not in taken and not lock_taken:
             return out
 
     raise RuntimeError(f"Could not find a free filename for: {extras_dir}/{stem}.{ext}")
@@ -2477,7 +3406,7 @@ def process_movie_disc(
     assert ctx.output_movie_main is not None
 
     if disc_index == 1 and not ctx.output_movie_main.exists():
-        analysis = analyze_mkvs_for_movie_disc(mkvs)
+        analysis = analyze_mkvs_for_movie_disc(mkvs, cache_dir=disc_dir)
         if not analysis.main_mkv:
             raise RuntimeError("Could not determine main MKV for disc 1.")
 
@@ -2510,8 +3439,9 @@ def process_movie_disc(
     else:
         disc_pad = f"{disc_index:02d}"
         prefix = f"Disc{disc_pad}_"
-        for f in mkvs:
-            meta = ffprobe_meta_title(f)
+        # Probe every title up front: in parallel, and from the disc's
+        # ffprobe cache when this disc is being resumed.
+        for f, (meta, _dur, _chapters) in zip(mkvs, ffprobe_meta_bundles(mkvs, cache_dir=disc_dir)):
             base = prefix + clean_title(meta or "Extra")
             encode_extra_and_register(
                 input_=f,
@@ -2827,19 +3757,25 @@ def movie_disc_has_main_feature(
     return True, ""
 
 
+_EP_NUM_RE = re.compile(r"E(\d{2})")
+_NATURAL_SPLIT_RE = re.compile(r"(\d+)")
+
+
 def series_next_episode_number(season_dir: Path) -> int:
-    if not season_dir.exists():
+    best = 0
+    try:
+        with os.scandir(season_dir) as it:
+            for entry in it:
+                m = _EP_NUM_RE.search(entry.name)
+                if m:
+                    best = max(best, int(m.group(1)))
+    except (FileNotFoundError, NotADirectoryError):
         return 1
-    ep_nums: list[int] = []
-    for name in season_dir.iterdir():
-        m = re.search(r"E(\d{2})", name.name)
-        if m:
-            ep_nums.append(int(m.group(1)))
-    return (max(ep_nums) if ep_nums else 0) + 1
+    return best + 1
 
 
 def _natural_key(text: str) -> list[object]:
-    parts = re.split(r"(\d+)", text or "")
+    parts = _NATURAL_SPLIT_RE.split(text or "")
     key: list[object] = []
     for p in parts:
         if not p:
@@ -2851,19 +3787,24 @@ def _natural_key(text: str) -> list[object]:
     return key
 
 
-def _episode_hint_from_text(text: str) -> Optional[int]:
-    s = (text or "").strip()
-    if not s:
-        return None
-
-    patterns = (
+_EPISODE_HINT_RES = tuple(
+    re.compile(p, re.I)
+    for p in (
         r"\bS\d{1,2}E(\d{1,3})\b",
         r"\bE(?:P(?:ISODE)?)?\s*[-_. ]?(\d{1,3})\b",
         r"\b(\d{1,2})x(\d{1,3})\b",
         r"\bPART\s*(\d{1,3})\b",
     )
-    for pat in patterns:
-        m = re.search(pat, s, flags=re.I)
+)
+
+
+def _episode_hint_from_text(text: str) -> Optional[int]:
+    s = (text or "").strip()
+    if not s:
+        return None
+
+    for pat in _EPISODE_HINT_RES:
+        m = pat.search(s)
         if not m:
             continue
         try:
@@ -2878,10 +3819,16 @@ def _episode_hint_from_text(text: str) -> Optional[int]:
     return None
 
 
+_STEM_TITLE_NUM_RES = (
+    re.compile(r"(?:^|[^a-z])t(?:itle)?[_\- ]?(\d{1,3})(?:[^a-z]|$)", re.I),
+    re.compile(r"\btitle[_\- ]?(\d{1,3})\b", re.I),
+)
+
+
 def _source_title_order_hint(path: Path) -> Optional[int]:
     stem = path.stem
-    for pat in (r"(?:^|[^a-z])t(?:itle)?[_\- ]?(\d{1,3})(?:[^a-z]|$)", r"\btitle[_\- ]?(\d{1,3})\b"):
-        m = re.search(pat, stem, flags=re.I)
+    for pat in _STEM_TITLE_NUM_RES:
+        m = pat.search(stem)
         if not m:
             continue
         try:
@@ -2948,10 +3895,8 @@ def process_series_disc(
         # First time (or legacy runs): build a deterministic plan and persist it.
         ep_num = series_next_episode_number(ctx.output_season_dir)
         used_outputs: set[str] = set()
-        for f in _series_plan_order(mkvs):
-            meta_title = ffprobe_meta_title(f)
-            dur = ffprobe_duration_seconds(f)
-            chapters = ffprobe_chapter_count(f)
+        plan_order = _series_plan_order(mkvs)
+        for f, (meta_title, dur, chapters) in zip(plan_order, ffprobe_meta_bundles(plan_order, cache_dir=disc_dir)):
 
             rule_duration = dur > 0 and dur < EXTRA_DURATION_THRESHOLD
             rule_keyword = bool(EXTRA_KEYWORDS_RE.search(meta_title or ""))
@@ -3007,6 +3952,8 @@ def process_series_disc(
             pass
 
     # Execute plan (encode only missing outputs).
+    planned = [str(it.get("output")) for it in items if isinstance(it.get("output"), str) and it.get("output")]
+    already_done = {out_s for out_s, ok in zip(planned, _batched_exists([Path(o) for o in planned])) if ok}
     for it in items:
         try:
             input_rel = it.get("input_rel")
@@ -3016,7 +3963,7 @@ def process_series_disc(
                 continue
             input_path = (disc_dir / input_rel).resolve()
             out = Path(out_s)
-            if out.exists():
+            if out_s in already_done:
                 continue
             if kind == "extra":
                 _encode_extra_to_output_and_register(
@@ -3032,22 +3979,201 @@ def process_series_disc(
                 if subtitle_mode == "external":
                     extract_external_subtitles(input_path, out)
 
-                if overlap:
-                    submit_encode(input_path, out, preset, subtitle_mode)
-                else:
-                    if out.exists():
-                        print(f"Skipping encode (exists): {out}")
-                    else:
-                        hb_encode(input_path, out, preset, subtitle_mode=subtitle_mode)
-        except Exception:
-            raise
+                if overlap:
+                    submit_encode(input_path, out, preset, subtitle_mode)
+                else:
+                    if out.exists():
+                        print(f"Skipping encode (exists): {out}")
+                    else:
+                        hb_encode(input_path, out, preset, subtitle_mode=subtitle_mode)
+        except Exception:
+            raise
+
+    close_extras_nfo(ctx.output_extras_nfo)
+
+
+# ----------------------------
+# Finalize (remote sync / cleanup)
+# ----------------------------
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Delete a directory tree, preferring `rm -rf` over shutil.rmtree.
+
+    `rm` unlinks large MKV trees much faster than Python's per-entry loop.
+    Callers must run their safety checks first. If `rm` is missing or the
+    tree survives it, shutil.rmtree runs and raises the usual OSError.
+    """
+
+    # A symlink goes straight to shutil.rmtree, which refuses it as before.
+    if os.name != "nt" and not os.path.islink(path) and _which("rm"):
+        subprocess.run(
+            ["rm", "-rf", "--", os.fspath(path)],
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if not os.path.lexists(path):
+            return
+    shutil.rmtree(path)
+
+
+def _rm_rf_many(paths: list[Path]) -> None:
+    """Run `rm -rf --` over many vetted paths with as few processes as fit.
+
+    Best effort: callers check what is left afterwards. Symlinks are skipped
+    here so _fast_rmtree can refuse them individually.
+    """
+
+    if os.name == "nt" or not _which("rm"):
+        return
+    try:
+        arg_max = int(os.sysconf("SC_ARG_MAX"))
+    except (AttributeError, ValueError, OSError):
+        arg_max = 131072
+    # Leave room for the environment block and per-argument pointers.
+    env_bytes = sum(len(k) + len(v) + 2 for k, v in os.environ.items())
+    budget = max(4096, arg_max // 2 - env_bytes)
+
+    chunk: list[str] = []
+    used = 0
+    for p in paths:
+        if os.path.islink(p):
+            continue
+        arg = os.fspath(p)
+        cost = len(os.fsencode(arg)) + 1 + 8
+        if chunk and used + cost > budget:
+            subprocess.run(["rm", "-rf", "--", *chunk], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            chunk, used = [], 0
+        chunk.append(arg)
+        used += cost
+    if chunk:
+        subprocess.run(["rm", "-rf", "--", *chunk], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+TRASH_DIR_PREFIX = ".rip_and_encode_trash-"
+_background_deletes: list[Thread] = []
+_background_deletes_lock = Lock()
+_background_delete_failures = 0
+
+
+def _record_background_delete_failures(count: int) -> None:
+    global _background_delete_failures
+    with _background_deletes_lock:
+        _background_delete_failures += count
+
+
+def _delete_trash(trash: Path) -> None:
+    try:
+        _fast_rmtree(trash)
+    except FileNotFoundError:
+        # A startup or cleanup sweep removed it first.
+        pass
+    except OSError as e:
+        print(f"ERROR: failed to remove {trash}: {e}", file=sys.stderr)
+        _record_background_delete_failures(1)
+
+
+def _async_rmtree(path: Path) -> None:
+    """Rename `path` to a hidden sibling and delete it on a worker thread.
+
+    The rename is instant on the same filesystem, so the caller can move on
+    while the files are unlinked. If the rename fails, the tree is deleted
+    here instead. A trash dir left half deleted (the process was killed,
+    say) is removed by `sweep_trash_dirs` on the next run or cleanup.
+    """
+
+    trash = path.parent / f"{TRASH_DIR_PREFIX}{uuid.uuid4().hex}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        _fast_rmtree(path)
+        return
+    t = Thread(target=_delete_trash, args=(trash,), name="rm-trash", daemon=False)
+    with _background_deletes_lock:
+        _background_deletes.append(t)
+    t.start()
+
+
+def wait_for_background_deletes() -> int:
+    """Block until every background deletion has finished.
+
+    Returns how many deletions failed since the last call.
+    """
+
+    global _background_delete_failures
+    with _background_deletes_lock:
+        pending = list(_background_deletes)
+        _background_deletes.clear()
+    for t in pending:
+        t.join()
+    with _background_deletes_lock:
+        failures = _background_delete_failures
+        _background_delete_failures = 0
+    return failures
+
+
+atexit.register(wait_for_background_deletes)
+
+
+def _find_trash_dirs(home: Path) -> list[Path]:
+    """Leftover `_async_rmtree` dirs: directly under home, or one level inside a work dir."""
+
+    found: list[Path] = []
+    try:
+        with os.scandir(home) as it:
+            children = [e for e in it if e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return found
+    for child in children:
+        path = Path(child.path)
+        if not is_safe_work_dir(home, path):
+            continue
+        if child.name.startswith(TRASH_DIR_PREFIX):
+            found.append(path)
+            continue
+        try:
+            with os.scandir(path) as it:
+                found.extend(
+                    Path(e.path) for e in it if e.name.startswith(TRASH_DIR_PREFIX) and e.is_dir(follow_symlinks=False)
+                )
+        except OSError:
+            continue
+    return found
+
 
-    close_extras_nfo(ctx.output_extras_nfo)
+def sweep_trash_dirs(home: Path, *, dry_run: bool = False) -> int:
+    """Delete leftover trash dirs under `home`; returns how many could not be removed."""
+
+    found = _find_trash_dirs(home)
+    if dry_run:
+        if found:
+            print("Unfinished deletes (removed on the next cleanup):")
+            for trash in found:
+                print(f"  - {trash}")
+        return 0
+    failures = 0
+    for trash in found:
+        try:
+            _fast_rmtree(trash)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            failures += 1
+            print(f"ERROR: failed to remove {trash}: {e}", file=sys.stderr)
+    return failures
 
 
-# ----------------------------
-# Finalize (remote sync / cleanup)
-# ----------------------------
+def _sweep_trash_dirs_job(home: Path) -> None:
+    _record_background_delete_failures(sweep_trash_dirs(home))
+
+
+def sweep_trash_dirs_in_background(home: Path) -> Thread:
+    t = Thread(target=_sweep_trash_dirs_job, args=(home,), name="rm-trash-sweep", daemon=False)
+    with _background_deletes_lock:
+        _background_deletes.append(t)
+    t.start()
+    return t
 
 
 def rm_mkvs_tree_if_allowed(home: Path, work_dir: Path, mkv_root: Path, keep_mkvs: bool) -> None:
@@ -3057,31 +4183,73 @@ def rm_mkvs_tree_if_allowed(home: Path, work_dir: Path, mkv_root: Path, keep_mkv
     if not is_safe_work_dir(home, work_dir):
         raise RuntimeError(f"Refusing to remove MKV tree; unsafe WORK_DIR: {work_dir}")
     if mkv_root.exists():
-        shutil.rmtree(mkv_root)
+        _fast_rmtree(mkv_root)
 
 
-def rm_work_dir_if_allowed(home: Path, work_dir: Path, keep_mkvs: bool) -> None:
+def rm_work_dir_if_allowed(
+    home: Path, work_dir: Path, keep_mkvs: bool, *, failsafe: FailSafe | None = None
+) -> None:
     if keep_mkvs:
         print(f"--keep-mkvs: leaving WORK_DIR intact: {work_dir}")
         return
+    # A background finalize can reach this after the run failed; keep the files then.
+    if failsafe is not None and failsafe.failed:
+        print(f"Run failed: leaving WORK_DIR intact: {work_dir}")
+        return
     if not is_safe_work_dir(home, work_dir):
         raise RuntimeError(f"Refusing to remove WORK_DIR; unsafe WORK_DIR: {work_dir}")
     if work_dir.exists():
-        shutil.rmtree(work_dir)
+        _async_rmtree(work_dir)
+
+
+REMOTE_COPY_ATTEMPTS = 3
+
+
+def _copy_with_retries(copy: Callable[[], None], what: str) -> None:
+    """Run `copy`, retrying a failed transfer with 1 s, 2 s, ... backoff.
 
+    A brief network drop should not fail a whole title. rsync resumes
+    partial files, so a retry mostly sends what is still missing.
+    """
+
+    for attempt in range(REMOTE_COPY_ATTEMPTS):
+        try:
+            copy()
+            return
+        except subprocess.CalledProcessError as e:
+            if attempt + 1 >= REMOTE_COPY_ATTEMPTS:
+                raise
+            delay = 2**attempt
+            print(f"Warning: copying {what} failed ({e.returncode}); retrying in {delay}s.", file=sys.stderr)
+            time.sleep(delay)
 
-def remote_sync_series_season(remote_base: str, title: str, local_season_dir: Path) -> None:
+
+def remote_sync_series_season(remote_base: str, title: str, local_season_dir: Path, *, compress: bool = False) -> None:
     remote_root = remote_path_part(remote_base)
     remote_exec(remote_base, f"mkdir -p -- '{remote_root}/{title}'")
     print(f"Copying season folder to remote: {remote_base}/{title}")
-    run_cmd(["scp", "-r", str(local_season_dir), f"{remote_host_part(remote_base)}:{remote_root}/{title}/"])
+    _copy_with_retries(
+        lambda: remote_copy_dirs_into([local_season_dir], f"{remote_base}/{title}", compress=compress),
+        local_season_dir.name,
+    )
 
 
-def remote_sync_movie_folder(remote_base: str, title: str, year: str, local_movie_dir: Path) -> None:
+def remote_sync_movie_folder(
+    remote_base: str,
+    title: str,
+    year: str,
+    local_movie_dir: Path,
+    *,
+    compress: bool = False,
+) -> None:
     if remote_exists(remote_base, f"{title} ({year})"):
         raise RuntimeError(f"Remote destination already exists: {remote_base}/{title} ({year})")
     print(f"Copying movie folder to remote: {remote_base}")
-    remote_copy_dir_into(local_movie_dir, remote_base)
+    # The exists check above runs once; a retried copy finishes our own partial folder.
+    _copy_with_retries(
+        lambda: remote_copy_dir_into(local_movie_dir, remote_base, compress=compress),
+        local_movie_dir.name,
+    )
 
 
 # ----------------------------
@@ -3090,13 +4258,30 @@ def remote_sync_movie_folder(remote_base: str, title: str, year: str, local_movi
 
 
 class FailSafe:
+    # A failed run always keeps its MKVs, so `failed` is the only state needed.
+    __slots__ = ("failed",)
+
     def __init__(self) -> None:
         self.failed = False
-        self.keep_mkvs_force = False
 
     def mark_failed(self) -> None:
         self.failed = True
-        self.keep_mkvs_force = True
+
+
+def _finalize_after_encodes(
+    pending: Iterable[Future],
+    ctxs: Iterable[TitleContext],
+    failsafe: FailSafe,
+    finalize: Callable[[TitleContext], None],
+) -> None:
+    """Wait for `pending` encodes, then finalize each title until the run fails."""
+
+    for fut in pending:
+        fut.result()
+    for ctx in ctxs:
+        if failsafe.failed:
+            return
+        finalize(ctx)
 
 
 # ----------------------------
@@ -3234,6 +4419,12 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         ),
     )
 
+    p.add_argument(
+        "--compress-transfer",
+        action="store_true",
+        help="Compress remote copies (scp -C). Helps on slow links; leave off on a LAN.",
+    )
+
     p.add_argument("--movies-dir", default="/storage/Movies", help="Movies output directory (default: /storage/Movies)")
     p.add_argument("--series-dir", default="/storage/Series", help="Series output directory (default: /storage/Series)")
     p.add_argument("--books-dir", default="/storage/Books", help="Audiobook output directory (default: /storage/Books)")
@@ -3286,7 +4477,12 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         help="Probe the inserted disc with Linux tools and return TMDB suggestions as JSON.",
     )
     p.add_argument("--tmdb-api-key", default="", help="TMDB API key used with --tmdb-search")
-    p.add_argument("--disc-device", default="/dev/sr0", help="Optical disc device path used by --tmdb-suggest-from-disc")
+    p.add_argument(
+        "--auto-next",
+        action="store_true",
+        help="Start ripping as soon as a new disc is detected in --disc-device instead of waiting for Enter (Enter still works).",
+    )
+    p.add_argument("--disc-device", default="/dev/sr0", help="Optical disc device path used by --tmdb-suggest-from-disc and --auto-next")
     p.add_argument("--tmdb-year", default="", help="Optional 4-digit year hint used with --tmdb-search")
     p.add_argument(
         "--tmdb-media-type",
@@ -3295,6 +4491,11 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         help="TMDB search media type for --tmdb-search (default: movie)",
     )
     p.add_argument("--tmdb-limit", type=int, default=8, help="Max TMDB matches to return with --tmdb-search (default: 8)")
+    p.add_argument(
+        "--refresh-tmdb",
+        action="store_true",
+        help="Ignore cached TMDB search answers for --tmdb-search / --tmdb-suggest-from-disc and store fresh ones.",
+    )
     p.add_argument(
         "--tmdb-disc-media-type",
         choices=["auto", "movie", "tv"],
@@ -3322,6 +4523,12 @@ def _disk_targets_for_run(*, home_base: Path, movies_dir: str, series_dir: str)
 
 
 def _dedupe_paths_by_device(paths: list[Path]) -> list[Path]:
+    """Keep one path per filesystem, so free space is read once per device.
+
+    Not cached across calls: a destination mounted mid-run (over an empty
+    mountpoint dir) must be seen by the next per-disc check.
+    """
+
     seen: set[int] = set()
     unique: list[Path] = []
     for p in paths:
@@ -3339,6 +4546,108 @@ def _dedupe_paths_by_device(paths: list[Path]) -> list[Path]:
     return unique
 
 
+LOW_DISK_RECHECK_S = 60
+DISK_FREE_CACHE_TTL_S = 5.0
+
+_disk_free_cache: dict[str, tuple[float, int]] = {}
+
+
+def _disk_free_bytes(path: Path, *, max_age_s: float = DISK_FREE_CACHE_TTL_S) -> int:
+    """Return free bytes for `path`, reusing a reading taken within `max_age_s`.
+
+    The pre-prompt check runs before every CSV disc; a short cache keeps
+    back-to-back checks from hitting the filesystem each time.
+    """
+
+    key = str(path)
+    now = time.monotonic()
+    cached = _disk_free_cache.get(key)
+    if cached is not None and max_age_s > 0 and now - cached[0] < max_age_s:
+        return cached[1]
+    free = int(shutil.disk_usage(path).free)
+    _disk_free_cache[key] = (now, free)
+    return free
+
+
+def _wait_for_enter_or_timeout(timeout_s: float) -> None:
+    """Wait for Enter on stdin, but give up after `timeout_s` seconds.
+
+    Unattended runs can then resume on their own once space is freed.
+    At EOF on stdin this simply waits out the timeout. Falls back to a
+    plain blocking `input()` when stdin cannot be polled.
+    """
+
+    deadline = time.monotonic() + timeout_s
+    try:
+        ready, _w, _x = select.select([sys.stdin], [], [], timeout_s)
+    except (OSError, ValueError, TypeError, AttributeError):
+        input()
+        return
+    if ready and not sys.stdin.readline():
+        # EOF (stdin is /dev/null or a closed pipe) always polls ready; wait
+        # out the timeout instead of rechecking in a tight loop.
+        time.sleep(max(0.0, deadline - time.monotonic()))
+
+
+# Linux CD-ROM ioctl (linux/cdrom.h).
+_CDROM_DRIVE_STATUS = 0x5326
+_CDS_DISC_OK = 4
+DISC_READY_POLL_S = 2.0
+
+
+def _drive_has_disc(device: str) -> Optional[bool]:
+    """Return whether `device` reports a readable disc, or None if unknown."""
+
+    try:
+        import fcntl
+
+        fd = os.open(device, os.O_RDONLY | os.O_NONBLOCK)
+    except (ImportError, OSError):
+        return None
+    try:
+        return fcntl.ioctl(fd, _CDROM_DRIVE_STATUS, 0) == _CDS_DISC_OK
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def wait_for_next_disc(device: str = "") -> None:
+    """Wait for Enter, or (when `device` is set) for a new disc in the drive.
+
+    Only a change from "no disc" to "disc ready" counts, so a disc that was
+    left in the tray is never ripped twice. Enter still works at any time.
+    Falls back to a plain `input()` when the drive status cannot be read.
+    """
+
+    if not device or _drive_has_disc(device) is None:
+        input()
+        return
+
+    seen_empty = False
+    watch_stdin = True
+    while True:
+        if watch_stdin:
+            try:
+                ready, _w, _x = select.select([sys.stdin], [], [], DISC_READY_POLL_S)
+            except (OSError, ValueError, TypeError, AttributeError):
+                input()
+                return
+            if ready:
+                if sys.stdin.readline():
+                    return
+                # EOF is not Enter: keep waiting for the drive alone.
+                watch_stdin = False
+        else:
+            time.sleep(DISC_READY_POLL_S)
+        has_disc = _drive_has_disc(device)
+        if has_disc is False:
+            seen_empty = True
+        elif has_disc and seen_empty:
+            print(f"Disc detected in {device}; starting rip.")
+            return
+
+
 def pause_if_low_disk_space(*, paths: list[Path], min_free_gb: int = 20) -> None:
     """Pause the run if free space is below the threshold on any relevant filesystem.
 
@@ -3355,25 +4664,29 @@ def pause_if_low_disk_space(*, paths: list[Path], min_free_gb: int = 20) -> None
     if not targets:
         return
 
+    paused = False
     while True:
         low: list[tuple[Path, float]] = []
         for p in targets:
             try:
-                usage = shutil.disk_usage(p)
-                free_gb = _format_gb(int(usage.free))
+                # Always re-read after a pause so recovery is seen right away.
+                free_gb = _format_gb(_disk_free_bytes(p, max_age_s=0 if paused else DISK_FREE_CACHE_TTL_S))
             except Exception:
                 continue
             if free_gb < float(min_free_gb):
                 low.append((p, free_gb))
 
         if not low:
+            if paused:
+                print("Disk space recovered; resuming run.")
             return
 
+        paused = True
         print("Low disk space detected. Please free up space on the server.")
         for p, free_gb in low:
             print(f"  - {p}: {free_gb:.1f} GB free (need >= {min_free_gb} GB)")
         print(
-            "Low disk space: free up space and Press Enter to retry.\n"
+            f"Low disk space: free up space and Press Enter to retry (free space is rechecked every {LOW_DISK_RECHECK_S} seconds).\n"
             "\n"
             "Note: this script does NOT auto-clean while a job is running, because\n"
             "background encodes may still be reading MKVs from the work directory.\n"
@@ -3384,7 +4697,7 @@ def pause_if_low_disk_space(*, paths: list[Path], min_free_gb: int = 20) -> None
             "discs whose output files already exist; for series, you may still need\n"
             "to remove completed rows if you cleaned the work directory."
         )
-        input()
+        _wait_for_enter_or_timeout(LOW_DISK_RECHECK_S)
 
 
 def _encode_lock_active_for_output(out: Path) -> bool:
@@ -3392,6 +4705,17 @@ def _encode_lock_active_for_output(out: Path) -> bool:
     return not lock_is_stale_or_clear(lock)
 
 
+@functools.lru_cache(maxsize=256)
+def _extras_file_names(extras_dir: str, mtime_ns: int) -> tuple[str, ...]:
+    """File names in `extras_dir`; keyed by mtime so adds and removes miss the cache.
+
+    A CSV resume checks the same Extras folder once per disc.
+    """
+
+    with os.scandir(extras_dir) as it:
+        return tuple(e.name for e in it if e.is_file())
+
+
 def _movie_disc_outputs_exist(ctx: "TitleContext", disc_index: int, output_ext: str) -> bool:
     """Best-effort check to skip re-ripping discs on CSV restart.
 
@@ -3417,15 +4741,17 @@ def _movie_disc_outputs_exist(ctx: "TitleContext", disc_index: int, output_ext:
 
     # Disc 2+: extras-only outputs have a deterministic prefix.
     extras_dir = ctx.output_extras_dir
-    if not extras_dir.exists():
+    try:
+        mtime_ns = extras_dir.stat().st_mtime_ns
+        names = _extras_file_names(os.fspath(extras_dir), mtime_ns)
+    except OSError:
         return False
     prefix = f"Disc{disc_index:02d}_"
-    try:
-        for p in extras_dir.glob(prefix + f"*.{output_ext}"):
-            if p.is_file() and not _encode_lock_active_for_output(p):
+    suffix = f".{output_ext}"
+    for name in names:
+        if name.startswith(prefix) and name.endswith(suffix):
+            if not _encode_lock_active_for_output(extras_dir / name):
                 return True
-    except Exception:
-        return False
     return False
 
 
@@ -3435,40 +4761,47 @@ def list_handbrake_presets() -> None:
 
 
 def _dir_size_bytes(path: Path) -> int:
+    # Walk with scandir so type checks reuse the directory listing; symlinks
+    # are neither followed nor counted.
     total = 0
-    try:
-        for root, _dirs, files in os.walk(path):
-            for name in files:
-                try:
-                    total += (Path(root) / name).stat().st_size
-                except Exception:
-                    pass
-    except Exception:
-        return 0
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
     return total
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def _human_bytes(n: int) -> str:
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    v = float(max(0, n))
-    for u in units:
-        if v < 1024.0 or u == units[-1]:
-            if u == "B":
-                return f"{int(v)} {u}"
-            return f"{v:.1f} {u}"
-        v /= 1024.0
-    return f"{int(n)} B"
+    n = max(0, int(n))
+    # Each unit is 10 more bits, so the bit length picks the unit directly.
+    idx = min(len(_BYTE_UNITS) - 1, max(0, (n.bit_length() - 1) // 10))
+    if idx == 0:
+        return f"{n} B"
+    return f"{n / (1 << (idx * 10)):.1f} {_BYTE_UNITS[idx]}"
 
 
 def run_cd_rip_with_abcde(*, music_dir: str, artist_hint: str = "", album_hint: str = "", year_hint: str = "") -> int:
-    if not shutil.which("abcde"):
+    if not _which("abcde"):
         raise RuntimeError("Missing required command for CD workflow: abcde")
 
     out_root = Path(music_dir).expanduser()
     out_root.mkdir(parents=True, exist_ok=True)
 
     year = (year_hint or "").strip()
-    if year and not re.fullmatch(r"\d{4}", year):
+    if year and not _YEAR4_RE.fullmatch(year):
         year = ""
 
     album_expr = "${ALBUMFILE}"
@@ -3516,13 +4849,16 @@ def run_cd_rip_with_abcde(*, music_dir: str, artist_hint: str = "", album_hint:
 
 
 
+# "(Unabridged)" markers (any case) and upper-case ASIN brackets like "[B0ABCDEFGH]".
+_AUDIBLE_NOISE_RE = re.compile(r"(?i:\(\s*unabridged\s*\))|\[[A-Z0-9]{8,}\]")
+
+
 def _sanitize_audible_name(value: str) -> str:
     s = (value or "").strip()
     if not s:
         return ""
-    s = re.sub(r"\(\s*unabridged\s*\)", "", s, flags=re.I)
-    s = re.sub(r"\[[A-Z0-9]{8,}\]", "", s)
-    s = re.sub(r"\s+", " ", s).strip(" .-_")
+    s = _AUDIBLE_NOISE_RE.sub("", s)
+    s = _WHITESPACE_RUN_RE.sub(" ", s).strip(" .-_")
     return s
 
 
@@ -3657,10 +4993,14 @@ def _run_audible_sync(*, books_dir: Path, command_template: str, username: str,
         raise RuntimeError(f"Audible sync command failed with exit code {cp.returncode}")
 
 
+# Characters that are unsafe in file names on common filesystems.
+_FS_BAD_CHARS_TABLE = str.maketrans({c: " " for c in '\\/:*?"<>|'})
+
+
 def _safe_path_component(value: str, *, fallback: str) -> str:
     v = _sanitize_audible_name(value)
-    v = re.sub(r'[\\/:*?"<>|]', " ", v)
-    v = re.sub(r"\s+", " ", v).strip(" .")
+    v = v.translate(_FS_BAD_CHARS_TABLE)
+    v = _WHITESPACE_RUN_RE.sub(" ", v).strip(" .")
     return v or fallback
 
 
@@ -3676,12 +5016,65 @@ def _unique_path(path: Path) -> Path:
         i += 1
 
 
+def _free_numbered_path(dir_path: Path, base: str, ext: str) -> Path:
+    """Return the first free `<base> (N)<ext>` path in `dir_path`, starting at 2.
+
+    The directory is listed once, so a folder full of earlier copies costs one
+    scan instead of one stat per taken name.
+    """
+
+    try:
+        with os.scandir(dir_path) as it:
+            taken = {entry.name for entry in it}
+    except OSError:
+        taken = set()
+    n = 2
+    while f"{base} ({n}){ext}" in taken:
+        n += 1
+    return dir_path / f"{base} ({n}){ext}"
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    # A hard link shares the bytes already on disk, so same-filesystem copies
+    # cost nothing. Cross-device or link-hostile filesystems fall back to copy2.
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+        shutil.copy2(src, dst)
+
+
+# Cover names in priority order; matched case-insensitively.
+_COVER_NAME_RANK = {name: rank for rank, name in enumerate(("cover.jpg", "cover.jpeg", "folder.jpg", "thumb.jpg"))}
+
+
 def _find_cover_image(dir_path: Path) -> Path | None:
-    for name in ["cover.jpg", "cover.jpeg", "folder.jpg", "Folder.jpg", "thumb.jpg"]:
-        p = dir_path / name
-        if p.exists() and p.is_file():
-            return p
-    return None
+    # One directory listing replaces a stat probe per candidate name.
+    best: tuple[int, str] | None = None
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                rank = _COVER_NAME_RANK.get(entry.name.lower())
+                if rank is None or (best is not None and rank >= best[0]):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                best = (rank, entry.name)
+                if rank == 0:
+                    break
+    except OSError:
+        return None
+    return dir_path / best[1] if best else None
+
+
+def _find_m4b_files(root: Path) -> list[Path]:
+    # Each book is handled on its own, so no sort is needed. Order follows the
+    # filesystem walk and may differ between machines.
+    return [p for p in root.rglob("*.m4b") if p.is_file()]
 
 
 def run_audiobook_workflow(
@@ -3712,8 +5105,7 @@ def run_audiobook_workflow(
 
     meta_idx = _load_audible_library_index(metadata_json) if metadata_json else {}
 
-    m4b_files = sorted(root.rglob("*.m4b"))
-    m4b_files = [p for p in m4b_files if p.is_file()]
+    m4b_files = _find_m4b_files(root)
     if not m4b_files:
         print(f"No .m4b files found under: {root}")
 
@@ -3742,10 +5134,11 @@ def run_audiobook_workflow(
         title = (meta.get("title") or title_guess or m4b.stem).strip()
         author = (meta.get("author") or "Unknown Author").strip() or "Unknown Author"
         year = (meta.get("year") or "").strip()
-        year = year if re.fullmatch(r"\d{4}", year) else ""
+        year = year if _YEAR4_RE.fullmatch(year) else ""
 
         author_dir_name = _safe_path_component(author, fallback="Unknown Author")
-        title_dir_name = _safe_path_component(title, fallback="Unknown Title")
+        title_component = _safe_path_component(title, fallback="Unknown Title")
+        title_dir_name = title_component
         if year:
             title_dir_name = f"{title_dir_name} ({year})"
 
@@ -3753,16 +5146,9 @@ def run_audiobook_workflow(
         target_dir = _unique_path(target_dir) if target_dir.exists() and m4b.parent.resolve() != target_dir.resolve() else target_dir
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        target_file = target_dir / (_safe_path_component(title, fallback="Unknown Title") + ".m4b")
+        target_file = target_dir / (title_component + ".m4b")
         if target_file.exists() and m4b.resolve() != target_file.resolve():
-            suffix = 2
-            base = _safe_path_component(title, fallback="Unknown Title")
-            while True:
-                cand = target_dir / f"{base} ({suffix}).m4b"
-                if not cand.exists():
-                    target_file = cand
-                    break
-                suffix += 1
+            target_file = _free_numbered_path(target_dir, title_component, ".m4b")
 
         if m4b.resolve() != target_file.resolve():
             m4b.rename(target_file)
@@ -3773,16 +5159,13 @@ def run_audiobook_workflow(
         if src_cover is not None:
             dest_cover = target_dir / "cover.jpg"
             if src_cover.resolve() != dest_cover.resolve() and not dest_cover.exists():
-                shutil.copy2(src_cover, dest_cover)
+                _link_or_copy(src_cover, dest_cover)
 
         cover = _find_cover_image(target_dir)
         cover_name = cover.name if cover else "cover.jpg"
 
         nfo_path = target_dir / "book.nfo"
-        nfo_path.write_text(
-            _render_book_nfo(title=title, cover_name=cover_name, meta=meta),
-            encoding="utf-8",
-        )
+        nfo_path.write_bytes(_render_book_nfo(title=title, cover_name=cover_name, meta=meta).encode("utf-8"))
         created += 1
 
     print(f"Audiobook workflow: library root is {library_root}")
@@ -3813,6 +5196,11 @@ def run_audiobook_workflow(
     print("Audiobook workflow complete.")
     return 0
 
+def _path_ident(path: Path) -> tuple[int, int]:
+    st = os.stat(path)
+    return (st.st_dev, st.st_ino)
+
+
 def cleanup_mkvs(home: Path, *, dry_run: bool, movies_dir: str, series_dir: str) -> int:
     """Conservatively remove *work directories* created by this script.
 
@@ -3831,18 +5219,21 @@ def cleanup_mkvs(home: Path, *, dry_run: bool, movies_dir: str, series_dir: str)
 
     # Best-effort guard to avoid deleting user-configured final storage
     # directories if they happen to live under $HOME.
-    exclude_roots: list[Path] = []
+    # Roots are matched by (device, inode), which also holds across symlinks
+    # and case-insensitive filesystems. A missing root cannot contain anything.
+    exclude_idents: set[tuple[int, int]] = set()
     for raw in (movies_dir, series_dir):
         if not raw:
             continue
         if is_remote_dest(raw):
             continue
         try:
-            exclude_roots.append(Path(raw).resolve())
-        except Exception:
-            pass
+            st = os.stat(raw)
+        except OSError:
+            continue
+        exclude_idents.add((st.st_dev, st.st_ino))
 
-    candidates: list[tuple[Path, bool, int]] = []
+    eligible: list[tuple[Path, bool]] = []
     try:
         children = list(home.iterdir())
     except Exception as e:
@@ -3857,9 +5248,12 @@ def cleanup_mkvs(home: Path, *, dry_run: bool, movies_dir: str, series_dir: str)
         if not mkv_root.is_dir():
             continue
 
-        marker_paths = [work_dir / name for name in WORKDIR_MARKER_NAMES]
-        has_marker = any(p.exists() for p in marker_paths)
-        legacy_hint = (work_dir / "Extras" / "extras.nfo").exists() or (work_dir / "__series_stage").exists()
+        # One listing answers all the marker checks.
+        names = _dir_names(work_dir)
+        has_marker = any(name in names for name in WORKDIR_MARKER_NAMES)
+        legacy_hint = "__series_stage" in names or (
+            "Extras" in names and (work_dir / "Extras" / "extras.nfo").exists()
+        )
         if not has_marker and not legacy_hint:
             continue
 
@@ -3868,18 +5262,35 @@ def cleanup_mkvs(home: Path, *, dry_run: bool, movies_dir: str, series_dir: str)
 
         # Never delete anything that is (or sits under) the configured local
         # Movies/Series directories.
-        try:
-            resolved = work_dir.resolve()
-            if any(str(resolved) == str(root) or str(resolved).startswith(str(root) + os.sep) for root in exclude_roots):
+        # Resolving costs a syscall per path, so skip it when nothing is excluded.
+        if exclude_idents:
+            try:
+                resolved = Path(os.path.realpath(os.fspath(work_dir)))
+                if any(_path_ident(p) in exclude_idents for p in (resolved, *resolved.parents)):
+                    continue
+            except OSError:
                 continue
-        except Exception:
-            continue
 
-        # Compute size for reporting (best-effort).
-        size_b = _dir_size_bytes(work_dir)
-        candidates.append((work_dir, has_marker, size_b))
+        eligible.append((work_dir, has_marker))
+
+    # Compute sizes for reporting (best-effort). Walking MKV trees is mostly
+    # waiting on stat calls, so several walks run at once.
+    if len(eligible) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(eligible))) as pool:
+            sizes = list(pool.map(_dir_size_bytes, [work_dir for work_dir, _has_marker in eligible]))
+    else:
+        sizes = [_dir_size_bytes(work_dir) for work_dir, _has_marker in eligible]
+    candidates = [(work_dir, has_marker, size_b) for (work_dir, has_marker), size_b in zip(eligible, sizes)]
+
+    # Finish deletes that an earlier run started but did not complete.
+    failures = sweep_trash_dirs(home, dry_run=dry_run)
 
     if not candidates:
+        if failures:
+            print(f"Failures: {failures}", file=sys.stderr)
+            return 1
         print("No managed MKV folders found to clean.")
         print("Hint: only work directories created by this script are eligible for cleanup.")
         return 0
@@ -3898,11 +5309,18 @@ def cleanup_mkvs(home: Path, *, dry_run: bool, movies_dir: str, series_dir: str)
         print("Dry run: nothing deleted.")
         return 0
 
+    # Every candidate passed the safety checks above; remove them with one
+    # rm run (or a few, for very long lists), then retry whatever is left one
+    # by one so failures still get a proper error message.
+    _rm_rf_many([work_dir for work_dir, _has_marker, _size_b in candidates])
+
     deleted = 0
-    failures = 0
     for work_dir, _has_marker, _size_b in candidates:
+        if not os.path.lexists(work_dir):
+            deleted += 1
+            continue
         try:
-            shutil.rmtree(work_dir)
+            _fast_rmtree(work_dir)
             deleted += 1
         except Exception as e:
             failures += 1
@@ -3930,6 +5348,7 @@ def main(argv: list[str]) -> int:
                 disc_device=ns.disc_device,
                 media_type=ns.tmdb_disc_media_type,
                 limit=ns.tmdb_limit,
+                refresh=ns.refresh_tmdb,
             )
             print(json.dumps(payload, ensure_ascii=False))
             return 0
@@ -3945,6 +5364,7 @@ def main(argv: list[str]) -> int:
                 year=ns.tmdb_year,
                 media_type=ns.tmdb_media_type,
                 limit=ns.tmdb_limit,
+                refresh=ns.refresh_tmdb,
             )
             print(json.dumps({"query": ns.tmdb_search, "results": matches}, ensure_ascii=False))
             return 0
@@ -4010,7 +5430,7 @@ def main(argv: list[str]) -> int:
 
     # Screen bootstrap.
     if not os.environ.get("RIP_AND_ENCODE_IN_SCREEN") and not os.environ.get("STY"):
-        if not shutil.which("screen"):
+        if not _which("screen"):
             print("Missing required command: screen", file=sys.stderr)
             print(f"Debian hint: {debian_install_hint('screen')}", file=sys.stderr)
             return 127
@@ -4023,13 +5443,23 @@ def main(argv: list[str]) -> int:
     log_dir = _ensure_log_dir(home_base)
     log_file = log_dir / f"rip_and_encode_{time.strftime('%Y%m%d_%H%M%S')}.log"
     try:
-        rotate_logs(log_dir, keep=30, compress=True, exclude=log_file)
+        rotate_logs_in_background(log_dir, keep=30, compress=True, exclude=log_file)
     except Exception:
         pass
-    log_fh = log_file.open("a", encoding="utf-8")
-
-    sys.stdout = Tee(sys.__stdout__, log_fh)  # type: ignore[assignment]
-    sys.stderr = Tee(sys.__stderr__, log_fh)  # type: ignore[assignment]
+    try:
+        sweep_trash_dirs_in_background(home_base)
+    except Exception:
+        pass
+    # Line buffered so the GUI can tail the log while the run is going.
+    try:
+        sys.__stdout__.reconfigure(line_buffering=True)  # type: ignore[union-attr]
+    except Exception:
+        pass
+    log_tee = _start_log_tee(log_file)
+    if log_tee is None:
+        log_fh = log_file.open("a", encoding="utf-8", buffering=1)
+        sys.stdout = Tee(sys.__stdout__, log_fh)  # type: ignore[assignment]
+        sys.stderr = Tee(sys.__stderr__, log_fh)  # type: ignore[assignment]
 
     print(f"Log file: {log_file}")
 
@@ -4056,11 +5486,14 @@ def main(argv: list[str]) -> int:
     failsafe = FailSafe()
 
     makemkv_cache_mb = 1024 if (getattr(ns, "disc_type", "dvd") == "bluray") else 512
+    auto_next_device = ns.disc_device if getattr(ns, "auto_next", False) else ""
 
     def _handle_sigint(signum, frame):
         failsafe.mark_failed()
         print("\nInterrupted. Leaving files in place for resume.", file=sys.stderr)
         print(f"Log: {log_file}", file=sys.stderr)
+        sys.stdout.flush()
+        sys.stderr.flush()
         raise KeyboardInterrupt
 
     signal.signal(signal.SIGINT, _handle_sigint)
@@ -4068,12 +5501,10 @@ def main(argv: list[str]) -> int:
 
     # Fail fast deps.
     try:
-        which_required("screen")
-        for cmd in ["awk", "eject", "ffprobe", "ffmpeg", "find", "grep", "HandBrakeCLI", "makemkvcon", "sed", "sort", "stdbuf", "tr", "wc", "tee", "date", "id"]:
-            which_required(cmd)
+        required = ["screen", "awk", "eject", "ffprobe", "ffmpeg", "find", "grep", "HandBrakeCLI", "makemkvcon", "sed", "sort", "stdbuf", "tr", "wc", "tee", "date", "id"]
         if is_remote_dest(ns.movies_dir) or is_remote_dest(ns.series_dir):
-            which_required("ssh")
-            which_required("scp")
+            required.extend(["ssh", "scp"])
+        which_required_all(required)
     except RuntimeError as e:
         print(str(e), file=sys.stderr)
         return 127
@@ -4116,14 +5547,20 @@ def main(argv: list[str]) -> int:
         print(str(e), file=sys.stderr)
         return 2
 
+    # Destinations are fixed for the whole run, so resolve the local
+    # filesystems to watch for free space once.
+    disk_targets = _disk_targets_for_run(home_base=home_base, movies_dir=ns.movies_dir, series_dir=ns.series_dir)
+
     # Encode submission.
     executor = None
     futures: list = []
 
-    encode_stats_lock = Lock()
+    # Encode counters. `next()` on itertools.count is atomic in CPython, so
+    # worker threads can bump them without a lock. Only the main thread
+    # queues encodes, so the queued total is a plain int.
     encode_queued = 0
-    encode_started = 0
-    encode_finished = 0
+    encode_started_ctr = itertools.count(1)
+    encode_finished_ctr = itertools.count(1)
 
     if ns.overlap:
         from concurrent.futures import ThreadPoolExecutor
@@ -4131,127 +5568,88 @@ def main(argv: list[str]) -> int:
         executor = ThreadPoolExecutor(max_workers=ns.encode_jobs)
 
     def submit_encode(input_: Path, output: Path, preset: str, subtitle_mode: str) -> None:
-        nonlocal encode_queued, encode_started, encode_finished
+        nonlocal encode_queued
         if output.exists():
             print(f"Skipping encode (exists): {output}")
             return
 
-        with encode_stats_lock:
-            encode_queued += 1
-            queued_now = encode_queued
+        encode_queued += 1
 
         if not ns.overlap:
             print(f"Queued encode: {output.name}")
-            with encode_stats_lock:
-                encode_started += 1
-                started_now = encode_started
-                queued_snap = encode_queued
-            print(f"HandBrake start: {started_now}/{queued_snap}: {output.name}")
+            print(f"HandBrake start: {next(encode_started_ctr)}/{encode_queued}: {output.name}")
             hb_encode(input_, output, preset, subtitle_mode=subtitle_mode)
-            with encode_stats_lock:
-                encode_finished += 1
-                finished_now = encode_finished
-                queued_snap2 = encode_queued
-            print(f"HandBrake done: {finished_now}/{queued_snap2}: {output.name}")
+            print(f"HandBrake done: {next(encode_finished_ctr)}/{encode_queued}: {output.name}")
             return
 
         assert executor is not None
         lock = encode_lock_path(output)
-        create_lock_or_fail(lock)
+        # Hold the lock with our own PID while the job is queued, so it is not
+        # mistaken for a stale lock. The job swaps in the HandBrake PID.
+        create_lock_or_fail(lock, f"{os.getpid()}\n".encode("ascii"))
 
         def _job() -> None:
-            nonlocal encode_started, encode_finished, encode_queued
-            with encode_stats_lock:
-                encode_started += 1
-                started_now = encode_started
-                queued_snap = encode_queued
-            print(f"HandBrake start: {started_now}/{queued_snap}: {output.name}")
-
-            proc = subprocess.Popen(
-                ["HandBrakeCLI", "-i", str(input_), "-o", str(output), "--preset", preset, *handbrake_subtitle_args(subtitle_mode)],
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=0,
-            )
-            try:
-                lock.write_text(str(proc.pid) + "\n", encoding="utf-8")
-            except Exception:
-                pass
-
-            # Convert HandBrake carriage-return progress into newline-friendly lines.
-            assert proc.stdout is not None
-            buf = ""
-            last_pct_int: Optional[int] = None
-            last_emit = 0.0
-            suppressed_probe_noise = False
-
-            def should_emit(line: str) -> bool:
-                nonlocal last_pct_int, last_emit
-                m = re.search(r"Encoding:.*?\s*([0-9]{1,3}(?:\.[0-9]+)?)\s*%", line)
-                if not m:
-                    return True
-                try:
-                    pct = float(m.group(1))
-                except Exception:
-                    return True
-                pct_i = int(pct)
-                now = time.time()
-                if last_pct_int is None or pct_i != last_pct_int or (now - last_emit) >= 2.0:
-                    last_pct_int = pct_i
-                    last_emit = now
-                    return True
-                return False
-
-            while True:
-                ch = proc.stdout.read(1)
-                if ch == "" and proc.poll() is not None:
-                    break
-                if ch in ("\r", "\n"):
-                    line = buf.strip()
-                    buf = ""
-                    if line and should_emit(line):
-                        if _is_benign_handbrake_scan_line(line):
-                            suppressed_probe_noise = True
-                        else:
-                            print(line)
-                    continue
-                buf += ch
-
-            tail = buf.strip()
-            if tail and should_emit(tail):
-                if _is_benign_handbrake_scan_line(tail):
-                    suppressed_probe_noise = True
-                else:
-                    print(tail)
-
-            if suppressed_probe_noise:
-                print("HandBrake note: suppressed known probe noise for non-disc input.")
-
-            code = proc.wait()
-            try:
-                lock.unlink(missing_ok=True)
-            except Exception:
-                pass
-            if code != 0:
-                raise RuntimeError(f"HandBrakeCLI failed (exit {code}) for output: {output}")
-
-            _refresh_mp4_quality_metadata(output, preset)
-
-            with encode_stats_lock:
-                encode_finished += 1
-                finished_now = encode_finished
-                queued_snap2 = encode_queued
-            print(f"HandBrake done: {finished_now}/{queued_snap2}: {output.name}")
-
-        futures.append(executor.submit(_job))
+            print(f"HandBrake start: {next(encode_started_ctr)}/{encode_queued}: {output.name}")
+            _run_handbrake_job(input_, output, preset, subtitle_mode, lock)
+            print(f"HandBrake done: {next(encode_finished_ctr)}/{encode_queued}: {output.name}")
+
+        fut = executor.submit(_job)
+        futures.append(fut)
+        if encode_owner is not None:
+            work_dir_futures.setdefault(encode_owner, []).append(fut)
         print(f"Queued encode: {output.name}")
 
     # Batch tracking for finalize.
     batch_seen: set[str] = set()
     batch: list[TitleContext] = []
+    finalized: set[str] = set()
+    finalize_pool = None
+    finalize_futures: list[Future] = []
+    # Overlap encodes grouped by the work directory they read from, so a
+    # finished title can be finalized while later discs are still ripping.
+    encode_owner: Optional[Path] = None
+    work_dir_futures: dict[Path, list[Future]] = {}
     tmdb_runtime_cache: dict[tuple[str, str], Optional[int]] = {}
+    tmdb_runtime_store = JsonFileCache(_app_cache_dir(home_base) / "tmdb_runtime.json", ttl_s=TMDB_RUNTIME_CACHE_TTL_S)
+
+    tmdb_runtime_prefetch: dict[tuple[str, str], Future] = {}
+    tmdb_prefetch_pool = None
+
+    def _lookup_tmdb_runtime(title_raw: str, year: str) -> Optional[int]:
+        # Check the on-disk cache before asking TMDB. Only real runtimes
+        # are stored, so a failed lookup is retried on the next run.
+        store_key = "|".join((title_raw.strip().lower(), year.strip()))
+        hit, stored = tmdb_runtime_store.get(store_key)
+        if hit and isinstance(stored, int) and stored > 0:
+            return stored
+        runtime_min = tmdb_movie_runtime_minutes(
+            api_key=getattr(ns, "tmdb_api_key", ""),
+            title=title_raw,
+            year=year,
+        )
+        if runtime_min:
+            tmdb_runtime_store.put(store_key, runtime_min)
+        return runtime_min
+
+    def _prefetch_tmdb_runtimes(rows: list[ScheduleRow]) -> None:
+        nonlocal tmdb_prefetch_pool
+        if not (getattr(ns, "tmdb_api_key", "") or "").strip():
+            return
+        pending: dict[tuple[str, str], ScheduleRow] = {}
+        for row in rows:
+            # Only the first disc of a movie runs the runtime check.
+            if row.kind != "movie" or row.disc != 1:
+                continue
+            pending.setdefault((row.name.strip().lower(), row.year.strip()), row)
+        if not pending:
+            return
+
+        # Lookups are network-bound, so run them alongside the first rip.
+        from concurrent.futures import ThreadPoolExecutor
+
+        tmdb_prefetch_pool = ThreadPoolExecutor(max_workers=min(8, len(pending)))
+        for key, row in pending.items():
+            tmdb_runtime_prefetch[key] = tmdb_prefetch_pool.submit(_lookup_tmdb_runtime, row.name, row.year)
 
     def _movie_disc_validator_for_ctx(ctx: TitleContext, disc_index: int):
         if ctx.is_series or disc_index != 1:
@@ -4264,11 +5662,14 @@ def main(argv: list[str]) -> int:
             if cache_key in tmdb_runtime_cache:
                 runtime_min = tmdb_runtime_cache[cache_key]
             else:
-                runtime_min = tmdb_movie_runtime_minutes(
-                    api_key=getattr(ns, "tmdb_api_key", ""),
-                    title=ctx.title_raw,
-                    year=ctx.year,
-                )
+                prefetched = tmdb_runtime_prefetch.get(cache_key)
+                if prefetched is not None:
+                    try:
+                        runtime_min = prefetched.result()
+                    except Exception:
+                        runtime_min = None
+                else:
+                    runtime_min = _lookup_tmdb_runtime(ctx.title_raw, ctx.year)
                 tmdb_runtime_cache[cache_key] = runtime_min
                 if runtime_min:
                     print(f"TMDB runtime check: expected runtime for '{ctx.title_raw}' is {runtime_min} min.")
@@ -4279,20 +5680,87 @@ def main(argv: list[str]) -> int:
 
         return _validator
 
-    def batch_key(ctx: TitleContext) -> str:
-        if ctx.is_series:
-            return f"S|{ctx.title}|{ctx.year}|{ctx.season_pad}"
-        return f"M|{ctx.title}|{ctx.year}"
+    # Schedules often list several discs or titles for the same title; reuse
+    # its context instead of redoing the mkdir/marker/NFO setup per row.
+    schedule_ctx_cache: dict[tuple, TitleContext] = {}
+
+    def schedule_title_context(
+        title_raw: str, year: str, is_series: bool, season: Optional[int], movie_multi_disc: bool
+    ) -> TitleContext:
+        key = (title_raw, year, is_series, season, movie_multi_disc)
+        ctx = schedule_ctx_cache.get(key)
+        if ctx is None:
+            ctx = setup_title_context(
+                home=home,
+                home_base=home_base,
+                title_raw=title_raw,
+                year=year,
+                is_series=is_series,
+                season=season,
+                movie_multi_disc=movie_multi_disc,
+                movies_dir=ns.movies_dir,
+                series_dir=ns.series_dir,
+                output_ext=ns.output_container,
+            )
+            schedule_ctx_cache[key] = ctx
+        return ctx
 
     def batch_add_once(ctx: TitleContext) -> None:
-        key = batch_key(ctx)
+        key = ctx.batch_key
         if key in batch_seen:
             return
         batch_seen.add(key)
         batch.append(ctx)
 
+    def finalize_title(ctx: TitleContext) -> None:
+        print(f"Finalizing: {ctx.title} ({ctx.year})")
+        if ctx.is_series:
+            if ctx.remote_series:
+                assert ctx.output_season_dir is not None
+                remote_sync_series_season(
+                    ns.series_dir, ctx.title, ctx.output_season_dir, compress=ns.compress_transfer
+                )
+                # The staged copy lives in the work dir; deleting that frees
+                # its page cache too, so only evict it when it is kept.
+                if keep_mkvs:
+                    _drop_pagecache_tree(ctx.output_season_dir)
+        else:
+            if ctx.remote_movies:
+                assert ctx.output_movie_dir is not None
+                remote_sync_movie_folder(
+                    ns.movies_dir, ctx.title, ctx.year, ctx.output_movie_dir, compress=ns.compress_transfer
+                )
+                if keep_mkvs:
+                    _drop_pagecache_tree(ctx.output_movie_dir)
+
+        # Removing the work dir removes MKVs/ with it, in one background delete.
+        rm_work_dir_if_allowed(home, ctx.work_dir, keep_mkvs, failsafe=failsafe)
+
+    def finalize_work_dir_in_background(work_dir: Path) -> None:
+        """Copy/clean up every title in `work_dir` once its encodes finish.
+
+        Only call this when no later disc in the run uses `work_dir`.
+        """
+
+        nonlocal finalize_pool
+        if executor is None:
+            return
+        ctxs = [c for c in batch if c.work_dir == work_dir and c.batch_key not in finalized]
+        if not ctxs:
+            return
+        finalized.update(c.batch_key for c in ctxs)
+        pending = work_dir_futures.pop(work_dir, [])
+
+        if finalize_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            finalize_pool = ThreadPoolExecutor(max_workers=2)
+        finalize_futures.append(finalize_pool.submit(_finalize_after_encodes, pending, ctxs, failsafe, finalize_title))
+
     if ns.continuous:
-        print("Continuous mode enabled: keep feeding discs; copy/cleanup runs after all encodes finish.")
+        # Schedule runs say how they finalize once the schedule is loaded.
+        if not csv_path:
+            print("Continuous mode enabled: keep feeding discs; copy/cleanup runs after all encodes finish.")
 
     try:
         if csv_path:
@@ -4300,6 +5768,7 @@ def main(argv: list[str]) -> int:
             if parsed.version == 2:
                 schedule_v2 = parsed.rows_v2
                 print(f"Schedule v2 loaded: {len(schedule_v2)} title selections")
+                print("Continuous mode enabled: keep feeding discs; copy/cleanup runs after all encodes finish.")
 
                 by_disc: dict[tuple[str, int], list[ScheduleV2Row]] = {}
                 disc_order: list[tuple[str, int]] = []
@@ -4323,18 +5792,7 @@ def main(argv: list[str]) -> int:
 
                     selections: list[tuple[ScheduleV2Row, TitleContext]] = []
                     for row in disc_rows:
-                        ctx = setup_title_context(
-                            home=home,
-                            home_base=home_base,
-                            title_raw=row.movie_title,
-                            year=row.year,
-                            is_series=False,
-                            season=None,
-                            movie_multi_disc=False,
-                            movies_dir=ns.movies_dir,
-                            series_dir=ns.series_dir,
-                            output_ext=ns.output_container,
-                        )
+                        ctx = schedule_title_context(row.movie_title, row.year, False, None, False)
                         batch_add_once(ctx)
                         selections.append((row, ctx))
 
@@ -4379,6 +5837,7 @@ def main(argv: list[str]) -> int:
                                 wait_for_enter=not csv_next_confirmed,
                                 makemkv_cache_mb=makemkv_cache_mb,
                                 validate_rip=_selected_validator,
+                                disc_device=auto_next_device,
                             )
                             per_title_rip[row.source_title_index] = True
                         except Exception as e:
@@ -4482,25 +5941,29 @@ def main(argv: list[str]) -> int:
                         )
 
                     if idx + 1 < len(disc_order):
-                        pause_if_low_disk_space(
-                            paths=_disk_targets_for_run(
-                                home_base=home_base,
-                                movies_dir=ns.movies_dir,
-                                series_dir=ns.series_dir,
-                            ),
-                            min_free_gb=20,
-                        )
+                        pause_if_low_disk_space(paths=disk_targets, min_free_gb=20)
                         if not ns.no_disc_prompts:
                             next_disc_id, next_disc_num = disc_order[idx + 1]
                             print(f"Next up: disc {next_disc_num} ({next_disc_id})")
                             print("When the next disc is inserted, press Enter to start ripping... ")
-                            input()
+                            wait_for_next_disc(auto_next_device)
                             csv_next_confirmed = True
                         else:
                             csv_next_confirmed = True
             else:
                 schedule = parsed.rows_v1
                 print(f"CSV schedule loaded: {len(schedule)} discs")
+                print(
+                    "Continuous mode enabled: keep feeding discs; each title is copied/cleaned up "
+                    "in the background once its last disc has finished encoding."
+                )
+                _prefetch_tmdb_runtimes(schedule)
+
+                # Last schedule row that uses each work directory. After that
+                # row, the title can be finalized while later discs rip.
+                last_row_for_work_dir = {
+                    f"{sanitize_title_for_dir(r.name)} ({r.year})": i for i, r in enumerate(schedule)
+                }
 
                 csv_next_confirmed = bool(ns.no_disc_prompts)
                 for idx, row in enumerate(schedule):
@@ -4514,19 +5977,9 @@ def main(argv: list[str]) -> int:
                         season = int(row.third)
                         movie_multi = False
 
-                    ctx = setup_title_context(
-                        home=home,
-                        home_base=home_base,
-                        title_raw=row.name,
-                        year=row.year,
-                        is_series=is_series,
-                        season=season,
-                        movie_multi_disc=movie_multi,
-                        movies_dir=ns.movies_dir,
-                        series_dir=ns.series_dir,
-                        output_ext=ns.output_container,
-                    )
+                    ctx = schedule_title_context(row.name, row.year, is_series, season, movie_multi)
                     batch_add_once(ctx)
+                    encode_owner = ctx.work_dir
 
                     disc_dir = ctx.mkv_root / f"Disc{row.disc:02d}"
                     prompt_msg = csv_disc_prompt_for_row(row)
@@ -4534,11 +5987,12 @@ def main(argv: list[str]) -> int:
                     # CSV restart support: if the work directory was cleaned but output files
                     # already exist, skip re-ripping movie discs to avoid starting over.
                     # (Series discs are not safely attributable without the per-disc manifest.)
+                    # Cheapest checks first; the MKV walk only runs when outputs exist.
                     if (
                         row.kind == "movie"
-                        and not find_mkvs_in_dir(disc_dir)
-                        and _movie_disc_outputs_exist(ctx, row.disc, ns.output_container)
                         and not csv_next_confirmed
+                        and _movie_disc_outputs_exist(ctx, row.disc, ns.output_container)
+                        and not find_mkvs_in_dir(disc_dir)
                     ):
                         print(
                             f"Resume: outputs already exist; skipping rip/encode: {ctx.title} ({ctx.year}) disc {row.disc}"
@@ -4552,6 +6006,7 @@ def main(argv: list[str]) -> int:
                                 wait_for_enter=not csv_next_confirmed,
                                 makemkv_cache_mb=makemkv_cache_mb,
                                 validate_rip=_movie_disc_validator_for_ctx(ctx, row.disc),
+                                disc_device=auto_next_device,
                             )
                         except Exception as e:
                             print(
@@ -4583,21 +6038,18 @@ def main(argv: list[str]) -> int:
                                 submit_encode=submit_encode,
                             )
 
+                    encode_owner = None
+                    if last_row_for_work_dir.get(ctx.work_dir.name) == idx:
+                        finalize_work_dir_in_background(ctx.work_dir)
+
                     if idx + 1 < len(schedule):
                         # Before prompting for the next disc, ensure we have enough free space
                         # on the filesystem(s) where we are storing MKVs and writing encoded outputs.
-                        pause_if_low_disk_space(
-                            paths=_disk_targets_for_run(
-                                home_base=home_base,
-                                movies_dir=ns.movies_dir,
-                                series_dir=ns.series_dir,
-                            ),
-                            min_free_gb=20,
-                        )
+                        pause_if_low_disk_space(paths=disk_targets, min_free_gb=20)
                         if not ns.no_disc_prompts:
                             csv_next_up_note(schedule[idx + 1])
                             print("When the next disc is inserted, press Enter to start ripping... ")
-                            input()
+                            wait_for_next_disc(auto_next_device)
                             csv_next_confirmed = True
                         else:
                             csv_next_confirmed = True
@@ -4638,6 +6090,7 @@ def main(argv: list[str]) -> int:
                         wait_for_enter=True,
                         makemkv_cache_mb=makemkv_cache_mb,
                         validate_rip=_movie_disc_validator_for_ctx(ctx, disc_index),
+                        disc_device=auto_next_device,
                     )
 
                     if ctx.is_series:
@@ -4695,20 +6148,19 @@ def main(argv: list[str]) -> int:
             for fut in as_completed(futures):
                 fut.result()
 
-        # Finalize: copy/cleanup.
+        # Finalize: copy/cleanup. Titles already handed to the background
+        # finalizer only need to be waited on here.
+        for fut in finalize_futures:
+            fut.result()
         for ctx in batch:
-            print(f"Finalizing: {ctx.title} ({ctx.year})")
-            if ctx.is_series:
-                if ctx.remote_series:
-                    assert ctx.output_season_dir is not None
-                    remote_sync_series_season(ns.series_dir, ctx.title, ctx.output_season_dir)
-            else:
-                if ctx.remote_movies:
-                    assert ctx.output_movie_dir is not None
-                    remote_sync_movie_folder(ns.movies_dir, ctx.title, ctx.year, ctx.output_movie_dir)
+            if ctx.batch_key not in finalized:
+                finalize_title(ctx)
 
-            rm_mkvs_tree_if_allowed(home, ctx.work_dir, ctx.mkv_root, keep_mkvs)
-            rm_work_dir_if_allowed(home, ctx.work_dir, keep_mkvs)
+        # Work dirs are deleted in the background; a failed delete still fails the run.
+        failures = wait_for_background_deletes()
+        if failures:
+            print(f"Failures: {failures}", file=sys.stderr)
+            return 1
 
         print("Processing complete.")
         return 0
@@ -4727,10 +6179,27 @@ def main(argv: list[str]) -> int:
         return 2
     finally:
         if executor:
-            executor.shutdown(wait=False, cancel_futures=False)
+            if failsafe.failed:
+                # Do not leave orphaned HandBrake processes behind; their
+                # jobs exit (and drop their locks) once HandBrake stops.
+                stopped = terminate_running_encodes()
+                if stopped:
+                    print(f"Stopped {stopped} running HandBrake encode(s).", file=sys.stderr)
+            executor.shutdown(wait=failsafe.failed, cancel_futures=failsafe.failed)
+        if tmdb_prefetch_pool:
+            tmdb_prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        if finalize_pool:
+            # After a failure, let in-flight finalize jobs see it and stop
+            # before saying the files were left in place.
+            finalize_pool.shutdown(wait=failsafe.failed, cancel_futures=True)
         if failsafe.failed:
             print("\nExiting after an error. Files were left in place (safe mode).", file=sys.stderr)
             print(f"Log: {log_file}", file=sys.stderr)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for stream in (sys.stdout, sys.stderr):
+            if isinstance(stream, Tee):
+                stream.close()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,9 @@ from __future__ import annotations
 from archive_helper_core._legacy_rip_and_encode_server import (
     _extract_meta_author,
     _find_cover_image,
+    _find_m4b_files,
+    _free_numbered_path,
+    _link_or_copy,
     _load_audible_library_index,
     _normalize_key,
     _render_book_nfo,
@@ -26,4 +29,7 @@ __all__ = [
     "_safe_path_component",
     "_unique_path",
     "_find_cover_image",
+    "_find_m4b_files",
+    "_free_numbered_path",
+    "_link_or_copy",
 ]
@@ -8,6 +8,8 @@ from archive_helper_core._legacy_rip_and_encode_server import (
     pause_if_low_disk_space,
     rm_mkvs_tree_if_allowed,
     rm_work_dir_if_allowed,
+    sweep_trash_dirs,
+    wait_for_background_deletes,
 )
 
 __all__ = [
@@ -16,4 +18,6 @@ __all__ = [
     "rm_work_dir_if_allowed",
     "is_safe_work_dir",
     "pause_if_low_disk_space",
+    "sweep_trash_dirs",
+    "wait_for_background_deletes",
 ]
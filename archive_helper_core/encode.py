@@ -9,6 +9,7 @@ from archive_helper_core._legacy_rip_and_encode_server import (
     _preset_target_height,
     _refresh_mp4_quality_metadata,
     _resolution_label_from_height,
+    _run_handbrake_job,
     _subtitle_output_path,
     create_lock_or_fail,
     encode_lock_path,
@@ -19,11 +20,15 @@ from archive_helper_core._legacy_rip_and_encode_server import (
     hb_encode_with_progress,
     lock_is_stale_or_clear,
     rotate_logs,
+    rotate_logs_in_background,
+    terminate_running_encodes,
 )
 
 __all__ = [
     "hb_encode",
     "hb_encode_with_progress",
+    "_run_handbrake_job",
+    "terminate_running_encodes",
     "extract_external_subtitles",
     "handbrake_subtitle_args",
     "ffprobe_subtitle_streams",
@@ -38,4 +43,5 @@ __all__ = [
     "_ensure_log_dir",
     "_gzip_compress",
     "rotate_logs",
+    "rotate_logs_in_background",
 ]
@@ -6,6 +6,8 @@ from archive_helper_core._legacy_rip_and_encode_server import (
     _ffprobe_video_dimensions,
     ffprobe_chapter_count,
     ffprobe_duration_seconds,
+    ffprobe_meta_bundle,
+    ffprobe_meta_bundles,
     ffprobe_meta_title,
     file_size_mb,
 )
@@ -14,6 +16,8 @@ __all__ = [
     "ffprobe_meta_title",
     "ffprobe_duration_seconds",
     "ffprobe_chapter_count",
+    "ffprobe_meta_bundle",
+    "ffprobe_meta_bundles",
     "file_size_mb",
     "_ffprobe_video_dimensions",
 ]
@@ -14,8 +14,10 @@ from archive_helper_core._legacy_rip_and_encode_server import (
     prompt_year,
     prompt_yes_no,
     remote_copy_dir_into,
+    remote_copy_dirs_into,
     remote_exec,
     remote_exists,
+    remote_exists_many,
     remote_host_part,
     remote_path_part,
     remote_preflight_dir,
@@ -32,7 +34,9 @@ __all__ = [
     "remote_exec",
     "remote_preflight_dir",
     "remote_exists",
+    "remote_exists_many",
     "remote_copy_dir_into",
+    "remote_copy_dirs_into",
     "ssh_config_file",
     "ensure_ssh_dir",
     "ssh_config_has_host",
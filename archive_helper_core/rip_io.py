@@ -10,6 +10,7 @@ from archive_helper_core._legacy_rip_and_encode_server import (
     map_selected_title_indexes_to_mkvs,
     rip_disc_if_needed,
     run_makemkv_with_progress_to_dir,
+    wait_for_next_disc,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "find_mkvs_in_dir",
     "map_selected_title_indexes_to_mkvs",
     "rip_disc_if_needed",
+    "wait_for_next_disc",
 ]
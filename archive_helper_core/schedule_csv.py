@@ -12,15 +12,20 @@ def trim_ws(s: str) -> str:
     return s.strip()
 
 
+_YES_VALUES = frozenset({"y", "yes", "true"})
+_NO_VALUES = frozenset({"n", "no", "false"})
+
+
 def is_bool_yn(s: str) -> bool:
-    return s.strip().lower() in {"y", "n", "yes", "no", "true", "false"}
+    v = s.strip().lower()
+    return v in _YES_VALUES or v in _NO_VALUES
 
 
 def normalize_bool_yn(s: str) -> str:
     v = s.strip().lower()
-    if v in {"y", "yes", "true"}:
+    if v in _YES_VALUES:
         return "y"
-    if v in {"n", "no", "false"}:
+    if v in _NO_VALUES:
         return "n"
     return ""
 
@@ -68,9 +73,12 @@ def normalize_title(raw: str, *, item_label: str) -> str:
     return title
 
 
+_YEAR_RE = re.compile(r"\d{4}")
+
+
 def normalize_year(raw: str, *, item_label: str) -> str:
     year = str(raw or "").strip()
-    if not re.fullmatch(r"\d{4}", year):
+    if not _YEAR_RE.fullmatch(year):
         raise RuntimeError(f"Schedule validation error at {item_label}: year must be 4 digits")
     return year
 
@@ -259,6 +267,9 @@ def load_schedule(file: Path) -> ParsedSchedule:
     return ParsedSchedule(version=1, rows_v1=rows_v1, rows_v2=[])
 
 
+_CSV_HEADER_RE = re.compile(r"^\s*(movie|series)?\s*name\s*,\s*year\s*,", re.I)
+
+
 def _load_csv_schedule_v1_from_lines(lines: list[str], file: Path) -> list[ScheduleRow]:
     rows: list[ScheduleRow] = []
 
@@ -273,10 +284,10 @@ def _load_csv_schedule_v1_from_lines(lines: list[str], file: Path) -> list[Sched
             continue
 
         # Skip common header rows.
-        if re.match(r"^\s*(movie|series)?\s*name\s*,\s*year\s*,", line, flags=re.I):
+        if _CSV_HEADER_RE.match(line):
             continue
 
-        parts = [trim_ws(p) for p in line.split(",")]
+        parts = [p.strip() for p in line.split(",")]
         if len(parts) != 4 or any(p == "" for p in parts[:4]):
             raise RuntimeError(
                 f"CSV parse error at line {n}: expected exactly 4 comma-separated columns\n  Line: {line}"
@@ -292,13 +303,9 @@ def _load_csv_schedule_v1_from_lines(lines: list[str], file: Path) -> list[Sched
             )
         disc = int(disc_s)
 
-        if is_bool_yn(third):
+        third_n = normalize_bool_yn(third)
+        if third_n:
             kind = "movie"
-            third_n = normalize_bool_yn(third)
-            if not third_n:
-                raise RuntimeError(
-                    f"CSV validation error at line {n}: MultiDisc must be y/n\n  Line: {line}"
-                )
             third = third_n
         else:
             kind = "series"
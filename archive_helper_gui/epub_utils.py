@@ -3,25 +3,70 @@ from __future__ import annotations
 import re
 import xml.etree.ElementTree as ET
 import zipfile
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 
+_WS_RE = re.compile(r"\s+")
+_YEAR_RE = re.compile(r"(\d{4})")
+
+_DC = "{http://purl.org/dc/elements/1.1/}"
+# OPF elements we read, mapped to the slot they fill. Creators win over
+# contributors for the author, whatever order they appear in.
+_OPF_FIELDS = {
+    f"{_DC}title": "title",
+    f"{_DC}creator": "creator",
+    f"{_DC}contributor": "contributor",
+    f"{_DC}date": "date",
+}
+
 
 def _clean(value: str) -> str:
-    return re.sub(r"\s+", " ", (value or "")).strip()
+    return _WS_RE.sub(" ", (value or "")).strip()
+
+
+def _scan_opf(opf_raw: bytes) -> dict[str, str]:
+    """First non-empty title/creator/contributor/date, in one streaming pass.
 
+    Stops as soon as title, creator and date are known, so the (often large)
+    manifest after the metadata block is never parsed.
+    """
 
-def _first_text(root: ET.Element, paths: list[str], ns: dict[str, str]) -> str:
-    for path in paths:
-        node = root.find(path, ns)
-        if node is not None and node.text:
-            txt = _clean(node.text)
-            if txt:
-                return txt
-    return ""
+    found = {"title": "", "creator": "", "contributor": "", "date": ""}
+    for _event, elem in ET.iterparse(BytesIO(opf_raw), events=("end",)):
+        slot = _OPF_FIELDS.get(elem.tag)
+        if slot and not found[slot] and elem.text:
+            found[slot] = _clean(elem.text)
+            if found["title"] and found["creator"] and found["date"]:
+                break
+        elem.clear()
+    return found
 
 
 def extract_epub_metadata(epub_path: Path) -> dict[str, str]:
-    """Best-effort metadata extraction for title/author/year from an EPUB file."""
+    """Best-effort metadata extraction for title/author/year from an EPUB file.
+
+    Results are cached by (path, mtime, size), so picking the same file again
+    does not reopen it; `extract_epub_metadata.cache_clear()` forgets them.
+    """
+    try:
+        st = Path(epub_path).stat()
+    except OSError:
+        return {"title": "", "author": "", "year": ""}
+    title, author, year = _extract_epub_metadata_cached(str(epub_path), st.st_mtime_ns, st.st_size)
+    return {"title": title, "author": author, "year": year}
+
+
+@lru_cache(maxsize=4096)
+def _extract_epub_metadata_cached(epub_path: str, _mtime_ns: int, _size: int) -> tuple[str, str, str]:
+    metadata = _read_epub_metadata(Path(epub_path))
+    return (metadata["title"], metadata["author"], metadata["year"])
+
+
+extract_epub_metadata.cache_clear = _extract_epub_metadata_cached.cache_clear  # type: ignore[attr-defined]
+
+
+def _read_epub_metadata(epub_path: Path) -> dict[str, str]:
     metadata = {"title": "", "author": "", "year": ""}
     try:
         with zipfile.ZipFile(epub_path, "r") as zf:
@@ -35,28 +80,11 @@ def extract_epub_metadata(epub_path: Path) -> dict[str, str]:
             if not opf_path:
                 return metadata
 
-            opf_raw = zf.read(opf_path)
-            opf_root = ET.fromstring(opf_raw)
-            ns = {
-                "opf": "http://www.idpf.org/2007/opf",
-                "dc": "http://purl.org/dc/elements/1.1/",
-            }
-
-            title = _first_text(opf_root, [".//dc:title", ".//opf:metadata/dc:title"], ns)
-            author = _first_text(
-                opf_root,
-                [
-                    ".//dc:creator",
-                    ".//opf:metadata/dc:creator",
-                    ".//dc:contributor",
-                ],
-                ns,
-            )
-            date_text = _first_text(opf_root, [".//dc:date", ".//opf:metadata/dc:date"], ns)
-            year_match = re.search(r"(\d{4})", date_text)
-
-            metadata["title"] = title
-            metadata["author"] = author
+            found = _scan_opf(zf.read(opf_path))
+            year_match = _YEAR_RE.search(found["date"])
+
+            metadata["title"] = found["title"]
+            metadata["author"] = found["creator"] or found["contributor"]
             metadata["year"] = year_match.group(1) if year_match else ""
     except Exception:
         return metadata
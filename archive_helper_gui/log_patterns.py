@@ -21,6 +21,8 @@ SUBTITLE_DONE_RE = re.compile(r"^Subtitle extraction done:\s*(.+?)\s*\((.+)\)$")
 PROMPT_INSERT_RE = re.compile(r"^(?:Insert:\s|Insert\s+disc\b)", re.IGNORECASE)
 PROMPT_NEXT_DISC_RE = re.compile(r"When the next disc is inserted, press Enter to start ripping\.\.\.")
 PROMPT_LOW_DISK_RE = re.compile(r"^Low disk space:")
+LOW_DISK_RESUMED_RE = re.compile(r"^Disk space recovered")
+DISC_DETECTED_RE = re.compile(r"^Disc detected in ")
 FINALIZING_RE = re.compile(r"^Finalizing: ")
 CSV_LOADED_RE = re.compile(r"^CSV schedule loaded:\s*(\d+)\s*discs")
 ERROR_RE = re.compile(r"^ERROR:")
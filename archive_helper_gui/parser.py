@@ -22,7 +22,9 @@ from archive_helper_gui.log_patterns import (
     FALLBACK_STATUS_RE,
     MULTI_DISC_PROGRESS_RE,
     MULTI_DISC_SUMMARY_RE,
+    DISC_DETECTED_RE,
     DISC_TITLE_PROGRESS_TEXT_RE,
+    LOW_DISK_RESUMED_RE,
     PROMPT_INSERT_RE,
     PROMPT_LOW_DISK_RE,
     PROMPT_NEXT_DISC_RE,
@@ -301,7 +303,7 @@ def parse_for_progress(gui, text_chunk: str) -> None:
         gui._eta_update("makemkv", pct_total)
         return
 
-    m = HB_PROGRESS_RE.search(line)
+    m = HB_PROGRESS_RE.search(line) if "Encoding:" in line else None
     if m:
         try:
             pct = float(m.group(1))
@@ -351,6 +353,21 @@ def parse_for_progress(gui, text_chunk: str) -> None:
         gui.progress.start(10)
         return
 
+    if LOW_DISK_RESUMED_RE.match(line):
+        # The server rechecks free space on its own, so the pause can end
+        # without a Continue click. Drop the stale prompt in that case.
+        _clear_waiting_prompt()
+        gui.var_step.set("Resuming")
+        gui.progress.stop()
+        return
+
+    if DISC_DETECTED_RE.match(line):
+        # The server noticed the new disc without a Continue click. Disarm
+        # the prompt so a late click cannot skip the next disc wait.
+        _clear_waiting_prompt()
+        gui.var_step.set("Disc detected")
+        return
+
     m = SUBTITLE_START_RE.match(line)
     if m:
         source_name = m.group(1).strip()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from archive_helper_core import audiobooks
+
+
+def test_find_cover_image_prefers_priority_order_case_insensitively(tmp_path: Path) -> None:
+    assert audiobooks._find_cover_image(tmp_path) is None
+
+    (tmp_path / "thumb.jpg").write_text("x", encoding="utf-8")
+    (tmp_path / "Folder.jpg").write_text("x", encoding="utf-8")
+    (tmp_path / "cover.jpg").mkdir()
+
+    assert audiobooks._find_cover_image(tmp_path) == tmp_path / "Folder.jpg"
+    assert audiobooks._find_cover_image(tmp_path / "missing") is None
+
+
+def test_sanitize_audible_name_strips_unabridged_and_asin_only() -> None:
+    assert audiobooks._sanitize_audible_name("The Book (UNABRIDGED) [B0ABCDEFGH]  Part") == "The Book Part"
+    assert audiobooks._sanitize_audible_name("Notes [b0abcdefgh]") == "Notes [b0abcdefgh]"
+
+
+def test_safe_path_component_replaces_filesystem_hostile_characters() -> None:
+    assert audiobooks._safe_path_component('A/B:C*D?"E"<F>|G\\H', fallback="x") == "A B C D E F G H"
+    assert audiobooks._safe_path_component(" ... ", fallback="Unknown Title") == "Unknown Title"
+
+
+def test_free_numbered_path_skips_taken_suffixes(tmp_path: Path) -> None:
+    for name in ("Book.m4b", "Book (2).m4b", "Book (3).m4b"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+
+    assert audiobooks._free_numbered_path(tmp_path, "Book", ".m4b") == tmp_path / "Book (4).m4b"
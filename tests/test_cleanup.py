@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from archive_helper_core import cleanup
+import archive_helper_core._legacy_rip_and_encode_server as legacy
+
+
+def _make_work_dir(home: Path, name: str) -> Path:
+    work_dir = home / name
+    (work_dir / "MKVs").mkdir(parents=True)
+    (work_dir / ".rip_and_encode_workdir").touch()
+    return work_dir
+
+
+def test_cleanup_mkvs_skips_configured_storage_dirs(tmp_path: Path, capsys) -> None:
+    home = tmp_path / "home"
+    kept = _make_work_dir(home, "Movies")
+    removed = _make_work_dir(home, "Film (2001)")
+
+    rc = cleanup.cleanup_mkvs(home, dry_run=False, movies_dir=str(kept), series_dir="host:/srv/Series")
+
+    assert rc == 0
+    assert kept.exists()
+    assert not removed.exists()
+    assert "Deleted work directories: 1" in capsys.readouterr().out
+
+
+def test_cleanup_mkvs_skips_work_dirs_inside_storage_reached_via_symlink(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    kept = _make_work_dir(home, "Library (2020)")
+    alias = tmp_path / "library-link"
+    alias.symlink_to(kept, target_is_directory=True)
+
+    assert cleanup.cleanup_mkvs(home, dry_run=False, movies_dir=str(alias), series_dir="") == 0
+    assert kept.exists()
+
+
+def test_low_disk_pause_resumes_without_enter_once_space_frees(tmp_path: Path, monkeypatch, capsys) -> None:
+    free_values = iter([1, 50 * 1024**3])
+    monkeypatch.setattr(legacy.shutil, "disk_usage", lambda _p: SimpleNamespace(free=next(free_values)))
+    monkeypatch.setattr(legacy, "_disk_free_cache", {})
+    waits: list[float] = []
+    monkeypatch.setattr(legacy, "_wait_for_enter_or_timeout", waits.append)
+
+    cleanup.pause_if_low_disk_space(paths=[tmp_path], min_free_gb=20)
+
+    assert waits == [legacy.LOW_DISK_RECHECK_S]
+    assert "Disk space recovered; resuming run." in capsys.readouterr().out
+
+
+def test_disk_free_bytes_reuses_recent_reading(tmp_path: Path, monkeypatch) -> None:
+    calls: list[Path] = []
+
+    def _usage(p: Path) -> SimpleNamespace:
+        calls.append(p)
+        return SimpleNamespace(free=len(calls))
+
+    monkeypatch.setattr(legacy.shutil, "disk_usage", _usage)
+    monkeypatch.setattr(legacy, "_disk_free_cache", {})
+
+    assert legacy._disk_free_bytes(tmp_path) == 1
+    assert legacy._disk_free_bytes(tmp_path) == 1
+    assert legacy._disk_free_bytes(tmp_path, max_age_s=0) == 2
+    assert len(calls) == 2
+
+
+def test_is_safe_work_dir_accepts_only_direct_children_of_home(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    (home / "Film (2001)" / "MKVs").mkdir(parents=True)
+
+    assert cleanup.is_safe_work_dir(home, home / "Film (2001)")
+    assert not cleanup.is_safe_work_dir(home, home)
+    assert not cleanup.is_safe_work_dir(home, home / "Film (2001)" / "MKVs")
+    assert not cleanup.is_safe_work_dir(home, tmp_path)
+    assert not cleanup.is_safe_work_dir(home, tmp_path / "home2")
+
+
+def test_fast_rmtree_removes_trees_but_refuses_symlinks(tmp_path: Path) -> None:
+    tree = tmp_path / "Film (2001)"
+    (tree / "MKVs" / "Disc01").mkdir(parents=True)
+    (tree / "MKVs" / "Disc01" / "title_t00.mkv").write_bytes(b"x")
+    link = tmp_path / "link"
+    link.symlink_to(tree, target_is_directory=True)
+
+    with pytest.raises(OSError):
+        legacy._fast_rmtree(link)
+    assert (tree / "MKVs" / "Disc01" / "title_t00.mkv").exists()
+
+    legacy._fast_rmtree(tree)
+    assert not tree.exists()
+
+
+def test_cleanup_mkvs_removes_all_candidates_with_one_rm_run(tmp_path: Path, monkeypatch, capsys) -> None:
+    home = tmp_path / "home"
+    dirs = [_make_work_dir(home, f"Film {i} (2001)") for i in range(3)]
+    real_run = legacy.subprocess.run
+    rm_calls: list[list[str]] = []
+
+    def _run(argv, **kw):
+        if argv[0] == "rm":
+            rm_calls.append(argv)
+        return real_run(argv, **kw)
+
+    monkeypatch.setattr(legacy.subprocess, "run", _run)
+
+    assert cleanup.cleanup_mkvs(home, dry_run=False, movies_dir="", series_dir="") == 0
+    assert not any(d.exists() for d in dirs)
+    assert len(rm_calls) == 1 and rm_calls[0][:3] == ["rm", "-rf", "--"]
+    assert "Deleted work directories: 3" in capsys.readouterr().out
+
+
+def test_rm_work_dir_renames_then_deletes_in_background(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    work_dir = _make_work_dir(home, "Film (2001)")
+    (work_dir / "MKVs" / "title_t00.mkv").write_bytes(b"x")
+
+    cleanup.rm_work_dir_if_allowed(home, work_dir, keep_mkvs=False)
+
+    assert not work_dir.exists()
+    cleanup.wait_for_background_deletes()
+    assert list(home.iterdir()) == []
+
+
+def test_cleanup_mkvs_dry_run_reports_sizes_and_legacy_dirs(tmp_path: Path, capsys) -> None:
+    home = tmp_path / "home"
+    managed = _make_work_dir(home, "Film (2001)")
+    (managed / "MKVs" / "title_t00.mkv").write_bytes(b"x" * 2048)
+    legacy_dir = home / "Show (1999)"
+    (legacy_dir / "MKVs").mkdir(parents=True)
+    (legacy_dir / "__series_stage").mkdir()
+    (home / "Other (2000)" / "MKVs").mkdir(parents=True)
+
+    assert cleanup.cleanup_mkvs(home, dry_run=True, movies_dir="", series_dir="") == 0
+
+    out = capsys.readouterr().out
+    assert f"{managed} (2.0 KB) [managed]" in out
+    assert f"{legacy_dir} (0 B) [legacy]" in out
+    assert "Other (2000)" not in out
+    assert "Total candidates: 2" in out
+
+
+def test_dedupe_paths_by_device_rechecks_layout_on_every_call(tmp_path: Path) -> None:
+    (tmp_path / "Movies").mkdir()
+    paths = [tmp_path, tmp_path / "Movies", tmp_path / "Series"]
+
+    assert legacy._dedupe_paths_by_device(paths) == [tmp_path, tmp_path / "Series"]
+
+    (tmp_path / "Series").mkdir()
+    assert legacy._dedupe_paths_by_device(paths) == [tmp_path]
+
+
+def test_cleanup_mkvs_sweeps_unfinished_trash_dirs(tmp_path: Path, capsys) -> None:
+    home = tmp_path / "home"
+    top = home / f"{legacy.TRASH_DIR_PREFIX}abc" / "Disc01"
+    top.mkdir(parents=True)
+    (top / "title_t00.mkv").write_bytes(b"x")
+    kept = home / "Movies"
+    inner = kept / f"{legacy.TRASH_DIR_PREFIX}def"
+    inner.mkdir(parents=True)
+    (kept / "Alien (1979)").mkdir()
+
+    assert cleanup.cleanup_mkvs(home, dry_run=True, movies_dir="", series_dir="") == 0
+    assert "Unfinished deletes" in capsys.readouterr().out
+    assert top.exists() and inner.exists()
+
+    assert cleanup.cleanup_mkvs(home, dry_run=False, movies_dir="", series_dir="") == 0
+    assert sorted(p.name for p in home.iterdir()) == ["Movies"]
+    assert [p.name for p in kept.iterdir()] == ["Alien (1979)"]
+
+
+def test_wait_for_enter_sleeps_out_the_timeout_at_eof(monkeypatch) -> None:
+    read_fd, write_fd = legacy.os.pipe()
+    legacy.os.close(write_fd)
+    sleeps: list[float] = []
+    monkeypatch.setattr(legacy.time, "sleep", sleeps.append)
+
+    with open(read_fd, encoding="utf-8") as stdin:
+        monkeypatch.setattr(legacy.sys, "stdin", stdin)
+        legacy._wait_for_enter_or_timeout(30)
+
+    assert len(sleeps) == 1 and 25 < sleeps[0] <= 30
+
+
+def test_finalize_job_stops_when_run_fails_mid_finalize(tmp_path: Path) -> None:
+    import threading
+
+    home = tmp_path / "home"
+    first = _make_work_dir(home, "First")
+    second = _make_work_dir(home, "Second")
+    failsafe = legacy.FailSafe()
+    syncing = threading.Event()
+    release = threading.Event()
+    finalized: list[Path] = []
+
+    def finalize(ctx) -> None:
+        # Stand-in for the remote sync that runs before the delete.
+        syncing.set()
+        release.wait(5)
+        finalized.append(ctx.work_dir)
+        legacy.rm_work_dir_if_allowed(home, ctx.work_dir, False, failsafe=failsafe)
+
+    ctxs = [SimpleNamespace(work_dir=first), SimpleNamespace(work_dir=second)]
+    job = threading.Thread(target=legacy._finalize_after_encodes, args=([], ctxs, failsafe, finalize))
+    job.start()
+    assert syncing.wait(5)
+    failsafe.mark_failed()
+    release.set()
+    job.join(5)
+    cleanup.wait_for_background_deletes()
+
+    assert finalized == [first]
+    assert first.exists() and second.exists()
+
+
+def test_background_delete_failures_are_reported(tmp_path: Path, monkeypatch) -> None:
+    home = tmp_path / "home"
+    work_dir = _make_work_dir(home, "Alien (1979)")
+    (home / f"{legacy.TRASH_DIR_PREFIX}old").mkdir()
+
+    def failing_rmtree(path: Path) -> None:
+        raise PermissionError(13, "Permission denied", str(path))
+
+    monkeypatch.setattr(legacy, "_fast_rmtree", failing_rmtree)
+    cleanup.rm_work_dir_if_allowed(home, work_dir, False)
+    legacy.sweep_trash_dirs_in_background(home)
+
+    # The work dir's delete fails, then the sweep fails on its trash dir and the old one.
+    assert cleanup.wait_for_background_deletes() == 3
+    assert cleanup.wait_for_background_deletes() == 0
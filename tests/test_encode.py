@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import concurrent.futures
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from archive_helper_core import encode
+import archive_helper_core._legacy_rip_and_encode_server as legacy
+
+
+class _TrickleStream(io.BytesIO):
+    """Pipe stand-in that hands back a few bytes per read, like a live child."""
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(3)
+
+
+def test_iter_output_lines_splits_on_carriage_returns_across_chunks() -> None:
+    stream = _TrickleStream(b"Scanning\rEncoding: task 1 of 1, 5.00 %\r\nline two\n\n tail")
+
+    assert list(legacy._iter_output_lines(stream)) == [
+        "Scanning",
+        "Encoding: task 1 of 1, 5.00 %",
+        "line two",
+        "tail",
+    ]
+
+
+def test_create_lock_or_fail_writes_content_once(tmp_path: Path) -> None:
+    lock = tmp_path / "out.mp4.enc.lock"
+
+    encode.create_lock_or_fail(lock, f"{os.getpid()}\n".encode("ascii"))
+
+    assert lock.read_text(encoding="utf-8") == f"{os.getpid()}\n"
+    with pytest.raises(RuntimeError, match="Output is locked"):
+        encode.create_lock_or_fail(lock)
+
+
+def test_terminate_running_encodes_signals_only_live_children(monkeypatch) -> None:
+    class _Proc:
+        def __init__(self, exit_code):
+            self.exit_code = exit_code
+            self.terminated = False
+
+        def poll(self):
+            return self.exit_code
+
+        def terminate(self) -> None:
+            self.terminated = True
+
+    live, done = _Proc(None), _Proc(0)
+    monkeypatch.setattr(legacy, "_running_encodes", {live, done})
+
+    assert encode.terminate_running_encodes() == 1
+    assert live.terminated and not done.terminated
+
+
+def test_hb_encode_with_progress_throttles_repeated_percentages(tmp_path: Path, monkeypatch, capsys) -> None:
+    class _Proc:
+        stdout = _TrickleStream(
+            b"Scanning\rEncoding: task 1 of 1, 5.00 %\rEncoding: task 1 of 1, 5.40 %\r"
+            b"Encoding: task 1 of 1, 6.10 %\r\nEncode done!\n"
+        )
+
+        def wait(self) -> int:
+            return 0
+
+    monkeypatch.setattr(legacy.subprocess, "Popen", lambda *_a, **_kw: _Proc())
+
+    legacy.hb_encode_with_progress(tmp_path / "in.mkv", tmp_path / "out.mp4", "Fast 1080p30")
+
+    assert capsys.readouterr().out.splitlines() == [
+        "Scanning",
+        "Encoding: task 1 of 1, 5.00 %",
+        "Encoding: task 1 of 1, 6.10 %",
+        "Encode done!",
+    ]
+
+
+def test_rotate_logs_compresses_old_logs_past_keep_including_legacy_names(tmp_path: Path) -> None:
+    old = 3 * 24 * 60 * 60
+    names = ["rip_and_encode_20240103.log", "rip_and_encode_v2_20240102.log", "rip_and_encode_20240101.log"]
+    for age, name in enumerate(names, start=1):
+        p = tmp_path / name
+        p.write_text(name, encoding="utf-8")
+        stamp = legacy.time.time() - old - age
+        os.utime(p, (stamp, stamp))
+    (tmp_path / "other.log").write_text("x", encoding="utf-8")
+
+    encode.rotate_logs(tmp_path, keep=1, compress=True)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "other.log",
+        "rip_and_encode_20240101.log.gz",
+        "rip_and_encode_20240103.log",
+        "rip_and_encode_v2_20240102.log.gz",
+    ]
+
+
+def test_unique_out_path_skips_taken_names_and_live_locks(tmp_path: Path) -> None:
+    (tmp_path / "Extra.mp4").write_bytes(b"x")
+    (tmp_path / "Extra-02.mp4.enc.lock").write_text(f"{os.getpid()}\n", encoding="utf-8")
+    (tmp_path / "Extra-03.mp4.enc.lock").write_text("not-a-pid\n", encoding="utf-8")
+
+    assert legacy.unique_out_path(tmp_path, "Extra", "mp4") == tmp_path / "Extra-03.mp4"
+    assert not (tmp_path / "Extra-03.mp4.enc.lock").exists()
+    assert legacy.unique_out_path(tmp_path, "Trailer", "mp4") == tmp_path / "Trailer.mp4"
+
+
+def test_extract_external_subtitles_reserves_distinct_names_for_parallel_runs(tmp_path: Path, monkeypatch, capsys) -> None:
+    streams = [
+        {"index": 2, "codec_name": "subrip", "tags": {"language": "eng"}},
+        {"index": 3, "codec_name": "subrip", "tags": {"language": "eng"}},
+        {"index": 4, "codec_name": "hdmv_pgs_subtitle", "tags": {"language": "fra"}},
+    ]
+    monkeypatch.setattr(legacy, "ffprobe_subtitle_streams", lambda _p: streams)
+
+    def _run(cmd, **_kw):
+        out = Path(cmd[-1])
+        if "0:4" in cmd:
+            return legacy.subprocess.CompletedProcess(cmd, 1)
+        out.write_text("1\n", encoding="utf-8")
+        return legacy.subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(legacy, "run_cmd", _run)
+
+    legacy.extract_external_subtitles(tmp_path / "in.mkv", tmp_path / "Movie.mp4")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["Movie.en.02.srt", "Movie.en.srt"]
+    assert "(2 succeeded, 1 failed)" in capsys.readouterr().out
+
+
+def test_extract_external_subtitles_reports_progress_as_each_extraction_starts(tmp_path: Path, monkeypatch, capsys) -> None:
+    streams = [{"index": i, "codec_name": "subrip", "tags": {"language": "eng"}} for i in (2, 3)]
+    monkeypatch.setattr(legacy, "ffprobe_subtitle_streams", lambda _p: streams)
+    seen_at_start: list[int] = []
+
+    def _run(cmd, **_kw):
+        seen_at_start.append(capsys.readouterr().out.count("Subtitle extraction progress:"))
+        return legacy.subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(legacy, "run_cmd", _run)
+    # One worker keeps the order deterministic.
+    real_pool = concurrent.futures.ThreadPoolExecutor
+    monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", lambda max_workers: real_pool(max_workers=1))
+
+    legacy.extract_external_subtitles(tmp_path / "in.mkv", tmp_path / "Movie.mp4")
+
+    # Each job has printed its own progress line (and no one else's) when it starts.
+    assert seen_at_start == [1, 1]
+
+
+def test_rotate_logs_in_background_finishes_rotation_off_thread(tmp_path: Path) -> None:
+    for i in range(3):
+        p = tmp_path / f"rip_and_encode_2024010{i}.log"
+        p.write_text("x" * 100, encoding="utf-8")
+        stamp = legacy.time.time() - 3 * 24 * 60 * 60 - i
+        os.utime(p, (stamp, stamp))
+
+    t = encode.rotate_logs_in_background(tmp_path, keep=1)
+    t.join(timeout=10)
+
+    assert not t.is_alive()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "rip_and_encode_20240100.log",
+        "rip_and_encode_20240101.log.gz",
+        "rip_and_encode_20240102.log.gz",
+    ]
+
+
+def test_rotate_logs_never_touches_the_excluded_current_log(tmp_path: Path) -> None:
+    stamp = legacy.time.time() - 3 * 24 * 60 * 60
+    logs = [tmp_path / f"rip_and_encode_2024010{i}.log" for i in range(3)]
+    for i, p in enumerate(logs):
+        p.write_text("x", encoding="utf-8")
+        os.utime(p, (stamp - i, stamp - i))
+    link = tmp_path / "current.log"
+    link.symlink_to(logs[2])
+
+    encode.rotate_logs(tmp_path, keep=1, compress=False, exclude=link)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["current.log", logs[0].name, logs[2].name]
+
+    encode.rotate_logs(tmp_path, keep=0, compress=False, exclude=tmp_path / "rip_and_encode_missing.log")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["current.log"]
+
+
+def test_hb_encode_drops_input_from_page_cache_even_on_failure(tmp_path: Path, monkeypatch) -> None:
+    dropped: list[Path] = []
+    monkeypatch.setattr(legacy, "_drop_pagecache", dropped.append)
+
+    def _fail(*_a, **_kw):
+        raise RuntimeError("HandBrakeCLI failed")
+
+    monkeypatch.setattr(legacy, "hb_encode_with_progress", _fail)
+
+    with pytest.raises(RuntimeError):
+        legacy.hb_encode(tmp_path / "title_t00.mkv", tmp_path / "out.mp4", "Fast 1080p30")
+    assert dropped == [tmp_path / "title_t00.mkv"]
+
+    legacy._drop_pagecache(tmp_path / "missing.mkv")
+
+
+def test_hb_encode_with_progress_stops_handbrake_when_interrupted(monkeypatch) -> None:
+    class _Proc:
+        stdout = io.BytesIO(b"Encoding: task 1 of 1, 5.00 %\r")
+
+        def __init__(self) -> None:
+            self.terminated = False
+
+        def poll(self):
+            return None
+
+        def terminate(self) -> None:
+            self.terminated = True
+
+        def wait(self, timeout=None):
+            return 0
+
+    proc = _Proc()
+    monkeypatch.setattr(legacy.subprocess, "Popen", lambda *_a, **_kw: proc)
+
+    def _interrupt(*_a, **_kw):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(legacy, "_iter_output_byte_lines", _interrupt)
+
+    with pytest.raises(KeyboardInterrupt):
+        legacy.hb_encode_with_progress(Path("in.mkv"), Path("out.mp4"), "Fast 1080p30")
+    assert proc.terminated
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from archive_helper_gui.epub_utils import extract_epub_metadata
+
+_CONTAINER = (
+    '<?xml version="1.0"?>'
+    '<container xmlns="urn:oasis:names:tc:opendocument:xmlns:container" version="1.0">'
+    '<rootfiles><rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/></rootfiles>'
+    "</container>"
+)
+
+
+def _write_epub(path: Path, metadata_xml: str) -> Path:
+    opf = (
+        '<?xml version="1.0"?>'
+        '<package xmlns="http://www.idpf.org/2007/opf" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        f"<metadata>{metadata_xml}</metadata>"
+        '<manifest><item id="c1" href="c1.xhtml"/></manifest>'
+        "</package>"
+    )
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("META-INF/container.xml", _CONTAINER)
+        zf.writestr("OEBPS/content.opf", opf)
+    return path
+
+
+def test_extract_epub_metadata_prefers_creator_and_reads_year(tmp_path: Path) -> None:
+    epub = _write_epub(
+        tmp_path / "book.epub",
+        "<dc:contributor>Editor Name</dc:contributor>"
+        "<dc:title>  The   Long\n Way </dc:title>"
+        "<dc:creator>Jane Author</dc:creator>"
+        "<dc:date>2014-07-29</dc:date>",
+    )
+
+    assert extract_epub_metadata(epub) == {"title": "The Long Way", "author": "Jane Author", "year": "2014"}
+
+
+def test_extract_epub_metadata_falls_back_to_contributor_and_tolerates_bad_files(tmp_path: Path) -> None:
+    epub = _write_epub(tmp_path / "book.epub", "<dc:title>Notes</dc:title><dc:contributor>Editor</dc:contributor>")
+    (tmp_path / "broken.epub").write_bytes(b"not a zip")
+
+    assert extract_epub_metadata(epub) == {"title": "Notes", "author": "Editor", "year": ""}
+    assert extract_epub_metadata(tmp_path / "broken.epub") == {"title": "", "author": "", "year": ""}
+
+
+def test_extract_epub_metadata_is_cached_until_the_file_changes(tmp_path: Path, monkeypatch) -> None:
+    epub = _write_epub(tmp_path / "book.epub", "<dc:title>First</dc:title>")
+    reads: list[object] = []
+    real_zipfile = zipfile.ZipFile
+
+    def _zipfile(file, mode="r", *a, **kw):
+        if mode == "r":
+            reads.append(file)
+        return real_zipfile(file, mode, *a, **kw)
+
+    monkeypatch.setattr(zipfile, "ZipFile", _zipfile)
+
+    assert extract_epub_metadata(epub)["title"] == "First"
+    assert extract_epub_metadata(epub)["title"] == "First"
+    assert len(reads) == 1
+
+    _write_epub(epub, "<dc:title>Second Edition</dc:title>")
+    assert extract_epub_metadata(epub)["title"] == "Second Edition"
+
+    extract_epub_metadata.cache_clear()
+    assert extract_epub_metadata(epub)["title"] == "Second Edition"
+    assert len(reads) == 3
@@ -109,3 +109,28 @@ def test_disc_prompt_v2_insert_disc_format_enables_continue() -> None:
     assert gui.btn_continue.state == "normal"
     assert "Insert disc 1 (disc-1) now" in gui.var_prompt.value
     assert "Click Continue (or press Enter)" in gui.var_prompt.value
+
+
+def test_low_disk_resume_clears_waiting_prompt() -> None:
+    gui = _Gui()
+
+    parse_for_progress(gui, "Low disk space: free up space and Press Enter to retry (free space is rechecked every 60 seconds).")
+    assert gui.state.waiting_for_enter is True
+    assert gui.btn_continue.state == "normal"
+
+    parse_for_progress(gui, "Disk space recovered; resuming run.")
+    assert gui.state.waiting_for_enter is False
+    assert gui.btn_continue.state == "disabled"
+    assert gui.var_prompt.value == ""
+
+
+def test_disc_auto_detect_clears_waiting_prompt() -> None:
+    gui = _Gui()
+
+    parse_for_progress(gui, "Insert: Movie 'Alien (1979)' Disc 1. Press Enter when ready.")
+    assert gui.state.waiting_for_enter is True
+
+    parse_for_progress(gui, "Disc detected in /dev/sr0; starting rip.")
+    assert gui.state.waiting_for_enter is False
+    assert gui.btn_continue.state == "disabled"
+    assert gui.var_prompt.value == ""
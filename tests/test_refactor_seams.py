@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import gzip
+import http.client
+import subprocess
 import sys
+import urllib.request
+from io import StringIO
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from archive_helper_core import cli
+from archive_helper_core import deps
 from archive_helper_core import manifest as manifest_mod
+from archive_helper_core import media_probe
+from archive_helper_core import remote
+from archive_helper_core import tmdb as tmdb_mod
 from archive_helper_core import workflows_series as series_mod
-from archive_helper_core.rip_io import map_selected_title_indexes_to_mkvs
+from archive_helper_core.rip_io import find_mkvs_in_dir, map_selected_title_indexes_to_mkvs, wait_for_next_disc
 import archive_helper_core._legacy_rip_and_encode_server as legacy
 
 
@@ -73,3 +85,565 @@ def test_parse_args_parity_for_tmdb_defaults() -> None:
     assert ns.tmdb_search == "Aliens"
     assert ns.tmdb_media_type == "movie"
     assert ns.tmdb_limit == 8
+
+
+def test_json_file_cache_round_trips_and_expires(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "cache" / "runtime.json"
+    cache = legacy.JsonFileCache(path, ttl_s=60)
+    assert cache.get("alien|1979") == (False, None)
+
+    cache.put("alien|1979", 117)
+    assert legacy.JsonFileCache(path, ttl_s=60).get("alien|1979") == (True, 117)
+
+    later = legacy.time.time() + 120
+    monkeypatch.setattr(legacy.time, "time", lambda: later)
+    assert legacy.JsonFileCache(path, ttl_s=60).get("alien|1979") == (False, None)
+
+
+def test_wait_for_next_disc_starts_only_after_a_disc_change(monkeypatch, capsys) -> None:
+    states = iter([True, True, False, True])
+    monkeypatch.setattr(legacy, "_drive_has_disc", lambda _dev: next(states))
+    monkeypatch.setattr(legacy.select, "select", lambda r, w, x, t: ([], [], []))
+
+    wait_for_next_disc("/dev/sr0")
+
+    assert "Disc detected in /dev/sr0; starting rip." in capsys.readouterr().out
+    assert next(states, None) is None
+
+
+def test_wait_for_next_disc_does_not_treat_stdin_eof_as_enter(monkeypatch, capsys) -> None:
+    states = iter([True, False, True])
+    monkeypatch.setattr(legacy, "_drive_has_disc", lambda _dev: next(states))
+    monkeypatch.setattr(legacy.select, "select", lambda r, w, x, t: (r, [], []))
+    monkeypatch.setattr(legacy.sys, "stdin", StringIO(""))
+    sleeps: list[float] = []
+    monkeypatch.setattr(legacy.time, "sleep", sleeps.append)
+
+    wait_for_next_disc("/dev/sr0")
+
+    assert "Disc detected in /dev/sr0" in capsys.readouterr().out
+    assert sleeps == [legacy.DISC_READY_POLL_S]
+
+
+def test_title_context_batch_key_distinguishes_seasons(tmp_path: Path) -> None:
+    def _ctx(season: int):
+        return legacy.setup_title_context(
+            home=tmp_path,
+            home_base=tmp_path,
+            title_raw="Show",
+            year="2001",
+            is_series=True,
+            season=season,
+            movie_multi_disc=False,
+            movies_dir=str(tmp_path / "Movies"),
+            series_dir=str(tmp_path / "Series"),
+            output_ext="mp4",
+        )
+
+    assert _ctx(1).batch_key == "S|Show|2001|01"
+    assert _ctx(1).batch_key is _ctx(1).batch_key
+    assert _ctx(2).batch_key != _ctx(1).batch_key
+
+
+def test_tmdb_search_answers_from_disk_cache_unless_refreshed(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(legacy, "_tmdb_search_cache", legacy.JsonFileCache(tmp_path / "tmdb_search.json", ttl_s=600))
+    calls: list[str] = []
+
+    def _get(path: str, params: dict[str, str]):
+        calls.append(path)
+        return 200, b'{"results": [{"id": 348, "title": "Alien", "release_date": "1979-05-25"}]}'
+
+    monkeypatch.setattr(legacy, "_tmdb_get", _get)
+
+    first = legacy.tmdb_search(api_key="k", query="Alien", year="1979")
+    again = legacy.tmdb_search(api_key="k", query="alien", year="1979")
+    legacy.tmdb_search(api_key="k", query="Alien", year="1979", refresh=True)
+
+    assert first == again
+    assert first[0]["title"] == "Alien"
+    assert len(calls) == 2
+    assert "api_key" not in (tmp_path / "tmdb_search.json").read_text(encoding="utf-8")
+
+
+def test_tmdb_search_does_not_cache_empty_results(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(legacy, "_tmdb_search_cache", legacy.JsonFileCache(tmp_path / "tmdb_search.json", ttl_s=600))
+    calls: list[str] = []
+    monkeypatch.setattr(legacy, "_tmdb_get", lambda path, params: calls.append(path) or (200, b'{"results": []}'))
+
+    assert legacy.tmdb_search(api_key="k", query="Brand New Film", year="2026") == []
+    assert legacy.tmdb_search(api_key="k", query="Brand New Film", year="2026") == []
+    assert len(calls) == 2
+
+
+def test_tmdb_get_reuses_connection_and_decodes_gzip(monkeypatch) -> None:
+    opened: list[str] = []
+
+    class _Resp:
+        status = 200
+
+        def getheader(self, name: str, default: str = "") -> str:
+            return "gzip" if name == "Content-Encoding" else default
+
+        def read(self) -> bytes:
+            return gzip.compress(b'{"runtime": 117}')
+
+    class _Conn:
+        def __init__(self, host: str, timeout: int) -> None:
+            opened.append(host)
+
+        def request(self, method: str, target: str, headers: dict[str, str]) -> None:
+            assert headers["Accept-Encoding"] == "gzip"
+
+        def getresponse(self) -> _Resp:
+            return _Resp()
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(urllib.request, "getproxies", lambda: {})
+    monkeypatch.setattr(http.client, "HTTPSConnection", _Conn)
+    monkeypatch.setattr(legacy, "_tmdb_conn_local", legacy.local())
+
+    assert legacy._tmdb_get("/3/movie/348", {"api_key": "k"}) == (200, b'{"runtime": 117}')
+    assert legacy._tmdb_get("/3/movie/348", {"api_key": "k"}) == (200, b'{"runtime": 117}')
+    assert opened == ["api.themoviedb.org"]
+
+
+def test_tmdb_get_retries_only_a_reused_connection(monkeypatch) -> None:
+    requests: list[int] = []
+
+    class _Conn:
+        def __init__(self, host: str, timeout: int) -> None:
+            self.id = len(requests)
+
+        def request(self, method: str, target: str, headers: dict[str, str]) -> None:
+            requests.append(self.id)
+            raise TimeoutError("timed out")
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(urllib.request, "getproxies", lambda: {})
+    monkeypatch.setattr(http.client, "HTTPSConnection", _Conn)
+    monkeypatch.setattr(legacy, "_tmdb_conn_local", legacy.local())
+
+    with pytest.raises(TimeoutError):
+        legacy._tmdb_get("/3/movie/348", {"api_key": "k"})
+    assert len(requests) == 1
+
+    requests.clear()
+    legacy._tmdb_conn_local.conn = _Conn("api.themoviedb.org", 15)
+    with pytest.raises(TimeoutError):
+        legacy._tmdb_get("/3/movie/348", {"api_key": "k"})
+    assert len(requests) == 2
+
+
+def test_cmd_stdout_returns_output_and_gives_up_on_timeout() -> None:
+    assert tmdb_mod._cmd_stdout([sys.executable, "-c", "print(' CINFO:2,0,\"Alien\" ')"]) == 'CINFO:2,0,"Alien"'
+    assert tmdb_mod._cmd_stdout([sys.executable, "-c", "import time; time.sleep(5)"], timeout_s=1) == ""
+    assert tmdb_mod._cmd_stdout(["archive-helper-missing-cmd"]) == ""
+
+
+def test_remote_copy_dirs_into_batches_sources_over_shared_connection(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / ".ssh").mkdir()
+    monkeypatch.setattr(legacy.Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(legacy, "_which", lambda _cmd: None)
+    calls: list[list[str]] = []
+    monkeypatch.setattr(legacy, "run_cmd", lambda argv, **_kw: calls.append(argv))
+
+    dirs = [tmp_path / f"d{i}" for i in range(legacy.SCP_MAX_SOURCES + 1)]
+    remote.remote_copy_dirs_into(dirs, "nas:/srv/Movies")
+
+    assert len(calls) == 2
+    assert calls[0][-1] == calls[1][-1] == "nas:/srv/Movies/"
+    assert len(calls[0]) - len(calls[1]) == legacy.SCP_MAX_SOURCES - 1
+    assert "ControlMaster=auto" in calls[0]
+
+
+def test_remote_copy_compresses_only_when_asked(monkeypatch) -> None:
+    monkeypatch.setattr(legacy, "_which", lambda _cmd: None)
+    calls: list[list[str]] = []
+    monkeypatch.setattr(legacy, "run_cmd", lambda argv, **_kw: calls.append(argv))
+
+    remote.remote_copy_dir_into(Path("/work/Alien (1979)"), "nas:/srv/Movies")
+    remote.remote_copy_dir_into(Path("/work/Alien (1979)"), "nas:/srv/Movies", compress=True)
+
+    assert "-C" not in calls[0]
+    assert "-C" in calls[1]
+
+
+def test_remote_copy_prefers_rsync_and_falls_back_to_scp(monkeypatch) -> None:
+    monkeypatch.setattr(legacy, "_which", lambda cmd: f"/usr/bin/{cmd}")
+    calls: list[list[str]] = []
+
+    def _run(argv, **_kw):
+        calls.append(argv)
+        if argv[0].endswith("rsync") and len(calls) > 1:
+            raise subprocess.CalledProcessError(12, argv)
+
+    monkeypatch.setattr(legacy, "run_cmd", _run)
+
+    remote.remote_copy_dir_into(Path("/work/Alien (1979)"), "nas:/srv/Movies", compress=True)
+    assert len(calls) == 1
+    assert calls[0][0] == "/usr/bin/rsync" and "--partial" in calls[0] and "-z" in calls[0]
+    assert calls[0][-2:] == ["/work/Alien (1979)", "nas:/srv/Movies/"]
+
+    remote.remote_copy_dir_into(Path("/work/Alien (1979)"), "nas:/srv/Movies")
+    assert [c[0] for c in calls[1:]] == ["/usr/bin/rsync", "scp"]
+
+
+def test_remote_sync_movie_folder_retries_failed_copy_with_backoff(monkeypatch) -> None:
+    monkeypatch.setattr(legacy, "remote_exists", lambda *_a: False)
+    sleeps: list[float] = []
+    monkeypatch.setattr(legacy.time, "sleep", sleeps.append)
+    outcomes = iter([255, 255, 0])
+
+    def _copy(*_a, **_kw):
+        rc = next(outcomes)
+        if rc:
+            raise subprocess.CalledProcessError(rc, ["rsync"])
+
+    monkeypatch.setattr(legacy, "remote_copy_dir_into", _copy)
+
+    legacy.remote_sync_movie_folder("nas:/srv/Movies", "Alien", "1979", Path("/work/Alien (1979)"))
+    assert sleeps == [1, 2]
+
+    outcomes = iter([255, 255, 255])
+    with pytest.raises(subprocess.CalledProcessError):
+        legacy.remote_sync_movie_folder("nas:/srv/Movies", "Alien", "1979", Path("/work/Alien (1979)"))
+
+
+def test_ffprobe_helpers_share_one_cached_probe(tmp_path: Path, monkeypatch) -> None:
+    mkv = tmp_path / "title_t00.mkv"
+    mkv.write_bytes(b"x")
+    calls: list[list[str]] = []
+
+    def _run(argv, **_kw):
+        calls.append(argv)
+        return SimpleNamespace(
+            stdout='{"chapters": [{"id": 0}, {"id": 1}], '
+            '"format": {"duration": "7023.5", "tags": {"TITLE": "Alien", "DESCRIPTION": "Title 3"}}}'
+        )
+
+    monkeypatch.setattr(legacy, "run_cmd", _run)
+    monkeypatch.setattr(legacy, "_ffprobe_info_cache", {})
+
+    assert media_probe.ffprobe_meta_title(mkv) == "Title 3"
+    assert media_probe.ffprobe_duration_seconds(mkv) == 7023
+    assert media_probe.ffprobe_chapter_count(mkv) == 2
+    assert media_probe.ffprobe_meta_bundle(mkv) == ("Title 3", 7023, 2)
+    assert len(calls) == 1
+
+
+def test_which_is_cached_until_a_root_command_runs(monkeypatch) -> None:
+    lookups: list[str] = []
+    monkeypatch.setattr(legacy.shutil, "which", lambda cmd: lookups.append(cmd) or f"/usr/bin/{cmd}")
+    monkeypatch.setattr(legacy.os, "geteuid", lambda: 0)
+    monkeypatch.setattr(legacy, "run_cmd", lambda argv, **_kw: SimpleNamespace(returncode=0, stdout=""))
+    deps._which.cache_clear()
+
+    assert deps._which("jellyfin") == deps._which("jellyfin") == "/usr/bin/jellyfin"
+    deps._run_root_cmd(["apt-get", "install", "-y", "jellyfin"])
+    deps._which("jellyfin")
+
+    assert lookups == ["jellyfin", "jellyfin"]
+    deps._which.cache_clear()
+
+
+def test_os_release_is_parsed_once_until_invalidated(monkeypatch) -> None:
+    opens: list[str] = []
+    real_open = open
+
+    def _open(path, *args, **kwargs):
+        if path == "/etc/os-release":
+            opens.append(path)
+            return StringIO('ID=debian\n# comment\nPRETTY_NAME="Debian"\n')
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", _open)
+    deps._invalidate_os_release()
+
+    first = deps._read_os_release()
+    first["ID"] = "mutated"
+    assert deps._read_os_release() == {"ID": "debian", "PRETTY_NAME": "Debian"}
+    assert deps._is_debian_like()
+    assert len(opens) == 1
+
+    deps._invalidate_os_release()
+    deps._read_os_release()
+    assert len(opens) == 2
+    deps._invalidate_os_release()
+
+
+def test_probe_disc_metadata_dedups_hints_across_tools(monkeypatch) -> None:
+    outputs = {
+        "blkid": "DEVNAME=/dev/sr0\nLABEL=THE_MATRIX\n",
+        "isoinfo": "Volume id: THE_MATRIX\n",
+        "lsdvd": "Disc Title: Alien\n",
+        "makemkvcon": 'CINFO:2,0,"The Matrix"\nTINFO:0,2,0,"Ignored"\nCINFO:32,0,"ab"\n',
+    }
+    monkeypatch.setattr(legacy, "_which", lambda cmd: f"/usr/bin/{cmd}")
+    monkeypatch.setattr(legacy, "_cmd_stdout", lambda argv, **_kw: outputs[argv[0]])
+
+    meta = legacy.probe_disc_metadata(disc_device="/dev/sr0")
+
+    assert meta["hints"] == ["THE MATRIX", "Alien"]
+    assert meta["queries"][0] == "THE_MATRIX"
+
+
+def test_tee_writes_both_streams_and_leaves_flushing_to_them() -> None:
+    class _Stream(StringIO):
+        flushes = 0
+
+        def flush(self) -> None:
+            self.flushes += 1
+
+    a, b = _Stream(), _Stream()
+    tee = legacy.Tee(a, b)
+
+    tee.write("one\n")
+    tee.write("two\n")
+    assert a.getvalue() == b.getvalue() == "one\ntwo\n"
+    assert a.flushes == b.flushes == 0
+
+    tee.flush()
+    assert a.flushes == b.flushes == 1
+
+
+def test_tee_close_keeps_terminal_stream_usable() -> None:
+    term, log = StringIO(), StringIO()
+    out, err = legacy.Tee(term, log), legacy.Tee(term, log)
+
+    out.write("done\n")
+    out.close()
+    err.close()
+    err.write("late\n")
+
+    assert log.closed
+    assert term.getvalue() == "done\nlate\n"
+
+
+def test_extras_nfo_reads_file_once_and_closes_from_tail(tmp_path: Path, monkeypatch) -> None:
+    nfo = tmp_path / "extras.nfo"
+    nfo.write_text("<extras>\n  <video>\n    <filename>a.mkv</filename>\n  </video>\n", encoding="utf-8")
+    monkeypatch.setattr(legacy, "_extras_nfo_filenames", {})
+
+    legacy.append_extra_nfo_if_missing(nfo, "a", "a.mkv")
+    monkeypatch.setattr(Path, "read_text", lambda *_a, **_kw: pytest.fail("NFO re-read"))
+    legacy.append_extra_nfo_if_missing(nfo, "b", "b.mkv")
+    legacy.append_extra_nfo_if_missing(nfo, "b", "b.mkv")
+    legacy.close_extras_nfo(nfo)
+    legacy.close_extras_nfo(nfo)
+    monkeypatch.undo()
+
+    txt = nfo.read_text(encoding="utf-8")
+    assert txt.count("<filename>a.mkv</filename>") == 1
+    assert txt.count("<filename>b.mkv</filename>") == 1
+    assert txt.endswith("  </video>\n</extras>\n")
+    assert txt.count("</extras>") == 1
+
+
+def test_check_deps_reports_every_missing_command_in_order(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(legacy, "_which", lambda cmd: None if cmd in {"tr", "eject"} else f"/usr/bin/{cmd}")
+
+    assert deps.check_deps("/srv/Movies", "/srv/Series") == 2
+
+    err = capsys.readouterr().err
+    assert err.index("Missing: eject") < err.index("Missing: tr")
+    assert err.count("Missing:") == 2
+
+
+def test_which_required_all_raises_for_the_first_missing_command(monkeypatch) -> None:
+    monkeypatch.setattr(legacy, "_which", lambda cmd: None if cmd in {"tr", "eject"} else f"/usr/bin/{cmd}")
+
+    assert deps.which_required_all(["awk", "sed"]) == ["/usr/bin/awk", "/usr/bin/sed"]
+    with pytest.raises(RuntimeError, match="Missing required command: eject"):
+        deps.which_required_all(["awk", "eject", "sed", "tr"])
+
+
+def test_ssh_config_hosts_are_reparsed_only_after_the_file_changes(tmp_path: Path, monkeypatch) -> None:
+    cfg = tmp_path / "config"
+    cfg.write_text("# Host commented\nHost media nas\n  HostName 10.0.0.2\n", encoding="utf-8")
+    monkeypatch.setattr(legacy, "_ssh_config_hosts_cache", {})
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+    monkeypatch.setattr(Path, "read_text", lambda self, *a, **kw: reads.append(self) or real_read_text(self, *a, **kw))
+
+    assert remote.ssh_config_has_host(cfg, "nas")
+    assert not remote.ssh_config_has_host(cfg, "commented")
+    assert len(reads) == 1
+
+    cfg.write_text(cfg.read_text(encoding="utf-8") + "Host backup\n", encoding="utf-8")
+    assert remote.ssh_config_has_host(cfg, "backup")
+    assert not remote.ssh_config_has_host(tmp_path / "missing", "nas")
+
+
+def test_remote_exists_many_checks_a_batch_in_one_ssh_run(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "Alien (1979)").mkdir()
+    (tmp_path / "it's here.mkv").touch()
+    calls: list[list[str]] = []
+
+    def _run(argv: list[str], **kw):
+        calls.append(argv)
+        return legacy.subprocess.run(["sh", "-c", argv[-1]], check=True, text=True, **kw)
+
+    monkeypatch.setattr(legacy, "run_cmd", _run)
+
+    found = remote.remote_exists_many(f"nas:{tmp_path}", ["Alien (1979)", "it's here.mkv", "Missing (2000)"])
+
+    assert found == {"Alien (1979)", "it's here.mkv"}
+    assert len(calls) == 1 and calls[0][0] == "ssh"
+    assert remote.remote_exists_many(f"nas:{tmp_path / 'gone'}", ["Alien (1979)"]) == set()
+    assert remote.remote_exists_many("nas:/srv", []) == set()
+
+
+def test_ffprobe_meta_bundles_keep_input_order(tmp_path: Path, monkeypatch) -> None:
+    files = [tmp_path / f"title_t{i:02d}.mkv" for i in range(5)]
+    monkeypatch.setattr(legacy, "ffprobe_meta_bundle", lambda f: (f.stem, int(f.stem[-2:]), 0))
+
+    monkeypatch.setenv("RIP_AND_ENCODE_PROBE_WORKERS", "3")
+    assert [b[1] for b in media_probe.ffprobe_meta_bundles(files)] == [0, 1, 2, 3, 4]
+    monkeypatch.setenv("RIP_AND_ENCODE_PROBE_WORKERS", "bogus")
+    assert legacy._probe_worker_count(20) == 8
+    assert legacy._probe_worker_count(2) == 2
+
+
+def test_ffprobe_meta_bundles_reuse_disc_sidecar_cache(tmp_path: Path, monkeypatch) -> None:
+    files = [tmp_path / "title_t00.mkv", tmp_path / "title_t01.mkv", tmp_path / "broken.mkv"]
+    for f in files:
+        f.write_bytes(b"x")
+    probed: list[str] = []
+
+    def _bundle(f: Path) -> tuple[str, int, int]:
+        probed.append(f.name)
+        return ("", 0, 0) if f.name == "broken.mkv" else (f.stem, 60, 3)
+
+    monkeypatch.setattr(legacy, "ffprobe_meta_bundle", _bundle)
+    monkeypatch.setenv("RIP_AND_ENCODE_PROBE_WORKERS", "1")
+
+    first = media_probe.ffprobe_meta_bundles(files, cache_dir=tmp_path)
+    assert first == [("title_t00", 60, 3), ("title_t01", 60, 3), ("", 0, 0)]
+    assert (tmp_path / legacy.FFPROBE_CACHE_NAME).exists()
+
+    files[1].write_bytes(b"changed")
+    probed.clear()
+    assert media_probe.ffprobe_meta_bundles(files, cache_dir=tmp_path) == first
+    assert probed == ["title_t01.mkv", "broken.mkv"]
+
+
+def test_find_mkvs_in_dir_walks_subfolders_but_not_symlinked_dirs(tmp_path: Path) -> None:
+    disc = tmp_path / "Disc01"
+    (disc / "sub").mkdir(parents=True)
+    (disc / "title_t01.mkv").write_bytes(b"x")
+    (disc / "sub" / "title_t00.mkv").write_bytes(b"x")
+    (disc / "notes.mkv.txt").write_bytes(b"x")
+    (disc / "folder.mkv").mkdir()
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "stray.mkv").write_bytes(b"x")
+    (disc / "link").symlink_to(outside, target_is_directory=True)
+
+    assert find_mkvs_in_dir(disc) == [disc / "sub" / "title_t00.mkv", disc / "title_t01.mkv"]
+    assert find_mkvs_in_dir(tmp_path / "missing") == []
+
+
+def test_batched_exists_matches_path_exists(tmp_path: Path) -> None:
+    season = tmp_path / "Season 01"
+    season.mkdir()
+    (season / "ep1.mp4").write_bytes(b"x")
+    (season / "dangling.mp4").symlink_to(tmp_path / "gone.mp4")
+    paths = [season / "ep1.mp4", season / "ep2.mp4", season / "dangling.mp4", tmp_path / "missing" / "ep1.mp4"]
+
+    assert legacy._batched_exists(paths) == [p.exists() for p in paths] == [True, False, False, False]
+    assert legacy._manifest_outputs_complete({"items": [{"output": str(paths[0])}]})
+    assert not legacy._manifest_outputs_complete({"items": [{"output": str(p)} for p in paths[:2]]})
+
+
+def test_makemkv_progress_parses_prgv_and_hides_prgc_lines(tmp_path: Path, monkeypatch, capsys) -> None:
+    class _Proc:
+        stdout = iter(["PRGC:5018,0,\"Saving\"\n", "PRGV:250,1000,65536\n", "PRGV:bad\n", "MSG:5011,0,1,\"Done\"\n"])
+
+        def wait(self) -> int:
+            return 0
+
+    monkeypatch.setattr(legacy.subprocess, "Popen", lambda *_a, **_kw: _Proc())
+
+    legacy.run_makemkv_with_progress_to_dir(tmp_path / "Disc01")
+
+    out = capsys.readouterr().out
+    assert "\rMakeMKV progress:  25.0%" in out
+    assert "PRGC" not in out and "PRGV" not in out
+    assert 'MSG:5011,0,1,"Done"' in out
+
+
+def test_series_next_episode_number_follows_highest_existing_episode(tmp_path: Path) -> None:
+    season = tmp_path / "Season 01"
+    assert series_mod.series_next_episode_number(season) == 1
+
+    season.mkdir()
+    assert series_mod.series_next_episode_number(season) == 1
+    for name in ("Show - S01E02 - B.mp4", "Show - S01E09 - I.mp4", "extras", "Show - S01E03 - C.en.srt"):
+        (season / name).touch()
+    assert series_mod.series_next_episode_number(season) == 10
+
+
+def test_disc_manifest_is_written_compact_and_reads_back(tmp_path: Path, monkeypatch) -> None:
+    manifest = {
+        "version": legacy.DISC_MANIFEST_VERSION,
+        "kind": "movie_multi",
+        "items": [{"source_title_index": 0, "output": str(tmp_path / "a.mp4"), "state": "pending"}],
+    }
+    monkeypatch.delenv("RIP_AND_ENCODE_MANIFEST_PRETTY", raising=False)
+
+    manifest_mod._write_disc_manifest(tmp_path, manifest)
+    raw = (tmp_path / legacy.DISC_MANIFEST_NAME).read_text(encoding="utf-8")
+    assert "\n" not in raw.rstrip("\n") and ", " not in raw
+    assert manifest_mod._load_disc_manifest(tmp_path)["items"][0]["output"] == str(tmp_path / "a.mp4")
+
+    monkeypatch.setenv("RIP_AND_ENCODE_MANIFEST_PRETTY", "1")
+    manifest_mod._write_disc_manifest(tmp_path, manifest)
+    assert (tmp_path / legacy.DISC_MANIFEST_NAME).read_text(encoding="utf-8").startswith("{\n  ")
+
+
+def test_movie_disc_outputs_exist_sees_extras_added_after_first_check(tmp_path: Path) -> None:
+    extras = tmp_path / "Extras"
+    extras.mkdir()
+    ctx = SimpleNamespace(output_movie_main=None, output_extras_dir=extras)
+
+    assert not legacy._movie_disc_outputs_exist(ctx, 2, "mkv")
+    (extras / "Disc02_Making Of.mkv").write_bytes(b"x")
+    (extras / "Disc03_Trailer.mp4").write_bytes(b"x")
+    # Directory mtimes can be coarse; make sure the listing key moves on.
+    st = extras.stat()
+    legacy.os.utime(extras, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert legacy._movie_disc_outputs_exist(ctx, 2, "mkv")
+    assert not legacy._movie_disc_outputs_exist(ctx, 3, "mkv")
+    assert not legacy._movie_disc_outputs_exist(SimpleNamespace(output_extras_dir=tmp_path / "missing"), 2, "mkv")
+
+
+def test_log_tee_copies_python_and_child_output_to_the_log(tmp_path: Path) -> None:
+    log = tmp_path / "rip_and_encode_test.log"
+    script = (
+        "import subprocess, sys\n"
+        f"sys.path.insert(0, {str(Path(__file__).resolve().parents[1])!r})\n"
+        "import archive_helper_core._legacy_rip_and_encode_server as legacy\n"
+        "from pathlib import Path\n"
+        f"assert legacy._start_log_tee(Path({str(log)!r})) is not None\n"
+        "print('from python')\n"
+        "print('from stderr', file=sys.stderr)\n"
+        "subprocess.run([sys.executable, '-c', 'print(\"from child\")'])\n"
+    )
+    cp = subprocess.run([sys.executable, "-c", script], stdout=subprocess.PIPE, text=True, timeout=30)
+
+    assert cp.returncode == 0
+    assert "from python" in cp.stdout and "from child" in cp.stdout
+    assert log.read_text(encoding="utf-8").splitlines() == ["from python", "from stderr", "from child"]
+
+
+def test_disc_hints_ignore_an_empty_lsdvd_disc_title() -> None:
+    lsdvd = "Disc Title:\nTitle: 01, Length: 01:52:10.000\n"
+    assert list(legacy._iter_disc_hints(blkid="", iso="", lsdvd=lsdvd, mkv_info="")) == []
+
+    lsdvd = "Disc Title: ALIEN_1979\r\nTitle: 01, Length: 01:52:10.000\n"
+    assert list(legacy._iter_disc_hints(blkid="", iso="", lsdvd=lsdvd, mkv_info="")) == ["ALIEN_1979"]